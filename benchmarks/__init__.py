@@ -0,0 +1,6 @@
+"""
+This module provides micro-benchmarks for the hot paths of the package,
+runnable locally with results emitted as JSON
+"""
+
+from .runner import Benchmark, compare, run
@@ -0,0 +1,153 @@
+"""
+This module provides micro-benchmarks for the geometry module, run with
+"python -m fishpy.benchmarks.geometry"
+"""
+
+import argparse
+import json
+import sys
+from random import Random
+from typing import Callable, List, Optional
+
+from ..geometry import Circle, LatticePoint, Line, LineSegment, Point, Point2D
+from ..geometry.d2 import Triangle
+from .runner import Benchmark, compare, run
+
+SEED = 0
+SIZES = (100, 1000, 10000)
+
+
+def _point_arithmetic(size: int) -> Callable[[], object]:
+    rng = Random(SEED)
+    points = [Point(rng.random(), rng.random(), rng.random()) for _ in range(size)]
+    step = Point(1, 2, 3)
+
+    def bench():
+        return [(p + step) - step for p in points]
+    return bench
+
+
+def _point2d_arithmetic(size: int) -> Callable[[], object]:
+    rng = Random(SEED)
+    points = [Point2D(rng.random(), rng.random()) for _ in range(size)]
+    step = Point2D(1, 2)
+
+    def bench():
+        return [(p + step) * 2 for p in points]
+    return bench
+
+
+def _lattice_adjacent(size: int) -> Callable[[], object]:
+    rng = Random(SEED)
+    points = [LatticePoint(rng.randrange(size), rng.randrange(size)) for _ in range(size)]
+    lower, upper = LatticePoint(0, 0), LatticePoint(size, size)
+
+    def bench():
+        return [p.get_adjacent_points(True, lower, upper) for p in points]
+    return bench
+
+
+def _lattice_hash(size: int) -> Callable[[], object]:
+    rng = Random(SEED)
+    points = [LatticePoint(rng.randrange(size), rng.randrange(size)) for _ in range(size)]
+
+    def bench():
+        return len(set(points))
+    return bench
+
+
+def _segment_intersection(size: int) -> Callable[[], object]:
+    rng = Random(SEED)
+
+    def segment():
+        return LineSegment(Point2D(rng.uniform(0, 100), rng.uniform(0, 100)),
+                           Point2D(rng.uniform(0, 100), rng.uniform(0, 100)))
+    pairs = [(segment(), segment()) for _ in range(size)]
+
+    def bench():
+        return [a.intersection(b) for a, b in pairs]
+    return bench
+
+
+def _circle_intersection(size: int) -> Callable[[], object]:
+    rng = Random(SEED)
+
+    def circle():
+        return Circle(Point2D(rng.uniform(0, 100), rng.uniform(0, 100)), rng.uniform(1, 50))
+    pairs = [(circle(), circle()) for _ in range(size)]
+
+    def bench():
+        return [a.intersecting_points(b) for a, b in pairs]
+    return bench
+
+
+def _triangle_contains(size: int) -> Callable[[], object]:
+    rng = Random(SEED)
+    triangle = Triangle(Point2D(0, 0), Point2D(100, 10), Point2D(30, 90))
+    points = [Point2D(rng.uniform(0, 100), rng.uniform(0, 100)) for _ in range(size)]
+
+    def bench():
+        return [triangle.contains(p) for p in points]
+    return bench
+
+
+def _line_lattice_points(size: int) -> Callable[[], object]:
+    line = Line(0.5, 1.5)
+    lower, upper = LatticePoint(-size, -size), LatticePoint(size, size)
+
+    def bench():
+        return line.lattice_points_along(lower, upper)
+    return bench
+
+
+BENCHMARKS: List[Benchmark] = [
+    Benchmark('point_arithmetic', _point_arithmetic),
+    Benchmark('point2d_arithmetic', _point2d_arithmetic),
+    Benchmark('lattice_adjacent_points', _lattice_adjacent),
+    Benchmark('lattice_hash', _lattice_hash),
+    Benchmark('segment_intersection', _segment_intersection),
+    Benchmark('circle_intersecting_points', _circle_intersection),
+    Benchmark('triangle_contains', _triangle_contains),
+    Benchmark('line_lattice_points_along', _line_lattice_points),
+]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run the geometry benchmarks, writing the results as JSON and returning a
+    non-zero exit code if any regressed against the baseline
+    """
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', type=int, nargs='+', default=SIZES,
+                        help='input sizes to run each benchmark at')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='number of timed runs, of which the best is reported')
+    parser.add_argument('--filter', dest='pattern',
+                        help='run only benchmarks whose name contains this string')
+    parser.add_argument('--output', help='file to write results to, defaults to stdout')
+    parser.add_argument('--baseline', help='file of saved results to compare against')
+    parser.add_argument('--tolerance', type=float, default=0.1,
+                        help='fractional slowdown allowed before reporting a regression')
+    args = parser.parse_args(argv)
+
+    results = run(BENCHMARKS, args.sizes, args.repeat, pattern=args.pattern)
+    if args.output is None:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+    else:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(results, file, indent=2)
+
+    if args.baseline is None:
+        return 0
+    with open(args.baseline, 'r', encoding='utf-8') as file:
+        baseline = json.load(file)
+    regressions = compare(results, baseline, args.tolerance)
+    for regression in regressions:
+        print(f'Regression: {regression}', file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,61 @@
+"""
+This module provides functions for timing registered benchmarks and comparing
+their results against a saved baseline
+"""
+
+import timeit
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional
+
+
+class Benchmark(NamedTuple):
+    """
+    A named benchmark, whose setup function takes an input size and returns
+    the zero-argument callable to be timed
+    """
+
+    name: str
+    setup: Callable[[int], Callable[[], object]]
+
+
+def run(benchmarks: Iterable[Benchmark], sizes: Iterable[int], repeat: int = 5,
+        number: int = 1, pattern: Optional[str] = None) -> Dict[str, Dict[str, float]]:
+    """
+    Time each benchmark at each input size, returning a mapping of
+    "name[size]" to the best and mean time per call in seconds
+
+    pattern optionally restricts the run to benchmarks whose name contains it
+    """
+
+    results = {}
+    for benchmark in benchmarks:
+        if pattern is not None and pattern not in benchmark.name:
+            continue
+        for size in sizes:
+            timer = timeit.Timer(benchmark.setup(size))
+            times = [t / number for t in timer.repeat(repeat, number)]
+            results[f'{benchmark.name}[{size}]'] = {
+                'best': min(times),
+                'mean': sum(times) / len(times),
+            }
+    return results
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]],
+            tolerance: float = 0.1) -> List[str]:
+    """
+    Compare results against a baseline, returning a description of each
+    benchmark whose best time regressed by more than tolerance, a fraction of
+    the baseline time
+
+    Benchmarks missing from either set of results are ignored
+    """
+
+    regressions = []
+    for key, result in results.items():
+        if key not in baseline:
+            continue
+        before, after = baseline[key]['best'], result['best']
+        if after > before * (1 + tolerance):
+            change = (after - before) / before if before else float('inf')
+            regressions.append(f'{key}: {before:.3e}s -> {after:.3e}s (+{change:.1%})')
+    return regressions
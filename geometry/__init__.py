@@ -3,9 +3,12 @@ This module provides a selection of classes pertaining to shapes and
 geometric concepts
 """
 
+from . import index
 from .d2 import ORIGIN as ORIGIN_2D
-from .d2 import (Circle, Corner, Direction, Ellipse, LatticePoint, Line,
-                 LineSegment, Point2D, Rectangle, Square, Vector2D, triangle)
+from .d2 import (Circle, Corner, Direction, Ellipse, FrozenLatticePoint,
+                 FrozenPoint2D, LatticePoint, Line, LineSegment, Point2D,
+                 Polygon, Rectangle, Square, Vector2D, triangle)
 from .d3 import ORIGIN as ORIGIN_3D
-from .d3 import Cuboid, Point3D
-from .point import Point
+from .d3 import Cuboid, FrozenPoint3D, Point3D
+from .point import FrozenPoint, Point
+from .pointarray import PointArray
@@ -6,11 +6,16 @@ geometric concepts in 2 dimensions
 from .circle import Circle
 from .corner import Corner
 from .ellipse import Ellipse
-from .lattice import LatticePoint
+from .intersections import (circle_intersections, segment_intersections,
+                            segment_pair_intersections)
+from .lattice import FrozenLatticePoint, LatticePoint
 from .line import Line
 from .linesegment import LineSegment
-from .point2d import ORIGIN, Point2D
+from .point2d import ORIGIN, FrozenPoint2D, Point2D
+from .polygon import Polygon
 from .rectangle import Rectangle
 from .square import Square
+from .transform import Transform2D
 from .triangle import Triangle
+from .union import union_area
 from .vector2d import Direction, Vector2D
@@ -1,11 +1,13 @@
 """This module provides a class for storing and evaluating circles"""
 
 from functools import cached_property
-from math import pi
+from math import hypot, pi
 from typing import Optional, Tuple
 
+import numpy as np
+
+from ..pointarray import Points, as_coords
 from .point2d import Point2D
-from .vector2d import Vector2D
 
 
 class Circle:
@@ -36,6 +38,12 @@ class Circle:
     def __contains__(self, pt: Point2D) -> bool:
         return self.center.euclidean_distance(pt) <= self.radius
 
+    def contains_many(self, points: Points) -> np.ndarray:
+        """Returns a boolean mask of which of many points lie within self"""
+        coords = as_coords(points)
+        dx, dy = coords[:, 0] - self.center.x, coords[:, 1] - self.center.y
+        return dx*dx + dy*dy <= self.radius**2
+
     def intersects(self, other: 'Circle') -> bool:
         """Predicate function which returns whether two circles have intersections"""
 
@@ -61,7 +69,7 @@ class Circle:
         if not self.intersects(other):
             return None
 
-        d = Vector2D.from_point(self.center - other.center).magnitude()
+        d = hypot(self.center.x - other.center.x, self.center.y - other.center.y)
         a = (self.radius**2-other.radius**2+d**2)/(2*d)
         h = (self.radius**2-a**2)**0.5
 
@@ -1,9 +1,11 @@
 """This module provides a class for storing and evaluating ellipses"""
 
 from functools import cached_property
-from math import cos, radians, sin
-from typing import List
+from typing import List, Tuple
 
+import numpy as np
+
+from ..pointarray import Points, as_coords
 from .circle import Circle
 from .corner import Corner
 from .linesegment import LineSegment
@@ -14,36 +16,101 @@ class Ellipse:
     """This class stores and provides methods for evaluating ellipses"""
 
     def __init__(self, focus1: Point2D, focus2: Point2D, point_on_ellipse: Point2D):
-        self.focus1 = focus1
-        self.focus2 = focus2
+        self._focus1 = focus1
+        self._focus2 = focus2
         a = focus1.euclidean_distance(point_on_ellipse)
         b = focus2.euclidean_distance(point_on_ellipse)
-        f = (focus2 - focus1).magnitude()
-        self.minor_axis = ((a+b)**2 - f**2)**0.5
         self.major_axis = a+b
 
-        c = (focus1, focus2) if focus1.x < focus2.x else (focus2, focus1)
-        self.angle = Corner(c[0], c[1], c[0]+Point2D(1, 0)).get_angle()
-
     def __repr__(self) -> str:
         return f'{self.__class__.__name__}(f1={self.focus1},f2={self.focus2})'
 
+    @property
+    def focus1(self) -> Point2D:
+        """This property works as a getter for the first focus"""
+        return self._focus1
+
+    @focus1.setter
+    def focus1(self, focus1: Point2D):
+        """Set the first focus of the ellipse, invalidating caches which depend on it"""
+        self._invalidate_caches()
+        self._focus1 = focus1
+
+    @property
+    def focus2(self) -> Point2D:
+        """This property works as a getter for the second focus"""
+        return self._focus2
+
+    @focus2.setter
+    def focus2(self, focus2: Point2D):
+        """Set the second focus of the ellipse, invalidating caches which depend on it"""
+        self._invalidate_caches()
+        self._focus2 = focus2
+
+    @property
+    def major_axis(self) -> float:
+        """This property works as a getter for the length of the major axis"""
+        return self._major_axis
+
+    @major_axis.setter
+    def major_axis(self, major_axis: float):
+        """
+        Set the length of the major axis of the ellipse, invalidating caches
+        which depend on it
+        """
+        self._invalidate_caches()
+        self._major_axis = major_axis
+
+    def _invalidate_caches(self) -> None:
+        for cache in ('center', 'minor_axis', 'angle', '_coefficients'):
+            try:
+                delattr(self, cache)
+            except AttributeError:
+                pass
+
     @cached_property
     def center(self) -> Point2D:
+        """Find the center of the ellipse"""
+        return self.focus1.midpoint(self.focus2)
+
+    @cached_property
+    def minor_axis(self) -> float:
+        """This property calculates the length of the minor axis of the ellipse"""
+        return (self.major_axis**2 - (self.focus2 - self.focus1).magnitude()**2)**0.5
+
+    @cached_property
+    def angle(self) -> float:
+        """This property calculates the angle of the major axis, in degrees"""
+        c = (self.focus1, self.focus2) if self.focus1.x < self.focus2.x \
+            else (self.focus2, self.focus1)
+        return Corner(c[0], c[1], c[0]+Point2D(1, 0)).get_angle()
+
+    @cached_property
+    def _coefficients(self) -> Tuple[float, float, float, float, float, float]:
         """
-        Find the center of the ellipse, cache must be invalidated if
-        one of the focus points is updated
+        The center, the cosine and sine of the rotation of the major axis and
+        the inverse squares of the semi-axes
         """
-        return self.focus1.midpoint(self.focus2)
+
+        direction = self.focus2 - self.focus1
+        length = direction.magnitude()
+        cos_, sin_ = (direction.x/length, direction.y/length) if length else (1, 0)
+        return (self.center.x, self.center.y, cos_, sin_,
+                4 / self.major_axis**2, 4 / self.minor_axis**2)
 
     def __contains__(self, pt: Point2D) -> bool:
-        c: Point2D = self.center()
-        angle = radians(self.angle)
-        t1 = (cos(angle)*(pt.x-c.x) + sin(angle) *
-              (pt.y-c.y))**2 / (self.major_axis/2)**2
-        t2 = (sin(angle)*(pt.x-c.x) - cos(angle) *
-              (pt.y-c.y))**2 / (self.minor_axis/2)**2
-        return t1 + t2 <= 1
+        cx, cy, cos_, sin_, inv_a2, inv_b2 = self._coefficients
+        dx, dy = pt.x-cx, pt.y-cy
+        u, v = cos_*dx + sin_*dy, sin_*dx - cos_*dy
+        return u*u*inv_a2 + v*v*inv_b2 <= 1
+
+    def contains_many(self, points: Points) -> np.ndarray:
+        """Returns a boolean mask of which of many points lie within self"""
+        cx, cy, cos_, sin_, inv_a2, inv_b2 = self._coefficients
+        coords = as_coords(points)
+        dx, dy = coords[:, 0] - cx, coords[:, 1] - cy
+        u, v = cos_*dx + sin_*dy, sin_*dx - cos_*dy
+        return u*u*inv_a2 + v*v*inv_b2 <= 1
 
     # Construction of tangent lines from a Point2D outside of an ellipse:
     #  http://www.nabla.hr/Z_MemoHU-029.htm
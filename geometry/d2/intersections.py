@@ -0,0 +1,290 @@
+"""
+This module provides functions for finding the intersections within large
+collections of shapes on the x-y plane
+"""
+
+from fractions import Fraction
+from heapq import heappop, heappush
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
+
+import numpy as np
+
+from .circle import Circle
+from .linesegment import LineSegment
+from .point2d import Point2D
+
+_Point = Tuple[Fraction, Fraction]
+Segments = Union[np.ndarray, Sequence[LineSegment]]
+Circles = Union[np.ndarray, Sequence[Circle]]
+
+# The number of candidate pairs compared at once by circle_intersections
+CHUNK_SIZE = 1 << 20
+
+
+class _SweepSegment:
+    """A segment with exact endpoints, ordered from the lowest (x, y) to the highest"""
+
+    __slots__ = ('index', 'segment', 'start', 'end', 'slope')
+
+    def __init__(self, index: int, segment: LineSegment):
+        p1 = (Fraction(segment.p1.x), Fraction(segment.p1.y))
+        p2 = (Fraction(segment.p2.x), Fraction(segment.p2.y))
+        self.index = index
+        self.segment = segment
+        self.start, self.end = min(p1, p2), max(p1, p2)
+        run = self.end[0] - self.start[0]
+        self.slope = (self.end[1] - self.start[1]) / run if run else None
+
+    def y_at(self, event: _Point) -> Fraction:
+        """
+        Returns the y-value of self where it crosses the sweep line at event,
+        clamped to event for vertical segments
+        """
+
+        if self.slope is None:
+            return min(max(event[1], self.start[1]), self.end[1])
+        return self.start[1] + (event[0] - self.start[0]) * self.slope
+
+    def sort_key(self) -> Tuple[int, Fraction]:
+        """Key ordering segments which share a point by their order beyond it"""
+        return (1, Fraction(0)) if self.slope is None else (0, self.slope)
+
+
+def _cross(o: _Point, a: _Point, b: _Point) -> Fraction:
+    return (a[0]-o[0])*(b[1]-o[1]) - (a[1]-o[1])*(b[0]-o[0])
+
+
+def _crossing(a: _SweepSegment, b: _SweepSegment) -> Optional[_Point]:
+    """Returns the single point at which two segments cross, if there is one"""
+
+    r = (a.end[0]-a.start[0], a.end[1]-a.start[1])
+    s = (b.end[0]-b.start[0], b.end[1]-b.start[1])
+    denominator = r[0]*s[1] - r[1]*s[0]
+    if denominator == 0:
+        return None
+    t = _cross(a.start, b.start, b.end) / denominator
+    u = _cross(a.start, b.start, a.end) / denominator
+    if not (0 <= t <= 1 and 0 <= u <= 1):
+        return None
+    return a.start[0] + t*r[0], a.start[1] + t*r[1]
+
+
+def _containing(status: List[_SweepSegment], event: _Point) -> Tuple[int, int]:
+    """Returns the contiguous run of the status which contains the event"""
+
+    lo, hi = 0, len(status)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if status[mid].y_at(event) < event[1]:
+            lo = mid + 1
+        else:
+            hi = mid
+    hi = lo
+    while hi < len(status) and status[hi].y_at(event) == event[1]:
+        hi += 1
+    return lo, hi
+
+
+def _to_point(point: _Point) -> Point2D:
+    x, y = point
+    return Point2D(int(x) if x.denominator == 1 else float(x),
+                   int(y) if y.denominator == 1 else float(y))
+
+
+def segment_intersections(segments: Iterable[LineSegment]
+                          ) -> List[Tuple[LineSegment, LineSegment, Point2D]]:
+    """
+    Returns every pair of segments which share a point along with the point
+    at which they meet, found with a Bentley-Ottmann sweep in O((n+k) log n)
+
+    Endpoints are included, so segments which touch are reported, and pairs of
+    overlapping collinear segments are reported once at their first shared
+    point. Arithmetic is exact, the segments of each pair are in input order
+    and pairs are ordered by the (x, y) position of their point
+    """
+
+    # pylint: disable=too-many-locals
+    sweep = [_SweepSegment(i, segment) for i, segment in enumerate(segments)]
+    starts: Dict[_Point, List[_SweepSegment]] = {}
+    queue: List[_Point] = []
+    scheduled: Set[_Point] = set()
+
+    def schedule(point: _Point) -> None:
+        if point not in scheduled:
+            scheduled.add(point)
+            heappush(queue, point)
+
+    for seg in sweep:
+        starts.setdefault(seg.start, []).append(seg)
+        schedule(seg.start)
+        schedule(seg.end)
+
+    def check(below: _SweepSegment, above: _SweepSegment, event: _Point) -> None:
+        point = _crossing(below, above)
+        if point is not None and point > event:
+            schedule(point)
+
+    status: List[_SweepSegment] = []
+    reported: Set[Tuple[int, int]] = set()
+    found = []
+    while queue:
+        event = heappop(queue)
+
+        lo, hi = _containing(status, event)
+        containing = status[lo:hi]
+        starting = starts.get(event, [])
+        meeting = sorted(containing + starting, key=lambda seg: seg.index)
+        for i, a in enumerate(meeting):
+            for b in meeting[i+1:]:
+                if (a.index, b.index) not in reported:
+                    reported.add((a.index, b.index))
+                    found.append((a.segment, b.segment, _to_point(event)))
+
+        # Replace the segments through the event with those continuing past
+        # it, reversing the order of those which cross at the event
+        continuing = [seg for seg in containing if seg.end != event] + starting
+        continuing.sort(key=_SweepSegment.sort_key)
+        status[lo:hi] = continuing
+
+        if not continuing:
+            if 0 < lo < len(status):
+                check(status[lo-1], status[lo], event)
+            continue
+        if lo > 0:
+            check(status[lo-1], status[lo], event)
+        top = lo + len(continuing)
+        if top < len(status):
+            check(status[top-1], status[top], event)
+    return found
+
+
+def _segment_array(segments: Segments) -> np.ndarray:
+    if isinstance(segments, np.ndarray):
+        array = segments.astype(float).reshape(len(segments), 4)
+    else:
+        array = np.array([(seg.p1.x, seg.p1.y, seg.p2.x, seg.p2.y) for seg in segments],
+                         dtype=float).reshape(len(segments), 4)
+    return array
+
+
+def _crosses(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Vectorized LineSegment.intersects over the rows of two (N, 4) segment arrays"""
+
+    def ccw(p: np.ndarray, q: np.ndarray, r: np.ndarray) -> np.ndarray:
+        return (r[:, 1]-p[:, 1])*(q[:, 0]-p[:, 0]) > (q[:, 1]-p[:, 1])*(r[:, 0]-p[:, 0])
+
+    p1, p2, q1, q2 = a[:, :2], a[:, 2:], b[:, :2], b[:, 2:]
+    return (ccw(p1, q1, q2) != ccw(p2, q1, q2)) & (ccw(p1, p2, q1) != ccw(p1, p2, q2))
+
+
+def segment_pair_intersections(first: Segments, second: Segments, *,
+                               include_endpoints: bool = False
+                               ) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find the intersection of each segment in first with the corresponding
+    segment in second in a single vectorized pass
+
+    Segments may be given as sequences of LineSegments or as arrays of shape
+    (N, 2, 2) or (N, 4) holding the endpoints of each segment. Returns a
+    boolean mask of the pairs which intersect, and an (N, 2) array of their
+    intersection points, which is NaN where there is no single intersection
+    point, such as for parallel segments
+
+    Pairs are tested with the same orientation tests as
+    LineSegment.intersects, unless include_endpoints is set, when every pair
+    which meets, including at an endpoint, intersects
+    """
+
+    a, b = _segment_array(first), _segment_array(second)
+    if a.shape != b.shape:
+        raise ValueError('Segment pairs require the same number of segments in each collection')
+
+    start, r = a[:, :2], a[:, 2:] - a[:, :2]
+    s, offset = b[:, 2:] - b[:, :2], b[:, :2] - a[:, :2]
+    denominator = r[:, 0]*s[:, 1] - r[:, 1]*s[:, 0]
+    parallel = denominator == 0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t = (offset[:, 0]*s[:, 1] - offset[:, 1]*s[:, 0]) / denominator
+        u = (offset[:, 0]*r[:, 1] - offset[:, 1]*r[:, 0]) / denominator
+    if include_endpoints:
+        mask = ~parallel & (t >= 0) & (t <= 1) & (u >= 0) & (u <= 1)
+    else:
+        mask = ~parallel & _crosses(a, b)
+    points = np.full(a[:, :2].shape, np.nan)
+    points[mask] = start[mask] + t[mask, np.newaxis]*r[mask]
+    return mask, points
+
+
+def _candidate_pairs(left: np.ndarray, right: np.ndarray) -> Iterable[Tuple[np.ndarray,
+                                                                           np.ndarray]]:
+    """
+    Yield chunks of the pairs of indices i < j whose x-extents overlap, found
+    by sorting the extents by their left ends and sweeping in O(n log n + k)
+    """
+    # pylint: disable=too-many-locals
+
+    order = np.argsort(left, kind='stable')
+    lows, highs = left[order], right[order]
+    ends = np.searchsorted(lows, highs, side='right')
+    counts = np.maximum(ends - np.arange(len(order)) - 1, 0)
+    totals = np.cumsum(counts)
+    start = 0
+    while start < len(order):
+        base = totals[start-1] if start else 0
+        stop = max(int(np.searchsorted(totals, base + CHUNK_SIZE, side='right')), start+1)
+        firsts = np.repeat(np.arange(start, stop), counts[start:stop])
+        offsets = np.arange(len(firsts)) - np.repeat(totals[start:stop] - counts[start:stop]
+                                                     - base, counts[start:stop])
+        seconds = firsts + 1 + offsets
+        a, b = order[firsts], order[seconds]
+        yield np.minimum(a, b), np.maximum(a, b)
+        start = stop
+
+
+def circle_intersections(circles: Circles, radii: Optional[np.ndarray] = None
+                         ) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find the intersection points of every pair of circles which cross or touch
+
+    Circles may be given as a sequence of Circles, or as an (N, 2) array of
+    centers along with an array of N radii. Candidate pairs are found with a
+    sweep over the sorted x-extents of the circles, and are then checked in
+    vectorized chunks. Returns a (K, 2) array of the indices i < j of each
+    intersecting pair and a (K, 2, 2) array of their two intersection points,
+    which are equal for circles which touch. Identical circles are skipped, as
+    they share every point
+    """
+    # pylint: disable=too-many-locals
+
+    if radii is None:
+        centers = np.array([(c.center.x, c.center.y) for c in circles], dtype=float)
+        radii = np.array([c.radius for c in circles], dtype=float)
+    else:
+        centers, radii = np.asarray(circles, dtype=float), np.asarray(radii, dtype=float)
+    centers = centers.reshape(len(radii), 2)
+    x, y = centers[:, 0], centers[:, 1]
+
+    found_pairs, found_points = [], []
+    for first, second in _candidate_pairs(x - radii, x + radii):
+        dx, dy = x[second] - x[first], y[second] - y[first]
+        r1, r2 = radii[first], radii[second]
+        squared = dx*dx + dy*dy
+        mask = (squared <= (r1+r2)**2) & (squared >= (r1-r2)**2) & (squared > 0)
+        first, second, dx, dy = first[mask], second[mask], dx[mask], dy[mask]
+        r1, r2, squared = r1[mask], r2[mask], squared[mask]
+
+        distance = np.sqrt(squared)
+        along = (r1*r1 - r2*r2 + squared) / (2*distance)
+        across = np.sqrt(np.maximum(r1*r1 - along*along, 0)) / distance
+        mx, my = x[first] + dx*along/distance, y[first] + dy*along/distance
+        points = np.empty((len(first), 2, 2))
+        points[:, 0, 0], points[:, 0, 1] = mx + dy*across, my - dx*across
+        points[:, 1, 0], points[:, 1, 1] = mx - dy*across, my + dx*across
+        found_pairs.append(np.stack((first, second), axis=1))
+        found_points.append(points)
+
+    if not found_pairs:
+        return np.empty((0, 2), dtype=int), np.empty((0, 2, 2))
+    pairs, points = np.concatenate(found_pairs), np.concatenate(found_points)
+    order = np.lexsort((pairs[:, 1], pairs[:, 0]))
+    return pairs[order], points[order]
@@ -1,16 +1,32 @@
 """This module provides a class for storing points on an x-y lattice plane"""
 
+from math import inf
 from random import randint
-from typing import Optional, Union
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
-from ..point import Point
-from .point2d import Point2D
+import numpy as np
+
+from .point2d import FrozenPoint2D, Point2D
 from .vector2d import Direction
 
+# FrozenLatticePoint.interned caches points whose coordinates both lie within
+# [-INTERN_LIMIT, INTERN_LIMIT)
+INTERN_LIMIT = 512
+_INTERNED: Dict[Tuple[int, int], 'FrozenLatticePoint'] = {}
+
+# Offsets to the adjacent points of a lattice point, keyed by the number of
+# neighbours in the neighbourhood
+NEIGHBOUR_OFFSETS: Dict[int, Tuple[Tuple[int, int], ...]] = {
+    4: ((0, 1), (0, -1), (1, 0), (-1, 0)),
+    8: ((0, 1), (0, -1), (1, 0), (-1, 0), (1, 1), (-1, -1), (1, -1), (-1, 1)),
+}
+
 
 class LatticePoint(Point2D):
     """Class for storing points on an x-y lattice plane"""
 
+    __slots__ = ()
+
     def __init__(self, x: int, y: int):
         if not isinstance(x, int):
             raise TypeError('x property of LatticePoint must be of type int')
@@ -78,7 +94,8 @@ class LatticePoint(Point2D):
         return LatticePoint(abs(self.x), abs(self.y))
 
     def __hash__(self) -> int:
-        return hash(self.as_tuple())
+        coords = self._coords
+        return hash((coords[0], coords[1]))
 
     def lattice_midpoint(self, other: 'LatticePoint') -> 'LatticePoint':
         """Returns the midpoint between two points"""
@@ -95,24 +112,43 @@ class LatticePoint(Point2D):
             return -1 <= relative.x <= 1
         return False
 
+    def iter_adjacent_points(self, diagonals: bool = False,
+                             lower_bound: Optional['LatticePoint'] = None,
+                             upper_bound: Optional['LatticePoint'] = None
+                             ) -> Iterator['LatticePoint']:
+        """
+        Lazily yield the adjacent lattice points of a given point which lie
+        within a bound, lower_bound inclusive and upper_bound exclusive
+        """
+
+        x, y = self._coords[0], self._coords[1]
+        low_x, low_y = (-inf, -inf) if lower_bound is None else (lower_bound[0], lower_bound[1])
+        high_x, high_y = (inf, inf) if upper_bound is None else (upper_bound[0], upper_bound[1])
+        point_type = type(self) if isinstance(self, FrozenPoint2D) else LatticePoint
+        for dx, dy in NEIGHBOUR_OFFSETS[8 if diagonals else 4]:
+            adj_x, adj_y = x+dx, y+dy
+            if low_x <= adj_x < high_x and low_y <= adj_y < high_y:
+                yield point_type(adj_x, adj_y)
+
     def get_adjacent_points(self, diagonals: bool = False,
                             lower_bound: Optional['LatticePoint'] = None,
                             upper_bound: Optional['LatticePoint'] = None
-                            ) -> list:
+                            ) -> List['LatticePoint']:
         """Returns the adjacent lattice points of a given point"""
-
-        adj = [LatticePoint(0, 1), LatticePoint(
-            0, -1), LatticePoint(1, 0), LatticePoint(-1, 0)]
-        if diagonals:
-            adj += [LatticePoint(1, 1), LatticePoint(-1, -1),
-                    LatticePoint(1, -1), LatticePoint(-1, 1)]
-        adj = [self + p for p in adj]
-        return Point.bounded_filter(adj, lower_bound, upper_bound)
+        return list(self.iter_adjacent_points(diagonals, lower_bound, upper_bound))
 
     def copy(self) -> 'LatticePoint':
         """Returns a shallow copy of self"""
         return LatticePoint(self.x, self.y)
 
+    def freeze(self) -> 'FrozenLatticePoint':
+        """Returns an immutable copy of self"""
+        return FrozenLatticePoint(self.x, self.y)
+
+    def intern(self) -> 'FrozenLatticePoint':
+        """Returns the shared immutable point with the same values as self"""
+        return FrozenLatticePoint.interned(self.x, self.y)
+
     def up(self) -> 'LatticePoint':
         """Returns the point one above self"""
         return self + Direction.UP
@@ -140,6 +176,23 @@ class LatticePoint(Point2D):
         return LatticePoint(randint(lower_bound.x, upper_bound.x),
                             randint(lower_bound.y, upper_bound.y))
 
+    @classmethod
+    def random_many(cls, n: int, lower_bound: 'LatticePoint', upper_bound: 'LatticePoint',
+                    seed: Optional[Union[int, np.random.Generator]] = None
+                    ) -> List['LatticePoint']:
+        """
+        Returns n random points which lie in the rectangle between two bounds,
+        drawn in a single vectorized call
+
+        lower_bound is inclusive
+        upper_bound is exclusive
+        """
+
+        coords = np.random.default_rng(seed).integers((lower_bound.x, lower_bound.y),
+                                                      (upper_bound.x, upper_bound.y),
+                                                      size=(n, 2))
+        return [cls(x, y) for x, y in coords.tolist()]
+
     @staticmethod
     def round(point: Point2D) -> 'LatticePoint':
         """Returns the point rounded to the nearest integer value"""
@@ -156,3 +209,67 @@ class LatticePoint(Point2D):
         confines of the lattice
         """
         return Point2D(self.x, self.y)
+
+
+class FrozenLatticePoint(FrozenPoint2D, LatticePoint):
+    """
+    Immutable, tuple-backed variant of LatticePoint with fixed-arity
+    arithmetic, suitable for use as a dictionary key in grid searches
+    """
+
+    __slots__ = ()
+
+    def __init__(self, x: int, y: int):  # pylint: disable=super-init-not-called
+        if not isinstance(x, int):
+            raise TypeError('x property of LatticePoint must be of type int')
+        if not isinstance(y, int):
+            raise TypeError('y property of LatticePoint must be of type int')
+        self._coords = (x, y)
+
+    def thaw(self) -> LatticePoint:
+        """Returns a mutable copy of self"""
+        return LatticePoint(*self._coords)
+
+    def intern(self) -> 'FrozenLatticePoint':
+        """Returns the shared immutable point with the same values as self"""
+        return FrozenLatticePoint.interned(*self._coords)
+
+    @staticmethod
+    def interned(x: int, y: int) -> 'FrozenLatticePoint':
+        """
+        Returns a shared FrozenLatticePoint for the given coordinates, so that
+        repeated lookups of small coordinates allocate no new points
+
+        Only points with both coordinates in [-INTERN_LIMIT, INTERN_LIMIT) are
+        cached, larger points are created afresh
+        """
+
+        pt = _INTERNED.get((x, y))
+        if pt is None:
+            pt = FrozenLatticePoint(x, y)
+            if -INTERN_LIMIT <= x < INTERN_LIMIT and -INTERN_LIMIT <= y < INTERN_LIMIT:
+                _INTERNED[x, y] = pt
+        return pt
+
+    def __sub__(self, other: 'LatticePoint') -> 'FrozenLatticePoint':
+        s, o = self._coords, other._coords
+        return type(self)(s[0]-o[0], s[1]-o[1])
+
+    def __truediv__(self, scalar: int) -> FrozenPoint2D:
+        return self.liberate() / scalar
+
+    def __floordiv__(self, divisor: Union['LatticePoint', int]) -> 'FrozenLatticePoint':
+        if isinstance(divisor, int):
+            return super().__floordiv__(divisor)
+        if isinstance(divisor, LatticePoint):
+            s, o = self._coords, divisor._coords
+            return type(self)(s[0] // o[0], s[1] // o[1])
+        raise TypeError(f'{self.__class__.__name__} division with '
+                        f'{divisor.__class__.__name__} not supported')
+
+    def liberate(self) -> FrozenPoint2D:
+        """
+        Returns a FrozenPoint2D with the same values as self, liberated from
+        the confines of the lattice
+        """
+        return FrozenPoint2D(self.x, self.y)
@@ -1,12 +1,17 @@
 """This module provides a class for storing and evaluating lines"""
 
+from fractions import Fraction
 from math import isclose
-from typing import Optional, Set
+from typing import Iterator, Optional, Set, Tuple
 
 from .lattice import LatticePoint
-from .linesegment import LineSegment
+from .linesegment import LineSegment, lattice_steps
 from .point2d import Point2D
 
+# Float slopes and intercepts are treated as the nearest fraction with at most
+# this denominator when finding lattice points
+MAX_DENOMINATOR = 10**6
+
 
 class Line:
     """Class for storing and evaluating lines"""
@@ -49,25 +54,43 @@ class Line:
         """Returns the y-value of self at x-value"""
         return self.slope * x + self.y_int
 
+    def _lattice_steps(self, lower_bound: Point2D,
+                       upper_bound: Point2D) -> Tuple[int, int, int, int, int]:
+        lower = (Fraction(lower_bound.x), Fraction(lower_bound.y))
+        upper = (Fraction(upper_bound.x), Fraction(upper_bound.y))
+        if self.vertical:
+            x_int = Fraction(self.x_int).limit_denominator(MAX_DENOMINATOR)
+            return lattice_steps(Fraction(1), Fraction(0), x_int, lower, upper)
+        slope = Fraction(self.slope).limit_denominator(MAX_DENOMINATOR)
+        y_int = Fraction(self.y_int).limit_denominator(MAX_DENOMINATOR)
+        return lattice_steps(-slope, Fraction(1), y_int, lower, upper)
+
+    def iter_lattice_points(self, lower_bound: Point2D,
+                            upper_bound: Point2D) -> Iterator[LatticePoint]:
+        """
+        Lazily yield the lattice points lying on self within the rectangle
+        created by lower_bound and upper_bound, inclusive, in order of x
+
+        The points are found exactly, with a float slope or intercept treated
+        as the nearest fraction whose denominator is at most MAX_DENOMINATOR
+        """
+        x, y, dx, dy, count = self._lattice_steps(lower_bound, upper_bound)
+        for k in range(count):
+            yield LatticePoint(x + k*dx, y + k*dy)
+
+    def count_lattice_points(self, lower_bound: Point2D, upper_bound: Point2D) -> int:
+        """
+        Returns the number of lattice points lying on self within the
+        rectangle created by lower_bound and upper_bound, in O(1)
+        """
+        return self._lattice_steps(lower_bound, upper_bound)[4]
+
     def lattice_points_along(self, lower_bound: Point2D, upper_bound: Point2D) -> Set[LatticePoint]:
         """
         Find all lattice points lying within the rectangle created by
         lower_bound and upper_bound
         """
-
-        points = set()
-        if self.vertical and lower_bound.x <= self.x_int <= upper_bound.x:
-            for y in range(lower_bound.y, upper_bound.y+1):
-                points.add(LatticePoint(self.x_int, y))
-            return points
-
-        for x in range(lower_bound.x, upper_bound.x+1):
-            y = self.get_y(x)
-            if (self.slope < 0 and y < lower_bound.y) or (self.slope > 0 and y > upper_bound.y):
-                break
-            if isclose(y - round(y), 0, abs_tol=10**-4) and lower_bound.y <= y <= upper_bound.y:
-                points.add(LatticePoint(x, int(y)))
-        return points
+        return set(self.iter_lattice_points(lower_bound, upper_bound))
 
     def contains_point(self, point: Point2D) -> bool:
         """Predicate function which returns whether point lies on self"""
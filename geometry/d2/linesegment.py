@@ -1,13 +1,54 @@
 """This module provides a class for storing and evaluating line segments"""
 
-from math import ceil, floor
-from typing import Optional, Set
-
-import numpy as np
+from fractions import Fraction
+from math import ceil, floor, gcd, lcm
+from typing import Iterator, Optional, Set, Tuple
 
 from .lattice import LatticePoint
 from .point2d import Point2D
 
+_Bound = Tuple[Fraction, Fraction]
+
+
+def lattice_steps(a: Fraction, b: Fraction, c: Fraction, lower_bound: _Bound,
+                  upper_bound: _Bound) -> Tuple[int, int, int, int, int]:
+    """
+    Solve a*x + b*y = c over the integers within the inclusive rectangle
+    between two bounds, returning (x, y, dx, dy, count) such that the
+    solutions are (x + k*dx, y + k*dy) for each k in range(count)
+
+    The solutions are ordered by x, or by y for vertical lines, and are found
+    exactly in O(1) using the gcd of the coefficients
+    """
+
+    scale = lcm(a.denominator, b.denominator, c.denominator)
+    a, b, c = int(a*scale), int(b*scale), int(c*scale)
+    g = gcd(a, b)
+    if g == 0 or c % g:
+        return 0, 0, 0, 0, 0
+    a, b, c = a//g, b//g, c//g
+    (x_low, y_low), (x_high, y_high) = lower_bound, upper_bound
+
+    if b == 0:
+        x = c // a
+        if not x_low <= x <= x_high:
+            return 0, 0, 0, 0, 0
+        return x, ceil(y_low), 0, 1, max(0, floor(y_high) - ceil(y_low) + 1)
+
+    # Restrict x to where y lies within its bounds
+    if a != 0:
+        x_low = max(x_low, min((c - b*y_low) / a, (c - b*y_high) / a))
+        x_high = min(x_high, max((c - b*y_low) / a, (c - b*y_high) / a))
+    elif not y_low <= Fraction(c, b) <= y_high:
+        return 0, 0, 0, 0, 0
+
+    # Solutions of a*x = c (mod |b|) are spaced |b| apart along x
+    step = abs(b)
+    x0 = c * pow(a, -1, step) % step if step > 1 else 0
+    first = ceil((x_low - x0) / step)
+    x = x0 + first*step
+    return x, (c - a*x) // b, step, -a*step // b, max(0, floor((x_high-x0) / step) - first + 1)
+
 
 class LineSegment:
     """Class for storing and evaluating line segments"""
@@ -56,28 +97,74 @@ class LineSegment:
 
     def is_parallel_to(self, other: 'LineSegment') -> bool:
         """Predicate function which returns whether two line segments are parallel"""
-        delta_x = (self.get_run(), other.get_run())
-        delta_y = (self.get_rise(), other.get_rise())
-        return np.linalg.det(np.array((delta_x, delta_y))) == 0
+        return ((self.p2.x-self.p1.x)*(other.p2.y-other.p1.y)
+                - (self.p2.y-self.p1.y)*(other.p2.x-other.p1.x)) == 0
+
+    def _lattice_steps(self) -> Tuple[int, int, int, int, int]:
+        x1, y1 = Fraction(self.p1.x), Fraction(self.p1.y)
+        x2, y2 = Fraction(self.p2.x), Fraction(self.p2.y)
+        a, b = y2 - y1, x1 - x2
+        return lattice_steps(a, b, a*x1 + b*y1, (min(x1, x2), min(y1, y2)),
+                             (max(x1, x2), max(y1, y2)))
+
+    def iter_lattice_points(self) -> Iterator[LatticePoint]:
+        """
+        Lazily yield the lattice points lying on the line segment in order
+        from its left (or low) end, found exactly by stepping between them
+        """
+        x, y, dx, dy, count = self._lattice_steps()
+        for k in range(count):
+            yield LatticePoint(x + k*dx, y + k*dy)
+
+    def count_lattice_points(self) -> int:
+        """Returns the number of lattice points lying on the line segment, in O(1)"""
+        return self._lattice_steps()[4]
 
     def lattice_points_along(self) -> Set[LatticePoint]:
         """Find all lattice points lying on the line segment"""
-        points = set()
-        left, right = self.left_point(), self.right_point()
-        low, high = self.low_point(), self.high_point()
-        if self.get_run() == 0:
-            if float(self.p1.x).is_integer():
-                for y in range(ceil(low.y), floor(high.y)+1):
-                    points.add(LatticePoint(int(self.p1.x), y))
-        else:
-            slope = self.get_rise() / self.get_run()
-            steps = ceil(left.x) - left.x
-            for x in range(ceil(left.x), floor(right.x)+1):
-                y = slope * steps + left.y
-                if float(y).is_integer():
-                    points.add(LatticePoint(x, int(y)))
-                steps += 1
-        return points
+        return set(self.iter_lattice_points())
+
+    def rasterize(self, supercover: bool = False) -> Iterator[LatticePoint]:
+        """
+        Lazily yield the lattice points of a line drawn between the endpoints
+        of self, rounded to the nearest lattice points
+
+        By default the points are found with Bresenham's algorithm, giving
+        the thinnest 8-connected line. With supercover, every cell (centred on
+        a lattice point) whose interior the segment passes through is yielded,
+        giving a 4-connected line except where it passes exactly through a
+        corner
+        """
+
+        start, end = LatticePoint.round(self.p1), LatticePoint.round(self.p2)
+        x, y = start.x, start.y
+        nx, ny = abs(end.x - x), abs(end.y - y)
+        sx, sy = (1 if end.x > x else -1), (1 if end.y > y else -1)
+        yield LatticePoint(x, y)
+
+        if supercover:
+            ix = iy = 0
+            while ix < nx or iy < ny:
+                decision = (1 + 2*ix) * ny - (1 + 2*iy) * nx
+                if decision <= 0:
+                    x += sx
+                    ix += 1
+                if decision >= 0:
+                    y += sy
+                    iy += 1
+                yield LatticePoint(x, y)
+            return
+
+        error = nx - ny
+        while (x, y) != (end.x, end.y):
+            doubled = 2 * error
+            if doubled > -ny:
+                error -= ny
+                x += sx
+            if doubled < nx:
+                error += nx
+                y += sy
+            yield LatticePoint(x, y)
 
     # https://bryceboe.com/2006/10/23/line-segment-intersection-algorithm/
     def intersects(self, other: 'LineSegment') -> bool:
@@ -90,24 +177,36 @@ class LineSegment:
             and ccw(self.p1, self.p2, other.p1) \
             != ccw(self.p1, self.p2, other.p2)
 
-    def intersection(self, other: 'LineSegment') -> Optional[Point2D]:
-        """Returns the intersection point of two lines, or none if no intersection point"""
+    def intersection(self, other: 'LineSegment', exact: bool = False) -> Optional[Point2D]:
+        """
+        Returns the intersection point of two lines, or none if no intersection point
+
+        When exact is set, the point is found with rational arithmetic and its
+        values are returned as Fractions, or ints when they are integral,
+        rather than as floats rounded to 10 decimal places
+        """
+        # pylint: disable=too-many-locals
 
         if not self.intersects(other):
             return None
 
-        delta_x = (self.get_run(), other.get_run())
-        delta_y = (self.get_rise(), other.get_rise())
-        div = np.linalg.det(np.array((delta_x, delta_y)))
-
-        self_det = np.linalg.det(
-            np.array(((self.p1.x, self.p1.y), (self.p2.x, self.p2.y))))
-        other_det = np.linalg.det(
-            np.array(((other.p1.x, other.p1.y), (other.p2.x, other.p2.y))))
-        d = (self_det, other_det)
-
-        x = round(-np.linalg.det(np.array((d, delta_x))) / div, 10)
-        y = round(-np.linalg.det(np.array((d, delta_y))) / div, 10)
+        x1, y1, x2, y2 = self.p1.x, self.p1.y, self.p2.x, self.p2.y
+        x3, y3, x4, y4 = other.p1.x, other.p1.y, other.p2.x, other.p2.y
+        if exact:
+            x1, y1, x2, y2 = Fraction(x1), Fraction(y1), Fraction(x2), Fraction(y2)
+            x3, y3, x4, y4 = Fraction(x3), Fraction(y3), Fraction(x4), Fraction(y4)
+        div = (x1-x2)*(y3-y4) - (y1-y2)*(x3-x4)
+        self_det = x1*y2 - y1*x2
+        other_det = x3*y4 - y3*x4
+
+        x = (self_det*(x3-x4) - (x1-x2)*other_det) / div
+        y = (self_det*(y3-y4) - (y1-y2)*other_det) / div
+        if exact:
+            x = int(x) if x.denominator == 1 else x
+            y = int(y) if y.denominator == 1 else y
+            return Point2D(x, y)
+
+        x, y = round(x, 10), round(y, 10)
         x = int(x) if float(x).is_integer() else x
         y = int(y) if float(y).is_integer() else y
         return Point2D(x, y)
@@ -2,7 +2,7 @@
 
 from typing import Final, Union
 
-from ..point import Point
+from ..point import FrozenPoint, Point
 from .vector2d import Vector2D
 
 
@@ -11,9 +11,15 @@ class Point2D(Point):
     This class can be used to represent and evaluate points on an x-y plane
     """
 
+    __slots__ = ()
+
     def __init__(self, x: float, y: float):
         super().__init__(x, y)
 
+    def freeze(self) -> 'FrozenPoint2D':
+        """Returns an immutable copy of self"""
+        return FrozenPoint2D(self.x, self.y)
+
     def __sub__(self, other: 'Point2D') -> Vector2D:
         return Vector2D(self.x-other.x, self.y-other.y)
 
@@ -60,4 +66,55 @@ class Point2D(Point):
         return float(self.x).is_integer() and float(self.y).is_integer()
 
 
+class FrozenPoint2D(FrozenPoint, Point2D):
+    """
+    Immutable, tuple-backed variant of Point2D with fixed-arity arithmetic
+    """
+
+    __slots__ = ()
+
+    def __init__(self, x: float, y: float):  # pylint: disable=super-init-not-called
+        self._coords = (x, y)
+
+    def thaw(self) -> Point2D:
+        """Returns a mutable copy of self"""
+        return Point2D(*self._coords)
+
+    def __add__(self, other: Point) -> 'FrozenPoint2D':
+        o = other._coords
+        if len(o) != 2:
+            return super().__add__(other)
+        s = self._coords
+        return type(self)(s[0]+o[0], s[1]+o[1])
+
+    def __sub__(self, other: Point) -> Vector2D:
+        o = other._coords
+        if len(o) != 2:
+            return super().__sub__(other)
+        s = self._coords
+        return Vector2D(s[0]-o[0], s[1]-o[1])
+
+    def __eq__(self, other: Point) -> bool:
+        if isinstance(other, FrozenPoint2D):
+            return self._coords == other._coords
+        return super().__eq__(other)
+
+    def __hash__(self) -> int:
+        return hash(self._coords)
+
+    def __le__(self, other: Point) -> bool:
+        o = other._coords
+        if len(o) != 2:
+            return super().__le__(other)
+        s = self._coords
+        return s[0] <= o[0] and s[1] <= o[1]
+
+    def __lt__(self, other: Point) -> bool:
+        o = other._coords
+        if len(o) != 2:
+            return super().__lt__(other)
+        s = self._coords
+        return s[0] < o[0] and s[1] < o[1]
+
+
 ORIGIN: Final[Point2D] = Point2D(0, 0)
@@ -0,0 +1,193 @@
+"""This module provides a class for storing and evaluating simple polygons"""
+
+from functools import cached_property
+from math import gcd
+from typing import Iterable, Iterator, List, Tuple
+
+from .linesegment import LineSegment
+from .point2d import Point2D
+
+
+def _cross(o: Point2D, a: Point2D, b: Point2D) -> float:
+    return (a.x-o.x)*(b.y-o.y) - (a.y-o.y)*(b.x-o.x)
+
+
+def _on_segment(a: Point2D, b: Point2D, pt: Point2D) -> bool:
+    return _cross(a, b, pt) == 0 and min(a.x, b.x) <= pt.x <= max(a.x, b.x) \
+        and min(a.y, b.y) <= pt.y <= max(a.y, b.y)
+
+
+class Polygon:
+    """
+    This class stores and provides methods for evaluating simple polygons,
+    given by their vertices in order around the boundary
+    """
+
+    def __init__(self, vertices: Iterable[Point2D]):
+        self._vertices = tuple(vertices)
+        if not self._vertices:
+            raise ValueError('A polygon requires at least one vertex')
+
+    @classmethod
+    def convex_hull(cls, points: Iterable[Point2D]) -> 'Polygon':
+        """
+        Returns the smallest convex polygon containing every point, with its
+        vertices counter-clockwise from the lowest leftmost point, found with
+        Andrew's monotone chain in O(n log n)
+
+        Points lying along the edges of the hull are not included as vertices
+        """
+
+        unique = {}
+        for pt in points:
+            unique.setdefault((pt.x, pt.y), pt)
+        ordered = [unique[key] for key in sorted(unique)]
+        if len(ordered) < 3:
+            return cls(ordered)
+
+        def chain(pts: List[Point2D]) -> List[Point2D]:
+            hull: List[Point2D] = []
+            for pt in pts:
+                while len(hull) >= 2 and _cross(hull[-2], hull[-1], pt) <= 0:
+                    hull.pop()
+                hull.append(pt)
+            return hull[:-1]
+
+        return cls(chain(ordered) + chain(ordered[::-1]))
+
+    @property
+    def vertices(self) -> Tuple[Point2D, ...]:
+        """This property represents the vertices of the polygon in order"""
+        return self._vertices
+
+    def __len__(self) -> int:
+        return len(self._vertices)
+
+    def __iter__(self) -> Iterator[Point2D]:
+        return iter(self._vertices)
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({", ".join(map(str, self._vertices))})'
+
+    def __eq__(self, other: 'Polygon') -> bool:
+        return isinstance(other, Polygon) and self._vertices == other.vertices
+
+    def __hash__(self) -> int:
+        return hash(self._vertices)
+
+    def edges(self) -> List[LineSegment]:
+        """Returns the edges of the polygon as line segments, skipping repeated vertices"""
+        return [LineSegment(a, b) for a, b in self._pairs() if a != b]
+
+    def _pairs(self) -> Iterator[Tuple[Point2D, Point2D]]:
+        vertices = self._vertices
+        return zip(vertices, vertices[1:] + vertices[:1])
+
+    @cached_property
+    def _doubled_area(self) -> float:
+        return sum(a.x*b.y - b.x*a.y for a, b in self._pairs())
+
+    def signed_area(self) -> float:
+        """
+        Returns the area of the polygon by the shoelace formula, which is
+        positive when its vertices are counter-clockwise
+        """
+        return self._doubled_area / 2
+
+    def area(self) -> float:
+        """Returns the area of the polygon"""
+        return abs(self.signed_area())
+
+    def perimeter(self) -> float:
+        """Returns the length of the boundary of the polygon"""
+        return sum(a.euclidean_distance(b) for a, b in self._pairs())
+
+    @cached_property
+    def _turns(self) -> List[float]:
+        vertices = self._vertices
+        if len(vertices) < 3:
+            return []
+        return [_cross(vertices[i-2], vertices[i-1], vertices[i]) for i in range(len(vertices))]
+
+    @cached_property
+    def _convex(self) -> bool:
+        turns = [turn for turn in self._turns if turn]
+        return all(turn > 0 for turn in turns) or all(turn < 0 for turn in turns)
+
+    def is_convex(self) -> bool:
+        """
+        Predicate method which returns whether the polygon is convex, which
+        polygons of fewer than three vertices are
+        """
+        return self._convex
+
+    @cached_property
+    def _counter_clockwise(self) -> Tuple[Point2D, ...]:
+        # Vertices where the boundary runs straight on are dropped, so that
+        # every wedge about the first vertex is bounded by a real turn
+        vertices, turns = self._vertices, self._turns
+        if turns:
+            corners = tuple(vertex for i, vertex in enumerate(vertices)
+                            if turns[(i+1) % len(vertices)])
+            if len(corners) >= 3:
+                vertices = corners
+        return vertices if self._doubled_area >= 0 else vertices[::-1]
+
+    def __contains__(self, pt: Point2D) -> bool:
+        """
+        Points on the boundary are contained. Convex polygons are queried in
+        O(log n) by binary search over the wedges about the first vertex, and
+        other polygons in O(n) by counting crossings of the boundary
+        """
+
+        if self._convex:
+            return self._contains_convex(pt)
+        return self._contains_crossing(pt)
+
+    def _contains_crossing(self, pt: Point2D) -> bool:
+        if any(_on_segment(a, b, pt) for a, b in self._pairs()):
+            return True
+        inside = False
+        for a, b in self._pairs():
+            if (a.y > pt.y) != (b.y > pt.y) and \
+                    pt.x < a.x + (pt.y - a.y) * (b.x - a.x) / (b.y - a.y):
+                inside = not inside
+        return inside
+
+    def _contains_convex(self, pt: Point2D) -> bool:
+        vertices = self._counter_clockwise
+        first = vertices[0]
+        if len(vertices) < 3 or self._doubled_area == 0:
+            return any(_on_segment(a, b, pt) for a, b in self._pairs())
+        if _cross(first, vertices[1], pt) < 0 or _cross(first, vertices[-1], pt) > 0:
+            return False
+
+        # Find the last vertex which pt lies counter-clockwise of, about the first vertex
+        lo, hi = 1, len(vertices) - 1
+        while hi - lo > 1:
+            middle = (lo + hi) // 2
+            if _cross(first, vertices[middle], pt) >= 0:
+                lo = middle
+            else:
+                hi = middle
+        return _cross(vertices[lo], vertices[lo+1], pt) >= 0
+
+    def _lattice_vertices(self) -> None:
+        if not all(vertex.is_lattice() for vertex in self._vertices):
+            raise ValueError('Lattice point counts require vertices on the integer lattice')
+
+    def boundary_lattice_points(self) -> int:
+        """Returns the number of lattice points on the boundary of a lattice polygon"""
+        self._lattice_vertices()
+        return sum(gcd(int(b.x - a.x), int(b.y - a.y)) for a, b in self._pairs())
+
+    def interior_lattice_points(self) -> int:
+        """
+        Returns the number of lattice points strictly within a lattice polygon,
+        found in O(n) by Pick's theorem
+        """
+        return max(0, (abs(int(self._doubled_area)) - self.boundary_lattice_points() + 2) // 2)
+
+    def lattice_points(self) -> int:
+        """Returns the number of lattice points within or on the boundary of a lattice polygon"""
+        return self.interior_lattice_points() + self.boundary_lattice_points()
@@ -1,5 +1,8 @@
 """This module provides a class for storing and evaluating rectangles"""
 
+import numpy as np
+
+from ..pointarray import Points, as_coords
 from .point2d import Point2D
 
 
@@ -13,6 +16,28 @@ class Rectangle:
     def __repr__(self) -> str:
         return f'{self.__class__.__name__}(low={self._low}, high={self._high})'
 
+    @property
+    def low(self) -> Point2D:
+        """This property represents the lower left corner of the rectangle"""
+        return self._low
+
+    @property
+    def high(self) -> Point2D:
+        """This property represents the upper right corner of the rectangle"""
+        return self._high
+
+    def __contains__(self, pt: Point2D) -> bool:
+        return self._low.x <= pt.x <= self._high.x and self._low.y <= pt.y <= self._high.y
+
+    def contains_many(self, points: Points) -> np.ndarray:
+        """
+        Returns a boolean mask of which of many points lie within self,
+        including its edges
+        """
+        coords = as_coords(points)
+        x, y = coords[:, 0], coords[:, 1]
+        return (self._low.x <= x) & (x <= self._high.x) & (self._low.y <= y) & (y <= self._high.y)
+
     def corners(self) -> tuple[Point2D, Point2D, Point2D, Point2D]:
         """Returns a tuple containing all the corners of the rectangle"""
         return (self._low, Point2D(self._low.x, self._high.y),
@@ -0,0 +1,152 @@
+"""This module provides a class for composing and applying affine transformations"""
+
+from math import cos, radians, sin
+from typing import Optional, Tuple, Union
+
+import numpy as np
+
+from ..point import Point
+from ..pointarray import PointArray
+from .point2d import Point2D
+from .vector2d import Vector2D
+
+Transformable = Union[Point, PointArray, np.ndarray]
+
+
+class Transform2D:
+    """
+    An affine transformation of the x-y plane, mapping (x, y) to
+    (a*x + b*y + tx, c*x + d*y + ty)
+
+    Transformations compose with the @ operator, so that (second @ first)
+    applies first and then second, and chains of rotations, translations and
+    scalings collapse into a single transformation which can then be applied
+    to many points in one vectorized call. Vectors are only rotated, scaled
+    and sheared, while points are translated as well
+    """
+
+    __slots__ = ('_values',)
+
+    def __init__(self, a: float = 1, b: float = 0, c: float = 0, d: float = 1,
+                 tx: float = 0, ty: float = 0):
+        # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self._values = (a, b, c, d, tx, ty)
+
+    @classmethod
+    def identity(cls) -> 'Transform2D':
+        """Returns the transformation which leaves every point in place"""
+        return cls()
+
+    @classmethod
+    def translation(cls, dx: float, dy: float) -> 'Transform2D':
+        """Returns the transformation which moves every point by (dx, dy)"""
+        return cls(tx=dx, ty=dy)
+
+    @classmethod
+    def rotation(cls, degree: float, center: Optional[Point2D] = None) -> 'Transform2D':
+        """
+        Returns the transformation which rotates every point counter-clockwise
+        by degree degrees about center, or about the origin by default
+        """
+
+        angle = radians(degree)
+        cos_, sin_ = cos(angle), sin(angle)
+        return cls(cos_, -sin_, sin_, cos_)._about(center)
+
+    @classmethod
+    def scaling(cls, sx: float, sy: Optional[float] = None,
+                center: Optional[Point2D] = None) -> 'Transform2D':
+        """
+        Returns the transformation which scales every point by sx along x and
+        sy along y, which defaults to sx, away from center or the origin
+        """
+        return cls(sx, 0, 0, sx if sy is None else sy)._about(center)
+
+    @classmethod
+    def from_matrix(cls, matrix: np.ndarray) -> 'Transform2D':
+        """Returns the transformation given by a 2x3 or 3x3 matrix in homogeneous coordinates"""
+        (a, b, tx), (c, d, ty) = np.asarray(matrix)[:2].tolist()
+        return cls(a, b, c, d, tx, ty)
+
+    def _about(self, center: Optional[Point2D]) -> 'Transform2D':
+        if center is None:
+            return self
+        return Transform2D.translation(center.x, center.y) @ self \
+            @ Transform2D.translation(-center.x, -center.y)
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """This property represents the transformation as a 3x3 matrix in homogeneous coordinates"""
+        a, b, c, d, tx, ty = self._values
+        return np.array([[a, b, tx], [c, d, ty], [0, 0, 1]], dtype=float)
+
+    def as_tuple(self) -> Tuple[float, float, float, float, float, float]:
+        """Returns the coefficients (a, b, c, d, tx, ty) of self"""
+        return self._values
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}{self._values}'
+
+    def __eq__(self, other: 'Transform2D') -> bool:
+        return isinstance(other, Transform2D) and self._values == other.as_tuple()
+
+    def __hash__(self) -> int:
+        return hash(self._values)
+
+    def __matmul__(self, other: 'Transform2D') -> 'Transform2D':
+        a, b, c, d, tx, ty = self._values
+        oa, ob, oc, od, otx, oty = other.as_tuple()
+        return Transform2D(a*oa + b*oc, a*ob + b*od, c*oa + d*oc, c*ob + d*od,
+                           a*otx + b*oty + tx, c*otx + d*oty + ty)
+
+    def then(self, other: 'Transform2D') -> 'Transform2D':
+        """Returns the transformation which applies self and then other"""
+        return other @ self
+
+    def translate(self, dx: float, dy: float) -> 'Transform2D':
+        """Returns the transformation which applies self and then a translation"""
+        return Transform2D.translation(dx, dy) @ self
+
+    def rotate(self, degree: float, center: Optional[Point2D] = None) -> 'Transform2D':
+        """Returns the transformation which applies self and then a rotation"""
+        return Transform2D.rotation(degree, center) @ self
+
+    def scale(self, sx: float, sy: Optional[float] = None,
+              center: Optional[Point2D] = None) -> 'Transform2D':
+        """Returns the transformation which applies self and then a scaling"""
+        return Transform2D.scaling(sx, sy, center) @ self
+
+    def inverse(self) -> 'Transform2D':
+        """Returns the transformation which undoes self"""
+
+        a, b, c, d, tx, ty = self._values
+        determinant = a*d - b*c
+        if determinant == 0:
+            raise ValueError('A transformation which collapses the plane cannot be inverted')
+        ia, ib, ic, id_ = d/determinant, -b/determinant, -c/determinant, a/determinant
+        return Transform2D(ia, ib, ic, id_, -(ia*tx + ib*ty), -(ic*tx + id_*ty))
+
+    def apply(self, target: Transformable) -> Transformable:
+        """
+        Returns the image of a Vector2D, a Point2D or of every point of a
+        PointArray or (N, 2) array under the transformation, in one
+        vectorized call for arrays
+
+        Points other than vectors are returned as Point2Ds, as their images
+        need not lie on the integer lattice
+        """
+
+        a, b, c, d, tx, ty = self._values
+        if isinstance(target, np.ndarray):
+            return np.asarray(target)[:, :2] @ np.array([[a, c], [b, d]]) + (tx, ty)
+        if isinstance(target, PointArray):
+            if issubclass(target.point_type, Vector2D):
+                return PointArray(Transform2D(a, b, c, d).apply(target.coords), Vector2D)
+            return PointArray(self.apply(target.coords), Point2D)
+        x, y = target.x, target.y
+        if isinstance(target, Vector2D):
+            return Vector2D(a*x + b*y, c*x + d*y)
+        return Point2D(a*x + b*y + tx, c*x + d*y + ty)
+
+    def __call__(self, target: Transformable) -> Transformable:
+        return self.apply(target)
@@ -1,8 +1,12 @@
 """This module provides a class for storing and evaluating triangles"""
 
+from functools import cached_property
 from typing import List, Tuple
 
+import numpy as np
+
 from ..point import Point
+from ..pointarray import Points, as_coords
 from .corner import Corner
 
 
@@ -14,6 +18,46 @@ class Triangle:
         self.p2 = p2
         self.p3 = p3
 
+    @property
+    def p1(self) -> Point:
+        """This property works as a getter for the first vertex"""
+        return self._p1
+
+    @p1.setter
+    def p1(self, p1: Point):
+        """Set the first vertex of the triangle, invalidating caches which depend on it"""
+        self._invalidate_caches()
+        self._p1 = p1
+
+    @property
+    def p2(self) -> Point:
+        """This property works as a getter for the second vertex"""
+        return self._p2
+
+    @p2.setter
+    def p2(self, p2: Point):
+        """Set the second vertex of the triangle, invalidating caches which depend on it"""
+        self._invalidate_caches()
+        self._p2 = p2
+
+    @property
+    def p3(self) -> Point:
+        """This property works as a getter for the third vertex"""
+        return self._p3
+
+    @p3.setter
+    def p3(self, p3: Point):
+        """Set the third vertex of the triangle, invalidating caches which depend on it"""
+        self._invalidate_caches()
+        self._p3 = p3
+
+    def _invalidate_caches(self) -> None:
+        for cache in ('_signed_area', '_coefficients'):
+            try:
+                delattr(self, cache)
+            except AttributeError:
+                pass
+
     def __contains__(self, pt: Point):
         return pt in (self.p1, self.p2, self.p3)
 
@@ -48,8 +92,8 @@ class Triangle:
         l3 = [self.p1.as_tuple(), self.p3.as_tuple()]
         return [l1, l2, l3]
 
-    def signed_area(self) -> int:
-        """Returns the signed area of self"""
+    @cached_property
+    def _signed_area(self) -> float:
         return 0.5 * (
             -self.p2.y*self.p3.x +
             self.p1.y*(-self.p2.x + self.p3.x) +
@@ -57,25 +101,33 @@ class Triangle:
             self.p2.x*self.p3.y
         )
 
-    def area(self) -> int:
+    def signed_area(self) -> float:
+        """Returns the signed area of self"""
+        return self._signed_area
+
+    def area(self) -> float:
         """Returns the area of self"""
         return abs(self.signed_area())
 
+    @cached_property
+    def _coefficients(self) -> Tuple[float, float, float, float, float, float]:
+        """
+        Coefficients of the barycentric coordinates s and t as linear functions
+        of x and y, scaled by the inverse of twice the signed area
+        """
+
+        scale = 1/(2*self._signed_area)
+        return (scale*(self.p1.y*self.p3.x - self.p1.x*self.p3.y),
+                scale*(self.p3.y - self.p1.y), scale*(self.p1.x - self.p3.x),
+                scale*(self.p1.x*self.p2.y - self.p1.y*self.p2.x),
+                scale*(self.p1.y - self.p2.y), scale*(self.p2.x - self.p1.x))
+
     def barycentric_coordinates(self, pt: Point) -> Tuple[float, float, float]:
         """Returns the barycentric_coordinates of pt"""
 
-        s = 1/(2*self.signed_area())*(
-            self.p1.y*self.p3.x -
-            self.p1.x*self.p3.y +
-            (self.p3.y - self.p1.y)*pt.x +
-            (self.p1.x - self.p3.x)*pt.y
-        )
-        t = 1/(2*self.signed_area())*(
-            self.p1.x*self.p2.y -
-            self.p1.y*self.p2.x +
-            (self.p1.y - self.p2.y)*pt.x +
-            (self.p2.x - self.p1.x)*pt.y
-        )
+        s0, sx, sy, t0, tx, ty = self._coefficients
+        s = s0 + sx*pt.x + sy*pt.y
+        t = t0 + tx*pt.x + ty*pt.y
         return s, t, 1-s-t
 
     def contains(self, pt: Point) -> bool:
@@ -83,6 +135,14 @@ class Triangle:
         s, t, _ = self.barycentric_coordinates(pt)
         return s > 0 and t > 0 and 1-s-t > 0
 
+    def contains_many(self, points: Points) -> np.ndarray:
+        """Returns a boolean mask of which of many points lie strictly within self"""
+        s0, sx, sy, t0, tx, ty = self._coefficients
+        coords = as_coords(points)
+        s = s0 + sx*coords[:, 0] + sy*coords[:, 1]
+        t = t0 + tx*coords[:, 0] + ty*coords[:, 1]
+        return (s > 0) & (t > 0) & (1-s-t > 0)
+
     def as_tuple(self) -> Tuple[Tuple[float, float]]:
         """Returns a representation of self as a tuple of tuples of floats"""
         return tuple(item for pt in (self.p1, self.p2, self.p3) for item in pt.as_tuple())
@@ -0,0 +1,86 @@
+"""
+This module provides functions for measuring the region covered by many
+overlapping axis-aligned rectangles on the x-y plane
+"""
+
+from typing import Iterable, List, Sequence, Tuple
+
+from .rectangle import Rectangle
+
+Bounds = Tuple[float, float, float, float]
+
+
+class _CoverageTree:
+    """
+    A segment tree over the gaps between sorted y-values which tracks the
+    total length covered by at least one interval
+    """
+
+    def __init__(self, ys: Sequence[float]):
+        self.ys = ys
+        size = 4 * len(ys)
+        self.count: List[int] = [0] * size
+        self.length: List[float] = [0] * size
+
+    @property
+    def covered(self) -> float:
+        """The total length covered by the intervals in the tree"""
+        return self.length[1]
+
+    def update(self, low: int, high: int, delta: int) -> None:
+        """Add delta to the cover count of the gaps between ys[low] and ys[high]"""
+
+        count, length, ys = self.count, self.length, self.ys
+
+        def visit(node: int, start: int, end: int) -> None:
+            if high <= start or end <= low:
+                return
+            if low <= start and end <= high:
+                count[node] += delta
+            else:
+                middle = (start + end) // 2
+                visit(2*node, start, middle)
+                visit(2*node+1, middle, end)
+
+            if count[node]:
+                length[node] = ys[end] - ys[start]
+            elif end - start == 1:
+                length[node] = 0
+            else:
+                length[node] = length[2*node] + length[2*node+1]
+
+        visit(1, 0, len(ys) - 1)
+
+
+def union_area_of_bounds(bounds: Iterable[Bounds]) -> float:
+    """
+    Returns the area covered by boxes given as (x1, y1, x2, y2) tuples with
+    x1 <= x2 and y1 <= y2, found with a sweep over x and a segment tree over
+    the compressed y-values in O(n log n)
+
+    Only the distinct coordinates are visited, so the result is exact for
+    integers of any size and no cells are materialized
+    """
+
+    boxes = [box for box in bounds if box[0] < box[2] and box[1] < box[3]]
+    if not boxes:
+        return 0
+    ys = sorted({y for box in boxes for y in (box[1], box[3])})
+    index = {y: i for i, y in enumerate(ys)}
+    events = sorted([(x1, 1, index[y1], index[y2]) for x1, y1, _, y2 in boxes]
+                    + [(x2, -1, index[y1], index[y2]) for _, y1, x2, y2 in boxes])
+
+    tree = _CoverageTree(ys)
+    area = 0
+    last = events[0][0]
+    for x, delta, low, high in events:
+        area += tree.covered * (x - last)
+        tree.update(low, high, delta)
+        last = x
+    return area
+
+
+def union_area(rectangles: Iterable[Rectangle]) -> float:
+    """Returns the area covered by at least one of many, possibly overlapping, rectangles"""
+    return union_area_of_bounds((rect.low.x, rect.low.y, rect.high.x, rect.high.y)
+                                for rect in rectangles)
@@ -1,6 +1,7 @@
 """This module provides a class for storing vectors on an x-y plane"""
 
-from math import atan, cos, degrees, radians, sin
+from math import atan, cos, degrees, hypot, radians, sin
+from typing import Union
 
 from ..point import Point
 
@@ -8,6 +9,8 @@ from ..point import Point
 class Vector2D(Point):
     """Class for storing vectors on an 2-dimensional plane"""
 
+    __slots__ = ()
+
     def __init__(self, x: float, y: float):
         super().__init__(x, y)
 
@@ -19,13 +22,26 @@ class Vector2D(Point):
         """Returns the dot product of self and other"""
         return (self.x*other.x) + (self.y*other.y)
 
+    def magnitude(self) -> Union[int, float]:
+        """Returns the magnitude of self"""
+        val = hypot(*self._coords)
+        return int(val) if val.is_integer() else val
+
     def normalize(self) -> 'Vector2D':
         """Normalize self, setting self to have a magnitude of 1"""
-        return self / self.magnitude()
+        x, y = self._coords[0], self._coords[1]
+        length = hypot(x, y)
+        return Vector2D(x/length, y/length)
 
     def rotate(self, degree: float) -> 'Vector2D':
         """Create a new vector of magnitude 1, rotated "degree" degrees"""
-        return Vector2D.from_vel(self.angle()+degree, 1)
+        x, y = self._coords[0], self._coords[1]
+        length = hypot(x, y)
+        if length == 0:
+            raise ValueError('Zero vector (0,0) does not have an angle')
+        angle = radians(degree)
+        cos_, sin_ = cos(angle)/length, sin(angle)/length
+        return Vector2D(x*cos_ - y*sin_, x*sin_ + y*cos_)
 
     def area(self) -> float:
         """Returns the area created by self"""
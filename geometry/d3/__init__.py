@@ -4,4 +4,5 @@ geometric concepts in 3 dimensions
 """
 
 from .cuboid import Cuboid
-from .point3d import ORIGIN, Point3D
+from .point3d import ORIGIN, FrozenPoint3D, Point3D
+from .union import CuboidUnion, union_volume
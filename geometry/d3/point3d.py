@@ -1,33 +1,121 @@
 """This module provides a class for storing points which lie in 3-space"""
 
-from typing import Final, List, Optional
+from math import inf
+from typing import Dict, Final, Iterator, List, Optional, Tuple
 
-from ..point import Point
+from ..point import FrozenPoint, Point
+
+_FACES = ((1, 0, 0), (-1, 0, 0), (0, 1, 0), (0, -1, 0), (0, 0, 1), (0, 0, -1))
+_EDGES = ((1, 1, 0), (-1, -1, 0), (1, -1, 0), (-1, 1, 0),
+          (1, 0, 1), (-1, 0, -1), (1, 0, -1), (-1, 0, 1),
+          (0, 1, 1), (0, -1, -1), (0, 1, -1), (0, -1, 1))
+_CORNERS = ((1, 1, 1), (1, 1, -1), (1, -1, 1), (1, -1, -1),
+            (-1, 1, 1), (-1, 1, -1), (-1, -1, 1), (-1, -1, -1))
+
+# Offsets to the adjacent points of a point, keyed by the number of neighbours
+# in the neighbourhood: sharing a face, a face or edge, or any of the three
+NEIGHBOUR_OFFSETS: Dict[int, Tuple[Tuple[int, int, int], ...]] = {
+    6: _FACES,
+    18: _FACES + _EDGES,
+    26: _FACES + _EDGES + _CORNERS,
+}
 
 
 class Point3D(Point):
     """Class for storing points which lie in 3-space"""
 
+    __slots__ = ()
+
     def __init__(self, x: float, y: float, z: float):
         super().__init__(x, y, z)
 
+    def freeze(self) -> 'FrozenPoint3D':
+        """Returns an immutable copy of self"""
+        return FrozenPoint3D(self.x, self.y, self.z)
+
+    def iter_adjacent_points(self, diagonals: bool = False,
+                             lower_bound: Optional['Point3D'] = None,
+                             upper_bound: Optional['Point3D'] = None,
+                             neighbours: Optional[int] = None) -> Iterator['Point3D']:
+        """
+        Lazily yield the adjacent lattice points of a given point which lie
+        within a bound, lower_bound inclusive and upper_bound exclusive
+
+        neighbours selects the 6, 18 or 26 point neighbourhood, overriding
+        diagonals, which otherwise selects between 6 and 26
+        """
+
+        if neighbours is None:
+            neighbours = 26 if diagonals else 6
+        if neighbours not in NEIGHBOUR_OFFSETS:
+            raise ValueError(f'neighbours must be one of {tuple(NEIGHBOUR_OFFSETS)}')
+
+        x, y, z = self._coords[0], self._coords[1], self._coords[2]
+        low = (-inf,)*3 if lower_bound is None else (lower_bound[0], lower_bound[1], lower_bound[2])
+        high = (inf,)*3 if upper_bound is None else (upper_bound[0], upper_bound[1], upper_bound[2])
+        point_type = type(self) if isinstance(self, FrozenPoint) else Point3D
+        for dx, dy, dz in NEIGHBOUR_OFFSETS[neighbours]:
+            if (low[0] <= x+dx < high[0] and low[1] <= y+dy < high[1]
+                    and low[2] <= z+dz < high[2]):
+                yield point_type(x+dx, y+dy, z+dz)
+
     def get_adjacent_points(self, diagonals: bool = False,
                             lower_bound: Optional['Point3D'] = None,
-                            upper_bound: Optional['Point3D'] = None) -> List['Point3D']:
+                            upper_bound: Optional['Point3D'] = None,
+                            neighbours: Optional[int] = None) -> List['Point3D']:
         """Returns the adjacent lattice points of a given point"""
+        return list(self.iter_adjacent_points(diagonals, lower_bound, upper_bound, neighbours))
+
+
+class FrozenPoint3D(FrozenPoint, Point3D):
+    """
+    Immutable, tuple-backed variant of Point3D with fixed-arity arithmetic
+    """
+
+    __slots__ = ()
+
+    def __init__(self, x: float, y: float, z: float):  # pylint: disable=super-init-not-called
+        self._coords = (x, y, z)
+
+    def thaw(self) -> Point3D:
+        """Returns a mutable copy of self"""
+        return Point3D(*self._coords)
+
+    def __add__(self, other: Point) -> 'FrozenPoint3D':
+        o = other._coords
+        if len(o) != 3:
+            return super().__add__(other)
+        s = self._coords
+        return type(self)(s[0]+o[0], s[1]+o[1], s[2]+o[2])
+
+    def __sub__(self, other: Point) -> 'FrozenPoint3D':
+        o = other._coords
+        if len(o) != 3:
+            return super().__sub__(other)
+        s = self._coords
+        return type(self)(s[0]-o[0], s[1]-o[1], s[2]-o[2])
+
+    def __eq__(self, other: Point) -> bool:
+        if isinstance(other, FrozenPoint3D):
+            return self._coords == other._coords
+        return super().__eq__(other)
+
+    def __hash__(self) -> int:
+        return hash(self._coords)
+
+    def __le__(self, other: Point) -> bool:
+        o = other._coords
+        if len(o) != 3:
+            return super().__le__(other)
+        s = self._coords
+        return s[0] <= o[0] and s[1] <= o[1] and s[2] <= o[2]
 
-        adj = [Point3D(1, 0, 0), Point3D(-1, 0, 0),
-               Point3D(0, 1, 0), Point3D(0, -1, 0),
-               Point3D(0, 0, 1), Point3D(0, 0, -1)]
-        if diagonals:
-            adj += [Point3D(1, 1, 0), Point3D(-1, -1, 0), Point3D(1, -1, 0), Point3D(-1, 1, 0),
-                    Point3D(1, 0, 1), Point3D(-1, 0, -
-                                              1), Point3D(1, 0, -1), Point3D(-1, 0, 1),
-                    Point3D(0, 1, 1), Point3D(0, -1, -1), Point3D(0, 1, -1), Point3D(0, -1, 1)]
-            adj += [Point3D(1, 1, 1), Point3D(1, 1, -1), Point3D(1, -1, 1), Point3D(1, -1, -1),
-                    Point3D(-1, 1, 1), Point3D(-1, 1, -1), Point3D(-1, -1, 1), Point3D(-1, -1, -1)]
-        adj = [self + p for p in adj]
-        return Point.bounded_filter(adj, lower_bound, upper_bound)
+    def __lt__(self, other: Point) -> bool:
+        o = other._coords
+        if len(o) != 3:
+            return super().__lt__(other)
+        s = self._coords
+        return s[0] < o[0] and s[1] < o[1] and s[2] < o[2]
 
 
 ORIGIN: Final[Point3D] = Point3D(0, 0, 0)
@@ -0,0 +1,125 @@
+"""
+This module provides tools for measuring the region covered by many
+overlapping cuboids
+"""
+
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+import numpy as np
+
+from ..d2.union import union_area_of_bounds
+from .cuboid import Cuboid
+from .point3d import Point3D
+
+_Key = Tuple[Tuple[float, ...], Tuple[float, ...]]
+
+
+def union_volume(cuboids: Iterable[Cuboid]) -> float:
+    """
+    Returns the volume covered by at least one of many, possibly overlapping,
+    cuboids
+
+    The cuboids are swept along z while tracking the area covered by the x-y
+    projections of those spanning the sweep plane. As each cuboid enters or
+    leaves, the area changes by the part of its projection which is not
+    covered by the others, found by sweeping only the projections which
+    overlap it, so the result is exact for integers of any size and no cells
+    are materialized
+    """
+    # pylint: disable=too-many-locals
+
+    rects, spans = [], []
+    for cuboid in cuboids:
+        lower, upper = cuboid.lower.as_tuple(), cuboid.upper.as_tuple()
+        lower, upper = tuple(map(min, lower, upper)), tuple(map(max, lower, upper))
+        if all(a < b for a, b in zip(lower, upper)):
+            rects.append((lower[0], lower[1], upper[0], upper[1]))
+            spans.append((lower[2], upper[2]))
+    events = sorted([(low, 1, i) for i, (low, _) in enumerate(spans)]
+                    + [(high, -1, i) for i, (_, high) in enumerate(spans)])
+
+    # Rounding to floats preserves order, so it can find a superset of the
+    # overlapping projections, which are then clipped exactly
+    left, bottom, right, top = np.array(rects, dtype=float).reshape(len(rects), 4).T
+    active = np.zeros(len(rects), dtype=bool)
+    area = volume = 0
+    last = None
+    for z, delta, i in events:
+        if area:
+            volume += area * (z - last)
+        last = z
+        x1, y1, x2, y2 = rects[i]
+        active[i] = False
+        near = np.flatnonzero(active & (left <= right[i]) & (right >= left[i])
+                              & (bottom <= top[i]) & (top >= bottom[i]))
+        covered = union_area_of_bounds(
+            (max(rects[j][0], x1), max(rects[j][1], y1), min(rects[j][2], x2), min(rects[j][3], y2))
+            for j in near)
+        area += delta * ((x2 - x1) * (y2 - y1) - covered)
+        active[i] = delta > 0
+    return volume
+
+
+class CuboidUnion:
+    """
+    The region covered by a sequence of cuboids which are each switched on
+    or off, stored as signed cuboids for inclusion-exclusion
+
+    Switching a cuboid on or off cancels its overlap with every signed cuboid
+    already present, and identical signed cuboids are merged, so the volume
+    is found without materializing cells
+    """
+
+    def __init__(self, cuboids: Iterable[Cuboid] = ()):
+        self._signed: Dict[_Key, Tuple[Cuboid, int]] = {}
+        for cuboid in cuboids:
+            self.add(cuboid)
+
+    def __len__(self) -> int:
+        return len(self._signed)
+
+    def __iter__(self) -> Iterator[Tuple[Cuboid, int]]:
+        return iter(list(self._signed.values()))
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(signed={len(self)},volume={self.volume})'
+
+    @staticmethod
+    def _key(cuboid: Cuboid) -> _Key:
+        return cuboid.lower.as_tuple(), cuboid.upper.as_tuple()
+
+    def _accumulate(self, cuboid: Cuboid, weight: int) -> None:
+        key = self._key(cuboid)
+        total = self._signed.get(key, (cuboid, 0))[1] + weight
+        if total:
+            self._signed[key] = (cuboid, total)
+        else:
+            self._signed.pop(key, None)
+
+    def set(self, cuboid: Cuboid, on: bool) -> None:
+        """Switch every point within cuboid on or off"""
+
+        lower, upper = cuboid.lower.as_tuple(), cuboid.upper.as_tuple()
+        cuboid = Cuboid(Point3D(*map(min, lower, upper)), Point3D(*map(max, lower, upper)))
+        changes: List[Tuple[Cuboid, int]] = []
+        for other, weight in self._signed.values():
+            overlap = other.overlap(cuboid)
+            if overlap is not None and overlap.volume:
+                changes.append((overlap, -weight))
+        if on:
+            changes.append((cuboid, 1))
+        for overlap, weight in changes:
+            self._accumulate(overlap, weight)
+
+    def add(self, cuboid: Cuboid) -> None:
+        """Switch every point within cuboid on"""
+        self.set(cuboid, True)
+
+    def subtract(self, cuboid: Cuboid) -> None:
+        """Switch every point within cuboid off"""
+        self.set(cuboid, False)
+
+    @property
+    def volume(self) -> float:
+        """This property represents the volume of the points which are switched on"""
+        return sum(cuboid.volume * weight for cuboid, weight in self._signed.values())
@@ -0,0 +1,140 @@
+"""
+This module provides functions for evaluating the distances between every
+pair of points in large collections of points
+"""
+
+from heapq import merge
+from math import dist, inf
+from typing import Callable, Dict, Iterable, Iterator, Optional, Tuple, Union
+
+import numpy as np
+
+from .point import Point
+from .pointarray import PointArray
+
+Points = Union[PointArray, Iterable[Point]]
+
+# Upper limit on the number of elements in the temporary difference array
+# created for a single block of a distance matrix
+_BLOCK_ELEMENTS = 2**22
+
+
+def _manhattan(a: Tuple[float, ...], b: Tuple[float, ...]) -> float:
+    return sum(abs(i-j) for i, j in zip(a, b))
+
+
+_METRICS: Dict[str, Callable[[Tuple[float, ...], Tuple[float, ...]], float]] = {
+    'euclidean': dist,
+    'manhattan': _manhattan,
+}
+
+
+def _assert_metric(metric: str) -> None:
+    if metric not in _METRICS:
+        raise ValueError(f'Unsupported distance metric "{metric}", '
+                         f'expected one of {tuple(_METRICS)}')
+
+
+def _as_array(points: Points) -> PointArray:
+    if isinstance(points, PointArray):
+        return points
+    return PointArray.from_points(points)
+
+
+def iter_pairwise_distances(points: Points, other: Optional[Points] = None,
+                            metric: str = 'euclidean',
+                            block_size: Optional[int] = None
+                            ) -> Iterator[Tuple[int, np.ndarray]]:
+    """
+    Lazily compute the distance matrix between points and other (or points
+    and itself), yielding tuples of the first row index and a block of at
+    most block_size complete rows, so that memory use stays bounded
+    """
+
+    _assert_metric(metric)
+    rows = _as_array(points).coords
+    cols = rows if other is None else _as_array(other).coords
+    if rows.shape[1] != cols.shape[1]:
+        raise ValueError('Cannot find distances between points of different dimensions')
+
+    if block_size is None:
+        block_size = max(1, _BLOCK_ELEMENTS // max(1, cols.shape[0]*cols.shape[1]))
+    if block_size < 1:
+        raise ValueError('block_size must be a positive integer')
+
+    for start in range(0, rows.shape[0], block_size):
+        diff = rows[start:start+block_size, np.newaxis, :] - cols[np.newaxis, :, :]
+        if metric == 'manhattan':
+            block = np.abs(diff).sum(axis=2)
+        else:
+            block = np.sqrt((diff**2).sum(axis=2))
+        yield start, block
+
+
+def pairwise_distances(points: Points, other: Optional[Points] = None,
+                       metric: str = 'euclidean',
+                       block_size: Optional[int] = None) -> np.ndarray:
+    """
+    Returns the full matrix of distances between points and other (or points
+    and itself), computed block_size rows at a time
+    """
+
+    rows = _as_array(points)
+    cols = rows if other is None else _as_array(other)
+    matrix = np.empty((len(rows), len(cols)))
+    for start, block in iter_pairwise_distances(rows, cols, metric, block_size):
+        matrix[start:start+block.shape[0]] = block
+    return matrix
+
+
+def closest_pair(points: Points, metric: str = 'euclidean') -> Tuple[float, Point, Point]:
+    """
+    Returns the distance between the closest pair of points along with the
+    pair itself, found by divide and conquer in O(n log n) for 2D points
+    """
+
+    _assert_metric(metric)
+    distance = _METRICS[metric]
+    if not isinstance(points, PointArray):
+        points = list(points)
+    if len(points) < 2:
+        raise ValueError('At least two points are required to find the closest pair')
+
+    coords = [tuple(row) for row in _as_array(points).coords.tolist()]
+    axis = 1 if len(coords[0]) > 1 else 0
+    by_x = sorted(range(len(coords)), key=coords.__getitem__)
+
+    def by_y(i: int) -> float:
+        return coords[i][axis]
+
+    best = [inf, 0, 1]
+
+    def solve(lo: int, hi: int) -> list:
+        """Update the best pair within by_x[lo:hi], returning it sorted by y"""
+
+        if hi - lo <= 3:
+            for a in range(lo, hi):
+                for b in range(a+1, hi):
+                    d = distance(coords[by_x[a]], coords[by_x[b]])
+                    if d < best[0]:
+                        best[:] = d, by_x[a], by_x[b]
+            return sorted(by_x[lo:hi], key=by_y)
+
+        mid = (lo + hi) // 2
+        mid_x = coords[by_x[mid]][0]
+        merged = list(merge(solve(lo, mid), solve(mid, hi), key=by_y))
+
+        # Only points within the best distance of the dividing line can form
+        # a closer pair, and only while their y-values are that close
+        strip = [i for i in merged if abs(coords[i][0] - mid_x) < best[0]]
+        for a, i in enumerate(strip):
+            for j in strip[a+1:]:
+                if coords[j][axis] - coords[i][axis] >= best[0]:
+                    break
+                d = distance(coords[i], coords[j])
+                if d < best[0]:
+                    best[:] = d, i, j
+        return merged
+
+    solve(0, len(coords))
+    return best[0], points[best[1]], points[best[2]]
@@ -0,0 +1,8 @@
+"""
+This module provides a selection of spatial indexes used to query large
+collections of geometric objects
+"""
+
+from .kdtree import KDTree
+from .spatialhash import SpatialHash
+from .rtree import RTree
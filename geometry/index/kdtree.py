@@ -0,0 +1,205 @@
+"""
+This module provides a k-dimensional tree for indexing points which lie in
+n-dimensional space
+"""
+
+from heapq import heappush, heappushpop
+from math import sqrt
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from ..point import Point
+from ..pointarray import PointArray
+
+METRICS = ('euclidean', 'manhattan')
+
+
+class _KDNode:
+    """A single node of a KDTree, holding either two children or a leaf of points"""
+
+    __slots__ = ('lower', 'upper', 'axis', 'split', 'left', 'right', 'indices')
+
+    def __init__(self, lower: Tuple[float, ...], upper: Tuple[float, ...]):
+        self.lower = lower
+        self.upper = upper
+        self.axis = 0
+        self.split = 0.0
+        self.left: Optional[_KDNode] = None
+        self.right: Optional[_KDNode] = None
+        self.indices: Optional[np.ndarray] = None
+
+    def is_leaf(self) -> bool:
+        """Predicate method which returns whether self is a leaf node"""
+        return self.indices is not None
+
+
+class KDTree:
+    """
+    A k-dimensional tree which indexes Point, Point2D, LatticePoint or Point3D
+    objects, supporting k-nearest-neighbour, radius and range queries
+    """
+
+    def __init__(self, points: Iterable[Point], leaf_size: int = 16):
+        if leaf_size < 1:
+            raise ValueError('leaf_size must be a positive integer')
+
+        self.points: List[Point] = list(points)
+        self.leaf_size = leaf_size
+        self._coords = PointArray.from_points(self.points).coords.astype(float)
+        self._root = None
+        if self.points:
+            self._root = self._build(np.arange(len(self.points)))
+
+    def __len__(self) -> int:
+        return len(self.points)
+
+    def __iter__(self) -> Iterator[Point]:
+        return iter(self.points)
+
+    def __repr__(self) -> str:
+        dimensions = self._coords.shape[1]
+        return f'{self.__class__.__name__}(size={len(self)},dimensions={dimensions})'
+
+    def _build(self, indices: np.ndarray) -> _KDNode:
+        coords = self._coords[indices]
+        lower, upper = coords.min(axis=0), coords.max(axis=0)
+        node = _KDNode(tuple(lower.tolist()), tuple(upper.tolist()))
+        if len(indices) <= self.leaf_size:
+            node.indices = indices
+            return node
+
+        # Split on the median of the dimension with the largest spread
+        axis = int(np.argmax(upper - lower))
+        mid = len(indices) // 2
+        order = np.argpartition(coords[:, axis], mid)
+        node.axis = axis
+        node.split = float(coords[order[mid], axis])
+        node.left = self._build(indices[order[:mid]])
+        node.right = self._build(indices[order[mid:]])
+        return node
+
+    def _query_point(self, point: Point) -> Tuple[float, ...]:
+        dimensions = self._coords.shape[1]
+        coords = tuple(point.as_tuple())
+        if len(coords) > dimensions:
+            raise ValueError(f'{point.dimensions} dimensional point cannot be '
+                             f'queried against {dimensions} dimensional points')
+        return coords + (0,)*(dimensions-len(coords))
+
+    @staticmethod
+    def _assert_metric(metric: str) -> None:
+        if metric not in METRICS:
+            raise ValueError(f'Unsupported distance metric "{metric}", '
+                             f'expected one of {METRICS}')
+
+    @staticmethod
+    def _box_distance(node: _KDNode, query: Tuple[float, ...], metric: str) -> float:
+        """Returns the minimum distance from query to the bounding box of node"""
+
+        total = 0
+        for q, low, high in zip(query, node.lower, node.upper):
+            if q < low:
+                gap = low - q
+            elif q > high:
+                gap = q - high
+            else:
+                continue
+            total += gap if metric == 'manhattan' else gap*gap
+        return total if metric == 'manhattan' else sqrt(total)
+
+    def _leaf_distances(self, node: _KDNode, query: Tuple[float, ...],
+                        metric: str) -> np.ndarray:
+        diff = self._coords[node.indices] - query
+        if metric == 'manhattan':
+            return np.abs(diff).sum(axis=1)
+        return np.sqrt((diff**2).sum(axis=1))
+
+    def nearest(self, point: Point, k: int = 1,
+                metric: str = 'euclidean') -> List[Tuple[float, Point]]:
+        """
+        Returns the k indexed points nearest to point as a list of
+        (distance, point) tuples, ordered from nearest to farthest
+        """
+
+        self._assert_metric(metric)
+        if k < 1:
+            raise ValueError('k must be a positive integer')
+        if self._root is None:
+            return []
+
+        query = self._query_point(point)
+        # Max-heap of the best candidates found so far, stored as
+        # (-distance, -index) so that ties favour the earliest points
+        best: List[Tuple[float, int]] = []
+
+        def search(node: _KDNode) -> None:
+            if len(best) == k and self._box_distance(node, query, metric) > -best[0][0]:
+                return
+            if node.is_leaf():
+                distances = self._leaf_distances(node, query, metric)
+                for d, i in zip(distances.tolist(), node.indices.tolist()):
+                    if len(best) < k:
+                        heappush(best, (-d, -i))
+                    elif (-d, -i) > best[0]:
+                        heappushpop(best, (-d, -i))
+                return
+            if query[node.axis] < node.split:
+                search(node.left)
+                search(node.right)
+            else:
+                search(node.right)
+                search(node.left)
+
+        search(self._root)
+        return [(-d, self.points[-i]) for d, i in sorted(best, reverse=True)]
+
+    def within_radius(self, point: Point, radius: float,
+                      metric: str = 'euclidean') -> List[Point]:
+        """Returns the indexed points which lie within radius of point, inclusive"""
+
+        self._assert_metric(metric)
+        if self._root is None:
+            return []
+
+        query = self._query_point(point)
+        found: List[int] = []
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if self._box_distance(node, query, metric) > radius:
+                continue
+            if node.is_leaf():
+                distances = self._leaf_distances(node, query, metric)
+                found.extend(node.indices[distances <= radius].tolist())
+            else:
+                stack.append(node.right)
+                stack.append(node.left)
+        return [self.points[i] for i in sorted(found)]
+
+    def in_bounds(self, lower_bound: Point, upper_bound: Point) -> List[Point]:
+        """
+        Returns the indexed points which lie within the rectangle between two
+        points, with the same semantics as Point.in_bounds: lower_bound is
+        inclusive and upper_bound is exclusive
+        """
+
+        if self._root is None:
+            return []
+
+        lower = np.array(self._query_point(lower_bound))
+        upper = np.array(self._query_point(upper_bound))
+        found: List[int] = []
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if np.any(np.array(node.upper) < lower) or np.any(np.array(node.lower) >= upper):
+                continue
+            if node.is_leaf():
+                coords = self._coords[node.indices]
+                mask = np.all((lower <= coords) & (coords < upper), axis=1)
+                found.extend(node.indices[mask].tolist())
+            else:
+                stack.append(node.right)
+                stack.append(node.left)
+        return [self.points[i] for i in sorted(found)]
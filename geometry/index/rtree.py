@@ -0,0 +1,322 @@
+"""
+This module provides an R-tree for indexing axis-aligned boxes, such as
+rectangles and cuboids
+"""
+
+from math import ceil, prod
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple, Union
+
+from ..d2 import Point2D, Rectangle
+from ..d3 import Cuboid, Point3D
+
+Box = Union[Rectangle, Cuboid]
+_Bounds = Tuple[float, ...]
+
+
+def bounds(box: Box) -> Tuple[_Bounds, _Bounds]:
+    """Returns the lower and upper corners of a Rectangle, Square or Cuboid as tuples"""
+
+    if isinstance(box, Rectangle):
+        return box.low.as_tuple(), box.high.as_tuple()
+    if isinstance(box, Cuboid):
+        lower, upper = box.lower.as_tuple(), box.upper.as_tuple()
+        return tuple(map(min, lower, upper)), tuple(map(max, lower, upper))
+    raise TypeError(f'{box.__class__.__name__} is not a Rectangle or Cuboid')
+
+
+def _overlaps(lower: _Bounds, upper: _Bounds, other_lower: _Bounds, other_upper: _Bounds) -> bool:
+    return all(a <= d and c <= b for a, b, c, d in zip(lower, upper, other_lower, other_upper))
+
+
+def _encloses(lower: _Bounds, upper: _Bounds, other_lower: _Bounds, other_upper: _Bounds) -> bool:
+    return all(a <= c and d <= b for a, b, c, d in zip(lower, upper, other_lower, other_upper))
+
+
+def _volume(lower: _Bounds, upper: _Bounds) -> float:
+    return prod(b - a for a, b in zip(lower, upper))
+
+
+class _Entry:
+    """A box held by the tree, with the order in which it was added"""
+
+    __slots__ = ('lower', 'upper', 'box', 'order')
+
+    def __init__(self, box: Box, order: int):
+        self.lower, self.upper = bounds(box)
+        self.box = box
+        self.order = order
+
+
+class _RNode:
+    """A node of the tree holding either entries or child nodes, and their bounding box"""
+
+    __slots__ = ('children', 'leaf', 'lower', 'upper')
+
+    def __init__(self, children: list, leaf: bool):
+        self.children = children
+        self.leaf = leaf
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Recompute the bounding box of the node from its children"""
+        if self.children:
+            self.lower = tuple(map(min, zip(*(child.lower for child in self.children))))
+            self.upper = tuple(map(max, zip(*(child.upper for child in self.children))))
+        else:
+            self.lower = self.upper = ()
+
+    def entries(self) -> Iterator[_Entry]:
+        """Yield every entry beneath the node"""
+        if self.leaf:
+            yield from self.children
+        else:
+            for child in self.children:
+                yield from child.entries()
+
+
+class RTree:
+    """
+    An R-tree of Rectangles, Squares or Cuboids answering overlap,
+    containment and point-stabbing queries in O(log n + k)
+
+    Boxes given on construction are bulk loaded with Sort-Tile-Recursive
+    packing, and may be added and removed afterwards. Boxes are closed, so
+    those which only touch overlap, and are tracked by identity so that they
+    need not be hashable. Query results are returned in insertion order
+    """
+
+    def __init__(self, boxes: Iterable[Box] = (), max_entries: int = 16):
+        if max_entries < 4:
+            raise ValueError('max_entries must be at least 4')
+        self.max_entries = max_entries
+        self.min_entries = max(2, int(max_entries * 0.4))
+        self.dimensions: Optional[int] = None
+        self._count = 0
+        self._size = 0
+        entries = [self._entry(box) for box in boxes]
+        self._root = self._bulk_load(entries) if entries else _RNode([], True)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[Box]:
+        return iter(self._sorted(self._root.entries()))
+
+    def __contains__(self, box: Box) -> bool:
+        return self._find(box) is not None
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(size={len(self)},height={self.height()})'
+
+    def height(self) -> int:
+        """Returns the number of levels of nodes in the tree"""
+        node, levels = self._root, 1
+        while not node.leaf:
+            node, levels = node.children[0], levels + 1
+        return levels
+
+    def _entry(self, box: Box) -> _Entry:
+        entry = _Entry(box, self._count)
+        if self.dimensions is None:
+            self.dimensions = len(entry.lower)
+        elif len(entry.lower) != self.dimensions:
+            raise ValueError(f'Box has {len(entry.lower)} dimensions, '
+                             f'but the tree holds boxes of {self.dimensions}')
+        self._count += 1
+        self._size += 1
+        return entry
+
+    def _tiles(self, items: list, axis: int) -> List[list]:
+        """Sort-Tile-Recursive grouping of items into runs of at most max_entries"""
+
+        size = self.max_entries
+        items.sort(key=lambda item: item.lower[axis] + item.upper[axis])
+        if axis == self.dimensions - 1 or len(items) <= size:
+            return [items[i:i+size] for i in range(0, len(items), size)]
+        slabs = ceil(ceil(len(items) / size) ** (1 / (self.dimensions - axis)))
+        per_slab = ceil(len(items) / slabs)
+        return [tile for i in range(0, len(items), per_slab)
+                for tile in self._tiles(items[i:i+per_slab], axis+1)]
+
+    def _bulk_load(self, entries: List[_Entry]) -> _RNode:
+        nodes = [_RNode(tile, True) for tile in self._tiles(entries, 0)]
+        while len(nodes) > 1:
+            nodes = [_RNode(tile, False) for tile in self._tiles(nodes, 0)]
+        return nodes[0]
+
+    def insert(self, box: Box) -> None:
+        """Add box to the tree"""
+        self._insert(self._entry(box))
+
+    def _insert(self, entry: _Entry) -> None:
+        sibling = self._insert_into(self._root, entry)
+        if sibling is not None:
+            self._root = _RNode([self._root, sibling], False)
+
+    def _insert_into(self, node: _RNode, entry: _Entry) -> Optional[_RNode]:
+        """Insert entry beneath node, returning the new sibling of node if it was split"""
+
+        if node.leaf:
+            node.children.append(entry)
+        else:
+            def cost(child: _RNode) -> Tuple[float, float]:
+                volume = _volume(child.lower, child.upper)
+                enlarged = _volume(tuple(map(min, child.lower, entry.lower)),
+                                   tuple(map(max, child.upper, entry.upper)))
+                return enlarged - volume, volume
+
+            sibling = self._insert_into(min(node.children, key=cost), entry)
+            if sibling is not None:
+                node.children.append(sibling)
+        if len(node.children) > self.max_entries:
+            return self._split(node)
+        node.refresh()
+        return None
+
+    @staticmethod
+    def _split(node: _RNode) -> _RNode:
+        """
+        Split the children of node in half along the axis in which their
+        centers are most spread, returning the new node holding the upper half
+        """
+
+        children = node.children
+        centers = [[a + b for a, b in zip(child.lower, child.upper)] for child in children]
+        axis = max(range(len(centers[0])),
+                   key=lambda i: max(c[i] for c in centers) - min(c[i] for c in centers))
+        children.sort(key=lambda child: child.lower[axis] + child.upper[axis])
+        half = len(children) // 2
+        node.children = children[:half]
+        node.refresh()
+        return _RNode(children[half:], node.leaf)
+
+    def _find(self, box: Box) -> Optional[List[_RNode]]:
+        """Returns the path of nodes from the root to the leaf holding box"""
+
+        if not self._size:
+            return None
+        lower, upper = bounds(box)
+
+        def search(node: _RNode) -> Optional[List[_RNode]]:
+            if node.leaf:
+                return [node] if any(entry.box is box for entry in node.children) else None
+            for child in node.children:
+                if _encloses(child.lower, child.upper, lower, upper):
+                    path = search(child)
+                    if path is not None:
+                        return [node] + path
+            return None
+
+        return search(self._root)
+
+    def remove(self, box: Box) -> None:
+        """Remove box from the tree, raising a KeyError if it is not present"""
+
+        path = self._find(box)
+        if path is None:
+            raise KeyError(box)
+        leaf = path[-1]
+        leaf.children = [entry for entry in leaf.children if entry.box is not box]
+        self._size -= 1
+
+        # Dissolve nodes left with too few children, re-inserting their entries
+        orphans: List[_Entry] = []
+        for node, parent in zip(reversed(path[1:]), reversed(path[:-1])):
+            if len(node.children) < self.min_entries:
+                parent.children.remove(node)
+                orphans.extend(node.entries())
+            else:
+                node.refresh()
+        self._root.refresh()
+        while not self._root.leaf and len(self._root.children) <= 1:
+            self._root = self._root.children[0] if self._root.children else _RNode([], True)
+        for entry in orphans:
+            self._insert(entry)
+
+    def discard(self, box: Box) -> None:
+        """Remove box from the tree if it is present"""
+        if box in self:
+            self.remove(box)
+
+    @staticmethod
+    def _sorted(entries: Iterable[_Entry]) -> List[Box]:
+        return [entry.box for entry in sorted(entries, key=lambda entry: entry.order)]
+
+    def _search(self, prune: Callable[[_Bounds, _Bounds], bool],
+                match: Callable[[_Bounds, _Bounds], bool]) -> Iterator[_Entry]:
+        """
+        Yield the entries which match, descending only into nodes whose
+        bounding boxes are not pruned
+        """
+
+        if not self._size or not prune(self._root.lower, self._root.upper):
+            return
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if node.leaf:
+                yield from (entry for entry in node.children if match(entry.lower, entry.upper))
+            else:
+                stack.extend(child for child in node.children if prune(child.lower, child.upper))
+
+    def _query_bounds(self, box: Box) -> Tuple[_Bounds, _Bounds]:
+        lower, upper = bounds(box)
+        if self.dimensions is not None and len(lower) != self.dimensions:
+            raise ValueError(f'Query has {len(lower)} dimensions, '
+                             f'but the tree holds boxes of {self.dimensions}')
+        return lower, upper
+
+    def overlapping(self, box: Box) -> List[Box]:
+        """Returns the boxes in the tree which overlap box, including those which touch it"""
+
+        lower, upper = self._query_bounds(box)
+
+        def overlaps(a: _Bounds, b: _Bounds) -> bool:
+            return _overlaps(a, b, lower, upper)
+
+        return self._sorted(self._search(overlaps, overlaps))
+
+    def within(self, box: Box) -> List[Box]:
+        """Returns the boxes in the tree which lie entirely within box, edges included"""
+
+        lower, upper = self._query_bounds(box)
+        return self._sorted(self._search(lambda a, b: _overlaps(a, b, lower, upper),
+                                         lambda a, b: _encloses(lower, upper, a, b)))
+
+    def enclosing(self, box: Box) -> List[Box]:
+        """Returns the boxes in the tree which box lies entirely within, edges included"""
+
+        lower, upper = self._query_bounds(box)
+
+        def encloses(a: _Bounds, b: _Bounds) -> bool:
+            return _encloses(a, b, lower, upper)
+
+        return self._sorted(self._search(encloses, encloses))
+
+    def containing(self, point: Union[Point2D, Point3D]) -> List[Box]:
+        """Returns the boxes in the tree which contain point, edges included"""
+
+        coords = point.as_tuple()
+        if self.dimensions is not None and len(coords) != self.dimensions:
+            raise ValueError(f'Point has {len(coords)} dimensions, '
+                             f'but the tree holds boxes of {self.dimensions}')
+
+        def contains(a: _Bounds, b: _Bounds) -> bool:
+            return _encloses(a, b, coords, coords)
+
+        return self._sorted(self._search(contains, contains))
+
+    def overlapping_pairs(self) -> Iterator[Tuple[Box, Box]]:
+        """
+        Yield each pair of boxes in the tree which overlap exactly once, in
+        insertion order within each pair, without comparing every pair
+        """
+
+        for entry in sorted(self._root.entries(), key=lambda entry: entry.order):
+            def overlaps(a: _Bounds, b: _Bounds, entry: _Entry = entry) -> bool:
+                return _overlaps(a, b, entry.lower, entry.upper)
+
+            later = [other for other in self._search(overlaps, overlaps)
+                     if other.order > entry.order]
+            for other in sorted(later, key=lambda other: other.order):
+                yield entry.box, other.box
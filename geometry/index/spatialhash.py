@@ -0,0 +1,172 @@
+"""
+This module provides a uniform spatial hash grid for dynamic collections of
+objects which lie on the x-y plane
+"""
+
+from math import floor
+from typing import Any, Dict, Iterator, List, Tuple
+
+from ..d2 import FrozenLatticePoint, Point2D
+
+# Offsets to the cells which follow a cell, such that visiting each cell and
+# these neighbours visits every pair of adjacent cells exactly once
+_FORWARD_OFFSETS = ((1, -1), (1, 0), (1, 1), (0, 1))
+
+
+class SpatialHash:
+    """
+    A uniform grid of square cells of side cell_size, keyed by LatticePoint
+    cell coordinates, for broad-phase proximity checks between objects
+
+    Objects may be points themselves or any object with a position attribute,
+    such as a MovingObject, and are tracked by identity so that they need not
+    be hashable
+    """
+
+    def __init__(self, cell_size: float = 1):
+        if cell_size <= 0:
+            raise ValueError('cell_size must be positive')
+        self.cell_size = cell_size
+        self._cells: Dict[FrozenLatticePoint, Dict[int, Any]] = {}
+        self._cell_of: Dict[int, FrozenLatticePoint] = {}
+        self._objects: Dict[int, Any] = {}
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(list(self._objects.values()))
+
+    def __contains__(self, obj: Any) -> bool:
+        return id(obj) in self._objects
+
+    def __repr__(self) -> str:
+        return (f'{self.__class__.__name__}(cell_size={self.cell_size},'
+                f'size={len(self)},cells={len(self._cells)})')
+
+    @staticmethod
+    def position(obj: Any) -> Point2D:
+        """Returns the position of obj, which is obj itself for points"""
+        return getattr(obj, 'position', obj)
+
+    def cell(self, position: Point2D) -> FrozenLatticePoint:
+        """Returns the coordinates of the cell containing position"""
+        size = self.cell_size
+        return FrozenLatticePoint(floor(position.x / size), floor(position.y / size))
+
+    def objects_in_cell(self, cell: FrozenLatticePoint) -> List[Any]:
+        """Returns the objects in the cell with the given coordinates"""
+        return list(self._cells.get(cell, {}).values())
+
+    def _add(self, key: int, obj: Any, cell: FrozenLatticePoint) -> None:
+        bucket = self._cells.get(cell)
+        if bucket is None:
+            bucket = self._cells[cell] = {}
+        bucket[key] = obj
+        self._cell_of[key] = cell
+
+    def _discard(self, key: int) -> None:
+        cell = self._cell_of.pop(key)
+        bucket = self._cells[cell]
+        del bucket[key]
+        if not bucket:
+            del self._cells[cell]
+
+    def insert(self, obj: Any) -> None:
+        """Add obj to the grid, or re-hash it if it is already present"""
+
+        key = id(obj)
+        if key in self._objects:
+            self.move(obj)
+            return
+        self._objects[key] = obj
+        self._add(key, obj, self.cell(self.position(obj)))
+
+    def remove(self, obj: Any) -> None:
+        """Remove obj from the grid, raising a KeyError if it is not present"""
+
+        key = id(obj)
+        if key not in self._objects:
+            raise KeyError(obj)
+        del self._objects[key]
+        self._discard(key)
+
+    def discard(self, obj: Any) -> None:
+        """Remove obj from the grid if it is present"""
+        if obj in self:
+            self.remove(obj)
+
+    def move(self, obj: Any) -> bool:
+        """
+        Re-hash obj after its position has changed, returning whether it moved
+        into a different cell
+        """
+
+        key = id(obj)
+        if key not in self._objects:
+            raise KeyError(obj)
+        cell = self.cell(self.position(obj))
+        if cell == self._cell_of[key]:
+            return False
+        self._discard(key)
+        self._add(key, obj, cell)
+        return True
+
+    def update(self) -> int:
+        """
+        Re-hash every object in the grid, such as after stepping a collection
+        of MovingObjects, returning the number which changed cell
+        """
+        return sum(self.move(obj) for obj in list(self._objects.values()))
+
+    def clear(self) -> None:
+        """Remove every object from the grid"""
+        self._cells.clear()
+        self._cell_of.clear()
+        self._objects.clear()
+
+    def query_radius(self, position: Point2D, radius: float) -> List[Any]:
+        """Returns the objects whose positions lie within radius of position, inclusive"""
+
+        lower = self.cell(Point2D(position.x-radius, position.y-radius))
+        upper = self.cell(Point2D(position.x+radius, position.y+radius))
+        px, py = position.x, position.y
+        limit = radius*radius
+        found = []
+        cells = self._cells
+        for cx in range(lower.x, upper.x+1):
+            for cy in range(lower.y, upper.y+1):
+                bucket = cells.get(FrozenLatticePoint(cx, cy))
+                if bucket is None:
+                    continue
+                for obj in bucket.values():
+                    pos = self.position(obj)
+                    if (pos.x-px)**2 + (pos.y-py)**2 <= limit:
+                        found.append(obj)
+        return found
+
+    def neighbours(self, obj: Any, radius: float) -> List[Any]:
+        """Returns the other objects in the grid within radius of obj"""
+        return [other for other in self.query_radius(self.position(obj), radius)
+                if other is not obj]
+
+    def candidate_pairs(self) -> Iterator[Tuple[Any, Any]]:
+        """
+        Yield each pair of objects which share a cell or lie in adjacent
+        cells exactly once, the candidates for any interaction within
+        cell_size of each other
+        """
+
+        cells = self._cells
+        for cell, bucket in cells.items():
+            objects = list(bucket.values())
+            for i, obj in enumerate(objects):
+                for other in objects[i+1:]:
+                    yield obj, other
+            for dx, dy in _FORWARD_OFFSETS:
+                neighbour = cells.get(FrozenLatticePoint(cell.x+dx, cell.y+dy))
+                if neighbour is None:
+                    continue
+                for obj in objects:
+                    for other in neighbour.values():
+                        yield obj, other
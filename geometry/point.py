@@ -3,15 +3,40 @@ This module provides a class for storing points which lie in n-dimensional
 space
 """
 
-from functools import cached_property
+from functools import lru_cache
+from itertools import product
 from math import ceil, floor
+from operator import add, ge, lt, neg, sub
 from random import uniform
-from typing import Iterable, List, Optional, Tuple, Union
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
 
+import numpy as np
 
-class Point:
+
+@lru_cache(maxsize=None)
+def adjacent_offsets(dimensions: int, diagonals: bool = False) -> Tuple[Tuple[int, ...], ...]:
+    """
+    Returns the offsets from a point to its adjacent points in n-dimensional
+    space, computed once for each dimensionality
+
+    Without diagonals these are the 2n unit steps along each axis, and with
+    diagonals they are all 3^n-1 points of the surrounding hypercube
+    """
+
+    if diagonals:
+        return tuple(offset for offset in product((-1, 0, 1), repeat=dimensions) if any(offset))
+    offsets = []
+    for axis in range(dimensions):
+        for step in (1, -1):
+            offsets.append(tuple(step if i == axis else 0 for i in range(dimensions)))
+    return tuple(offsets)
+
+
+class Point:  # pylint: disable=too-many-public-methods
     """Class for storing points which lie in n-dimensional space"""
 
+    __slots__ = ('_coords',)
+
     def __init__(self, *coords: int):
         self._coords = list(coords)
 
@@ -44,7 +69,7 @@ class Point:
         """Returns the origin of an n-dimensional space"""
         return Point(*((0,)*dimensions))
 
-    @cached_property
+    @property
     def dimensions(self) -> int:
         """Property representing the dimensionality of self"""
         return len(self._coords)
@@ -59,6 +84,10 @@ class Point:
         """Returns a shallow copy of self"""
         return type(self)(*tuple(self._coords))
 
+    def freeze(self) -> 'FrozenPoint':
+        """Returns an immutable copy of self"""
+        return FrozenPoint(*self._coords)
+
     def __add__(self, other: 'Point') -> 'Point':
         iterations = max(self.dimensions, other.dimensions)
         t = (self[i]+other[i] for i in range(iterations))
@@ -180,17 +209,52 @@ class Point:
         within a bound
         """
 
-        if lower_bound is not None:
-            points = filter(lambda x: lower_bound <= x, points)
-        if upper_bound is not None:
-            points = filter(lambda x: x < upper_bound, points)
-        return list(points)
+        # pylint: disable=unnecessary-dunder-call
+        # Comparisons are invoked directly, as Python would otherwise prefer
+        # the reflected __ge__/__gt__ of a point subclass (such as a frozen
+        # point compared with a mutable bound), which are not reflections
+        if lower_bound is None and upper_bound is None:
+            return list(points)
+        if lower_bound is None:
+            return [pt for pt in points if pt.__lt__(upper_bound)]
+        if upper_bound is None:
+            return [pt for pt in points if lower_bound.__le__(pt)]
+        return [pt for pt in points
+                if lower_bound.__le__(pt) and pt.__lt__(upper_bound)]
+
+    def iter_adjacent_points(self, diagonals: bool = False,
+                             lower_bound: Optional['Point'] = None,
+                             upper_bound: Optional['Point'] = None) -> Iterator['Point']:
+        """
+        Lazily yield the adjacent lattice points of a given point which lie
+        within a bound, lower_bound inclusive and upper_bound exclusive
+        """
+
+        coords = tuple(self._coords)
+        dimensions = len(coords)
+        lower = None if lower_bound is None else [lower_bound[i] for i in range(dimensions)]
+        upper = None if upper_bound is None else [upper_bound[i] for i in range(dimensions)]
+        point_type = type(self)
+        for offset in adjacent_offsets(dimensions, diagonals):
+            adj = tuple(map(add, coords, offset))
+            if lower is not None and any(map(lt, adj, lower)):
+                continue
+            if upper is not None and any(map(ge, adj, upper)):
+                continue
+            yield point_type(*adj)
+
+    def get_adjacent_points(self, diagonals: bool = False,
+                            lower_bound: Optional['Point'] = None,
+                            upper_bound: Optional['Point'] = None) -> List['Point']:
+        """Returns the adjacent lattice points of a given point"""
+        return list(self.iter_adjacent_points(diagonals, lower_bound, upper_bound))
 
     def in_bounds(self, lower_bound: 'Point', upper_bound: 'Point') -> bool:
         """
         Returns whether a point lies within the rectangle between two points
         """
-        return lower_bound <= self < upper_bound
+        # pylint: disable=unnecessary-dunder-call
+        return lower_bound.__le__(self) and self.__lt__(upper_bound)
 
     def clamp_bounds(self, lower_bound: 'Point', upper_bound: 'Point') -> 'Point':
         """
@@ -218,6 +282,22 @@ class Point:
             coords.append(uniform(lower_bound[i], upper_bound[i]))
         return cls(*coords)
 
+    @classmethod
+    def random_many(cls, n: int, lower_bound: 'Point', upper_bound: 'Point',
+                    seed: Optional[Union[int, np.random.Generator]] = None) -> List['Point']:
+        """
+        Returns n random points which lie in the rectangle between two bounds,
+        drawn in a single vectorized call
+
+        seed may be an integer or a numpy Generator, for reproducible draws
+        """
+
+        iterations = max(lower_bound.dimensions, upper_bound.dimensions)
+        lower = [lower_bound[i] for i in range(iterations)]
+        upper = [upper_bound[i] for i in range(iterations)]
+        coords = np.random.default_rng(seed).uniform(lower, upper, size=(n, iterations))
+        return [cls(*row) for row in coords.tolist()]
+
     def volume(self, other: 'Point') -> float:
         """Returns the volume of the cuboid created by self and other"""
         prod = 1
@@ -274,3 +354,94 @@ class Point:
     def w(self, value: float) -> None:
         self._assert_dimension(4, 'w')
         self._coords[3] = value
+
+
+class FrozenPoint(Point):
+    """
+    Immutable, tuple-backed variant of Point which is cheap to allocate and
+    hash, intended for use as a dictionary key or in tight loops
+    """
+
+    __slots__ = ()
+
+    def __init__(self, *coords: float):  # pylint: disable=super-init-not-called
+        self._coords = coords
+
+    def __setitem__(self, index: int, value: float) -> None:
+        raise TypeError(f'{self.__class__.__name__} does not support item assignment')
+
+    def copy(self) -> 'FrozenPoint':
+        """Returns self, as frozen points cannot be modified"""
+        return self
+
+    def freeze(self) -> 'FrozenPoint':
+        """Returns self, as frozen points cannot be modified"""
+        return self
+
+    def thaw(self) -> Point:
+        """Returns a mutable copy of self"""
+        return Point(*self._coords)
+
+    def __iter__(self):
+        return iter(self._coords)
+
+    def __add__(self, other: Point) -> 'FrozenPoint':
+        if len(self._coords) != len(other._coords):
+            return super().__add__(other)
+        return type(self)(*map(add, self._coords, other._coords))
+
+    def __sub__(self, other: Point) -> 'FrozenPoint':
+        if len(self._coords) != len(other._coords):
+            return super().__sub__(other)
+        return type(self)(*map(sub, self._coords, other._coords))
+
+    def __neg__(self) -> 'FrozenPoint':
+        return type(self)(*map(neg, self._coords))
+
+    def __eq__(self, other: Point) -> bool:
+        if not isinstance(other, Point):
+            return NotImplemented
+        if len(self._coords) != len(other._coords):
+            return super().__eq__(other)
+        return self._coords == tuple(other._coords)
+
+    def __hash__(self) -> int:
+        return hash(self._coords)
+
+    def __mul__(self, scalar: float) -> 'FrozenPoint':
+        return type(self)(*(c*scalar for c in self._coords))
+
+    def __truediv__(self, scalar: float) -> 'FrozenPoint':
+        return type(self)(*(c/scalar for c in self._coords))
+
+    def __floordiv__(self, scalar: float) -> 'FrozenPoint':
+        return type(self)(*(c//scalar for c in self._coords))
+
+    def __mod__(self, divisor: Point) -> 'FrozenPoint':
+        return type(self)(*(c % divisor[i] for i, c in enumerate(self._coords)))
+
+    def __abs__(self) -> 'FrozenPoint':
+        return type(self)(*map(abs, self._coords))
+
+    def __floor__(self) -> 'FrozenPoint':
+        return type(self)(*map(floor, self._coords))
+
+    def __ceil__(self) -> 'FrozenPoint':
+        return type(self)(*map(ceil, self._coords))
+
+    def clamp_bounds(self, lower_bound: Point, upper_bound: Point) -> 'FrozenPoint':
+        """
+        Returns a point clamped within a rectangle between two points
+        """
+        coords = []
+        for i, c in enumerate(self._coords):
+            if c < lower_bound[i]:
+                c = lower_bound[i]
+            elif c > upper_bound[i]:
+                c = upper_bound[i]
+            coords.append(c)
+        return type(self)(*coords)
+
+    def as_tuple(self) -> Tuple[float]:
+        """Returns a tuple representing self"""
+        return self._coords
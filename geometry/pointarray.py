@@ -0,0 +1,306 @@
+"""
+This module provides a class for storing and evaluating many points which lie
+in n-dimensional space at once
+"""
+
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Type, Union
+
+import numpy as np
+
+from .point import Point
+
+Operand = Union['PointArray', Point, np.ndarray]
+Points = Union['PointArray', np.ndarray, Iterable[Point]]
+
+
+class PointArray:
+    """
+    Class for storing a collection of n-dimensional points as the rows of a
+    single N×D array, providing vectorized versions of the methods of Point
+    """
+
+    def __init__(self, coords: Union[np.ndarray, Iterable[Iterable[float]]],
+                 point_type: Type[Point] = Point):
+        coords = np.asarray(coords)
+        if coords.ndim == 1 and coords.size == 0:
+            coords = coords.reshape(0, 0)
+        if coords.ndim != 2:
+            raise ValueError(f'{self.__class__.__name__} coordinates must be a '
+                             f'2-dimensional array, {coords.ndim} dimensions provided')
+        self.coords = coords
+        self.point_type = point_type
+
+    @classmethod
+    def from_points(cls, points: Iterable[Point],
+                    point_type: Optional[Type[Point]] = None,
+                    dtype: Optional[np.dtype] = None) -> 'PointArray':
+        """
+        Build an array from an iterable of points, padding points of lower
+        dimensionality with zeros
+
+        If no point_type is provided, the type of the first point is used
+        """
+
+        points = list(points)
+        if point_type is None:
+            point_type = type(points[0]) if points else Point
+        dimensions = max((p.dimensions for p in points), default=0)
+        rows = [p.as_tuple() for p in points]
+        if any(len(row) != dimensions for row in rows):
+            rows = [tuple(row) + (0,)*(dimensions-len(row)) for row in rows]
+        coords = np.array(rows, dtype=dtype).reshape(len(rows), dimensions)
+        return cls(coords, point_type)
+
+    @classmethod
+    def random(cls, n: int, lower_bound: Point, upper_bound: Point, *,
+               seed: Optional[Union[int, np.random.Generator]] = None,
+               point_type: Optional[Type[Point]] = None,
+               integer: bool = False) -> 'PointArray':
+        """
+        Returns an array of n random points which lie in the rectangle between
+        two bounds, drawn in a single vectorized call
+
+        Coordinates are floats, or integers when integer is set, with
+        lower_bound inclusive and upper_bound exclusive. seed may be an
+        integer or a numpy Generator, for reproducible draws. If no point_type
+        is provided, the type of lower_bound is used
+        """
+
+        if point_type is None:
+            point_type = type(lower_bound)
+        dimensions = max(lower_bound.dimensions, upper_bound.dimensions)
+        lower = [lower_bound[i] for i in range(dimensions)]
+        upper = [upper_bound[i] for i in range(dimensions)]
+        rng = np.random.default_rng(seed)
+        if integer:
+            coords = rng.integers(lower, upper, size=(n, dimensions))
+        else:
+            coords = rng.uniform(lower, upper, size=(n, dimensions))
+        return cls(coords, point_type)
+
+    def to_points(self, point_type: Optional[Type[Point]] = None) -> List[Point]:
+        """
+        Returns a list of points representing the rows of self
+
+        point_type overrides the type of the points created, which is required
+        when the coordinates no longer suit the original type, such as
+        dividing an array of LatticePoints
+        """
+
+        if point_type is None:
+            point_type = self.point_type
+        return [point_type(*row) for row in self.coords.tolist()]
+
+    @property
+    def dimensions(self) -> int:
+        """Property representing the dimensionality of the points in self"""
+        return self.coords.shape[1]
+
+    def __len__(self) -> int:
+        return self.coords.shape[0]
+
+    def __iter__(self) -> Iterator[Point]:
+        point_type = self.point_type
+        for row in self.coords.tolist():
+            yield point_type(*row)
+
+    def __getitem__(self, key: Union[int, slice, np.ndarray]) -> Union[Point, 'PointArray']:
+        if isinstance(key, (int, np.integer)):
+            return self.point_type(*self.coords[key].tolist())
+        return self._new(self.coords[key])
+
+    def __array__(self, dtype: Optional[np.dtype] = None, copy: Optional[bool] = None):
+        if dtype is not None and dtype != self.coords.dtype:
+            return self.coords.astype(dtype)
+        if copy:
+            return self.coords.copy()
+        return self.coords
+
+    def __repr__(self) -> str:
+        return (f'{self.__class__.__name__}(size={len(self)},dimensions={self.dimensions},'
+                f'type={self.point_type.__name__})')
+
+    def copy(self) -> 'PointArray':
+        """Returns a copy of self which does not share the underlying array"""
+        return self._new(self.coords.copy())
+
+    def _new(self, coords: np.ndarray) -> 'PointArray':
+        return type(self)(coords, self.point_type)
+
+    def _operand(self, other: Operand) -> np.ndarray:
+        if isinstance(other, PointArray):
+            return other.coords
+        if isinstance(other, Point):
+            coords = other.as_tuple()
+            if len(coords) > self.dimensions:
+                raise ValueError(f'{other.dimensions} dimensional point cannot be '
+                                 f'combined with {self.dimensions} dimensional points')
+            return np.array(tuple(coords) + (0,)*(self.dimensions-len(coords)))
+        return np.asarray(other)
+
+    def __add__(self, other: Operand) -> 'PointArray':
+        return self._new(self.coords + self._operand(other))
+
+    def __radd__(self, other: Operand) -> 'PointArray':
+        return self._new(self._operand(other) + self.coords)
+
+    def __sub__(self, other: Operand) -> 'PointArray':
+        return self._new(self.coords - self._operand(other))
+
+    def __rsub__(self, other: Operand) -> 'PointArray':
+        return self._new(self._operand(other) - self.coords)
+
+    def __neg__(self) -> 'PointArray':
+        return self._new(-self.coords)
+
+    def __abs__(self) -> 'PointArray':
+        return self._new(np.abs(self.coords))
+
+    def __mul__(self, scalar: float) -> 'PointArray':
+        return self._new(self.coords * scalar)
+
+    def __rmul__(self, scalar: float) -> 'PointArray':
+        return self._new(scalar * self.coords)
+
+    def __truediv__(self, scalar: float) -> 'PointArray':
+        return self._new(self.coords / scalar)
+
+    def __floordiv__(self, scalar: float) -> 'PointArray':
+        return self._new(self.coords // scalar)
+
+    def manhattan_distance(self, other: Operand) -> np.ndarray:
+        """Returns the manhattan distance between each point and other"""
+        return np.abs(self.coords - self._operand(other)).sum(axis=1)
+
+    def euclidean_distance(self, other: Operand) -> np.ndarray:
+        """Returns the actual distance between each point and other"""
+        return np.sqrt(((self.coords - self._operand(other))**2).sum(axis=1))
+
+    def midpoint(self, other: Operand) -> 'PointArray':
+        """Returns the midpoints between each point and other"""
+        return (self + other) / 2
+
+    def magnitude(self) -> np.ndarray:
+        """Returns the magnitude of each point"""
+        return np.sqrt((self.coords**2).sum(axis=1))
+
+    def in_bounds(self, lower_bound: Operand, upper_bound: Operand) -> np.ndarray:
+        """
+        Returns a boolean mask of the points which lie within the rectangle
+        between two points, lower_bound inclusive and upper_bound exclusive
+        """
+        lower, upper = self._operand(lower_bound), self._operand(upper_bound)
+        return np.all((lower <= self.coords) & (self.coords < upper), axis=1)
+
+    def bounded_mask(self, lower_bound: Optional[Operand] = None,
+                     upper_bound: Optional[Operand] = None) -> np.ndarray:
+        """
+        Returns a boolean mask of the points which lie within a bound, with
+        the same semantics as Point.bounded_filter, so that points and bounds
+        of differing dimensionality are compared as if padded with zeros
+        """
+
+        dimensions = max([self.dimensions] + [bound.dimensions for bound in
+                                              (lower_bound, upper_bound)
+                                              if isinstance(bound, Point)])
+        coords = self.coords
+        if dimensions > self.dimensions:
+            coords = np.pad(coords, ((0, 0), (0, dimensions-self.dimensions)))
+
+        def operand(bound: Operand) -> np.ndarray:
+            if isinstance(bound, Point):
+                return np.array(tuple(bound.as_tuple()) + (0,)*(dimensions-bound.dimensions))
+            return self._operand(bound)
+
+        mask = np.ones(len(self), dtype=bool)
+        if lower_bound is not None:
+            mask &= np.all(operand(lower_bound) <= coords, axis=1)
+        if upper_bound is not None:
+            mask &= np.all(coords < operand(upper_bound), axis=1)
+        return mask
+
+    def bounded_filter(self, lower_bound: Optional[Operand] = None,
+                       upper_bound: Optional[Operand] = None) -> 'PointArray':
+        """Returns the points which lie within a bound"""
+        return self[self.bounded_mask(lower_bound, upper_bound)]
+
+    def clamp_bounds(self, lower_bound: Operand, upper_bound: Operand) -> 'PointArray':
+        """Returns the points clamped within a rectangle between two points"""
+        lower, upper = self._operand(lower_bound), self._operand(upper_bound)
+        coords = np.where(self.coords < lower, lower,
+                          np.where(self.coords > upper, upper, self.coords))
+        return self._new(coords)
+
+
+def as_coords(points: Points) -> np.ndarray:
+    """
+    Returns the coordinates of a PointArray, an N×D array or an iterable of
+    points as an N×D array, without copying where possible
+    """
+
+    if isinstance(points, PointArray):
+        return points.coords
+    if isinstance(points, np.ndarray):
+        if points.ndim != 2:
+            raise ValueError(f'Point coordinates must be a 2-dimensional array, '
+                             f'{points.ndim} dimensions provided')
+        return points
+    return PointArray.from_points(points).coords
+
+
+def bounded_mask(points: Union[PointArray, Iterable[Point]],
+                 lower_bound: Optional[Point] = None,
+                 upper_bound: Optional[Point] = None) -> np.ndarray:
+    """
+    Takes a PointArray or an iterable of points, and returns a boolean mask of
+    the points which lie within a bound, computed in a single vectorized pass
+    """
+
+    if not isinstance(points, PointArray):
+        points = list(points)
+        if not points:
+            return np.zeros(0, dtype=bool)
+        points = PointArray.from_points(points)
+    return points.bounded_mask(lower_bound, upper_bound)
+
+
+def bounded_filter(points: Union[PointArray, Iterable[Point]],
+                   lower_bound: Optional[Point] = None,
+                   upper_bound: Optional[Point] = None
+                   ) -> Union[PointArray, List[Point]]:
+    """
+    Takes a PointArray or an iterable of points, and returns the points which
+    lie within a bound
+
+    A PointArray is filtered into a new PointArray, while any other iterable
+    is filtered into a list of the original point objects
+    """
+
+    if isinstance(points, PointArray):
+        return points.bounded_filter(lower_bound, upper_bound)
+    points = list(points)
+    if not points:
+        return []
+    mask = bounded_mask(points, lower_bound, upper_bound)
+    return [pt for pt, keep in zip(points, mask.tolist()) if keep]
+
+
+def iter_bounded_filter(points: Iterable[Point],
+                        lower_bound: Optional[Point] = None,
+                        upper_bound: Optional[Point] = None,
+                        chunk_size: int = 65536) -> Iterator[Point]:
+    """
+    Lazily yield the points of an iterable which lie within a bound, filtering
+    chunk_size points at a time so that inputs of any length can be streamed
+    """
+
+    if chunk_size < 1:
+        raise ValueError('chunk_size must be a positive integer')
+
+    points = iter(points)
+    while True:
+        chunk = list(islice(points, chunk_size))
+        if not chunk:
+            return
+        yield from bounded_filter(chunk, lower_bound, upper_bound)
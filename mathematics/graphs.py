@@ -2,7 +2,7 @@
 This module provides a class for a Graph with path related methods
 """
 
-from typing import Callable, Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 
 from networkx import Graph
 from networkx.algorithms.shortest_paths import shortest_path_length
@@ -28,6 +28,21 @@ class PathGraph(Graph):
                 self.add_edge(node, nodes[j],
                               weight=weight_function(node, nodes[j]))
 
+    def add_weighted_edges_from_matrix(self, weights: Sequence[Sequence[int]],
+                                       nodes: Optional[List[str]] = None) -> None:
+        """
+        Add weighted edges to a graph from a precomputed matrix of weights,
+        such as a distance matrix, creating a complete graph
+        """
+
+        if nodes is None:
+            nodes = list(self.nodes)
+        if hasattr(weights, 'tolist'):
+            weights = weights.tolist()
+        for i, node in enumerate(nodes):
+            for j in range(i+1, len(nodes)):
+                self.add_edge(node, nodes[j], weight=weights[i][j])
+
     def get_length_of_path(self, path: List[str]) -> int:
         """Find the total length of a given path through the graph"""
 
@@ -4,34 +4,51 @@ Provides a function implementing Dijkstra's Algorithm with support of heuristics
 
 
 from queue import PriorityQueue
-from typing import Callable, Optional, TypeVar
+from typing import Callable, Hashable, Optional, TypeVar
 
 from .dijkstraitem import DijkstraItem
 
 T = TypeVar('T')
 
 
+def _identity(node: T) -> T:
+    return node
+
+
 def dijkstra(start: T, target: T,
              adjacency_function: Callable[[T], list[T]],
              validation_function: Optional[Callable[[T, T], bool]] = None,
              cost_function: Optional[Callable[[T, T], int]] = None,
              heuristic_function: Optional[Callable[[T, T], int]] = None,
-             max_cost: Optional[int] = None) -> tuple[int, dict[T, T]]:
-    """Perform the shortest path search for the target"""
+             max_cost: Optional[int] = None, *,
+             key_function: Optional[Callable[[T], Hashable]] = None
+             ) -> tuple[int, dict[T, T]]:
+    """
+    Perform the shortest path search for the target
+
+    key_function optionally maps each node to the key used to track visited
+    nodes and their costs, such as Grid.key, which packs a LatticePoint into an
+    integer which is cheaper to hash
+    """
+    # pylint: disable=too-many-locals
+
+    if key_function is None:
+        key_function = _identity
 
     seen = set()
     prev = {}
     q = PriorityQueue()
-    g_scores: dict[T, int] = {start: 0}
+    g_scores: dict[Hashable, int] = {key_function(start): 0}
 
     q.put(DijkstraItem(start, 0, 0))
 
     while not q.empty():
         item: DijkstraItem = q.get()
 
-        if item.payload in seen:
+        key = key_function(item.payload)
+        if key in seen:
             continue
-        seen.add(item.payload)
+        seen.add(key)
 
         if item.payload == target:
             return item.g, prev
@@ -45,8 +62,9 @@ def dijkstra(start: T, target: T,
             if validation_function is None or validation_function(item.payload, adj):
                 if cost_function is not None:
                     g = item.g + cost_function(item.payload, adj)
-                if g < g_scores.get(adj, float('inf')):
-                    g_scores[adj] = g
+                adj_key = key_function(adj)
+                if g < g_scores.get(adj_key, float('inf')):
+                    g_scores[adj_key] = g
                     prev[adj] = item.payload
                     h = DijkstraItem.get_h(adj, target,
                                            heuristic_function)
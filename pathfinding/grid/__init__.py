@@ -3,6 +3,8 @@ This module provides a collection of classes to be used in displaying 2D
 pathfinding which follows a lattice grid
 """
 
+from .densegrid import DenseGrid
 from .expandablegrid import ExpandableGrid
 from .grid import Grid
 from .grid3d import Grid3D
+from .gridview import GridView
@@ -0,0 +1,304 @@
+"""
+This module provides a compact grid class which stores the characters and
+walls of a 2D lattice grid in numpy arrays
+"""
+
+import os
+from mmap import ACCESS_READ, mmap
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+import numpy as np
+
+from ...geometry import FrozenLatticePoint, LatticePoint
+from ..location import Location
+from .grid import Grid, flood_fill_keys, line_spans, subgrid_bounds
+
+
+class DenseGrid:
+    """
+    A grid which stores one byte for the character and one for the
+    passability of each cell rather than a Location object, so that large
+    maps fit in memory
+
+    Locations are built on access, so changes made to a returned Location are
+    not written back to the grid unless it is assigned with __setitem__.
+    Characters are single bytes, decoded as latin-1
+    """
+
+    def __init__(self, chars: np.ndarray, walls: np.ndarray,
+                 offset: Optional[LatticePoint] = None):
+        if chars.ndim != 2 or chars.shape != walls.shape:
+            raise ValueError('Characters and walls must be 2-dimensional arrays of the same shape')
+        self.chars = chars
+        self.walls = walls
+        self.offset = LatticePoint(0, 0) if offset is None else LatticePoint(offset.x, offset.y)
+
+    @classmethod
+    def from_list_of_strings(cls, rows: List[str], wall_char: str = '#',
+                             offset: Optional[LatticePoint] = None) -> 'DenseGrid':
+        """Build a grid from a list of strings of equal length"""
+
+        return cls._from_rows([row.encode('latin-1') for row in rows], wall_char, offset)
+
+    @classmethod
+    def from_bytes(cls, data: Union[bytes, bytearray, memoryview, mmap], wall_char: str = '#',
+                   offset: Optional[LatticePoint] = None) -> 'DenseGrid':
+        """
+        Build a grid from the text of a map, with one row per line, copying
+        each row straight from data into the character array, so that the
+        whole text is never copied
+        """
+
+        spans = line_spans(data)
+        width = spans[0][1] - spans[0][0] if spans else 0
+        if any(end - start != width for start, end in spans):
+            raise ValueError('Rows of a grid must all have the same length')
+        chars = np.empty((len(spans), width), dtype=np.uint8)
+        if width:
+            for row, (start, _) in zip(chars, spans):
+                row[:] = np.frombuffer(data, dtype=np.uint8, count=width, offset=start)
+        return cls(chars, chars == ord(wall_char), offset)
+
+    @classmethod
+    def from_file(cls, path: str, wall_char: str = '#',
+                  offset: Optional[LatticePoint] = None) -> 'DenseGrid':
+        """Build a grid from a text file of a map, which is memory-mapped while it is read"""
+
+        with open(path, 'rb') as file:
+            if not os.fstat(file.fileno()).st_size:
+                return cls.from_bytes(b'', wall_char, offset)
+            with mmap(file.fileno(), 0, access=ACCESS_READ) as data:
+                return cls.from_bytes(data, wall_char, offset)
+
+    @classmethod
+    def _from_rows(cls, rows: List[bytes], wall_char: str,
+                   offset: Optional[LatticePoint]) -> 'DenseGrid':
+        width = len(rows[0]) if rows else 0
+        if any(len(row) != width for row in rows):
+            raise ValueError('Rows of a grid must all have the same length')
+        chars = np.frombuffer(b''.join(rows), dtype=np.uint8)
+        chars = chars.reshape(len(rows), width).copy()
+        return cls(chars, chars == ord(wall_char), offset)
+
+    @classmethod
+    def from_grid(cls, grid: Grid) -> 'DenseGrid':
+        """Build a dense copy of a Grid of Locations"""
+
+        chars = np.array([[ord(loc.rep) for loc in row] for row in grid.grid],
+                         dtype=np.uint8).reshape(grid.height, grid.width)
+        walls = np.array([[not loc.is_passible() for loc in row] for row in grid.grid],
+                         dtype=bool).reshape(grid.height, grid.width)
+        return cls(chars, walls, grid.offset)
+
+    @classmethod
+    def blank(cls, bounds: LatticePoint, offset: Optional[LatticePoint] = None,
+              fill_char: str = '.') -> 'DenseGrid':
+        """Return a blank grid of the given size "bounds" """
+        chars = np.full((bounds.y, bounds.x), ord(fill_char), dtype=np.uint8)
+        return cls(chars, np.zeros(chars.shape, dtype=bool), offset)
+
+    def to_grid(self) -> Grid:
+        """Returns a Grid of Locations holding the same cells as self"""
+        return Grid([[self._location(x, y) for x in range(self.width)]
+                     for y in range(self.height)], LatticePoint(self.offset.x, self.offset.y))
+
+    @property
+    def width(self) -> int:
+        """This property represents the width of the grid"""
+        return self.chars.shape[1]
+
+    @property
+    def height(self) -> int:
+        """This property represents the height of the grid"""
+        return self.chars.shape[0]
+
+    @property
+    def size(self) -> LatticePoint:
+        """This property represents the width and height of the grid"""
+        return LatticePoint(self.width, self.height)
+
+    @property
+    def bounds(self) -> Tuple[LatticePoint, LatticePoint]:
+        """This property represents the lower and upper bounds of the grid"""
+        return self.offset, self.offset+self.size
+
+    def _location(self, x: int, y: int) -> Location:
+        """Build the Location at row y and column x of the arrays"""
+        return Location(x+self.offset.x, y+self.offset.y,
+                        Location.IMPASSABLE if self.walls[y, x] else Location.OPEN,
+                        chr(self.chars[y, x]))
+
+    def _index(self, pt: LatticePoint) -> Tuple[int, int]:
+        if not isinstance(pt, LatticePoint):
+            raise TypeError(
+                f'Grid accessor must be of type Point, type {type(pt)} provided')
+        x, y = pt.x-self.offset.x, pt.y-self.offset.y
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            raise KeyError('Point not located on the grid')
+        return y, x
+
+    def __getitem__(self, key: Union[LatticePoint, slice]) -> Union[Location, 'DenseGrid']:
+        if isinstance(key, LatticePoint):
+            y, x = self._index(key)
+            return self._location(x, y)
+        if isinstance(key, slice):
+            if key.step is not None:
+                raise NotImplementedError(f'{self.__class__.__name__}.__getitem__ '
+                                          'cannot accept slices with a step value')
+            return self.subgrid(key.start, key.stop)
+        raise TypeError(f'{self.__class__.__name__}.__getitem__ cannot '
+                        f'accept accessors of type {type(key)}')
+
+    def __setitem__(self, pt: LatticePoint, value: Union[Location, str]) -> None:
+        """
+        Assign a Location, setting both the character and the passability of
+        the cell, or a character, leaving the passability unchanged
+        """
+
+        y, x = self._index(pt)
+        if isinstance(value, Location):
+            self.walls[y, x] = not value.is_passible()
+            value = value.rep
+        self.chars[y, x] = ord(value)
+
+    def __contains__(self, pt: LatticePoint) -> bool:
+        if not isinstance(pt, LatticePoint):
+            raise TypeError(
+                f'Grid accessor must be of type Point, type {type(pt)} provided')
+        return 0 <= pt.x-self.offset.x < self.width and 0 <= pt.y-self.offset.y < self.height
+
+    def __iter__(self) -> Iterable[Location]:
+        for y in range(self.height):
+            for x in range(self.width):
+                yield self._location(x, y)
+
+    def __eq__(self, other: 'DenseGrid') -> bool:
+        return isinstance(other, DenseGrid) and self.offset == other.offset \
+            and np.array_equal(self.chars, other.chars) \
+            and np.array_equal(self.walls, other.walls)
+
+    def __str__(self) -> str:
+        return self.to_string()
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(offset={self.offset},size={self.size})'
+
+    def is_passible(self, pt: LatticePoint) -> bool:
+        """Returns whether the cell at pt is passible, without building its Location"""
+        y, x = self._index(pt)
+        return not self.walls[y, x]
+
+    def key(self, pt: LatticePoint) -> int:
+        """
+        Returns the packed integer key of a point on the grid, which is
+        cheaper to hash and compare than the point itself
+        """
+        y, x = self._index(pt)
+        return x + y*self.width
+
+    def point(self, key: int) -> FrozenLatticePoint:
+        """Returns the point represented by a packed integer key"""
+
+        if not 0 <= key < self.width*self.height:
+            raise KeyError('Key not located on the grid')
+        y, x = divmod(key, self.width)
+        return FrozenLatticePoint.interned(x+self.offset.x, y+self.offset.y)
+
+    def copy(self) -> 'DenseGrid':
+        """This method returns a deep copy of self"""
+        return type(self)(self.chars.copy(), self.walls.copy(), self.offset)
+
+    def char_positions(self, chars: Iterable[str]) -> Dict[str, List[LatticePoint]]:
+        """
+        Return a list of points for each character passed in the "chars" list
+        which represents the list of positions in which that character can be
+        found on the grid, ordered by x and then y
+        """
+
+        mapping: Dict[str, List[LatticePoint]] = {}
+        for char in chars:
+            xs, ys = np.nonzero(self.chars.T == ord(char))
+            mapping[char] = [LatticePoint(x, y) for x, y in zip(
+                (xs + self.offset.x).tolist(), (ys + self.offset.y).tolist())]
+        return mapping
+
+    def to_string(self, separator: str = ' ') -> str:
+        """Returns a string representation with an arbitrary separator"""
+        return '\n'.join(separator.join(row.tobytes().decode('latin-1')) for row in self.chars)
+
+    def subgrid(self, lower_bound: Optional[LatticePoint] = None,
+                upper_bound: Optional[LatticePoint] = None,
+                reference: bool = False) -> 'DenseGrid':
+        """
+        Generate a grid based on the sub-selection between "lower_bound" and
+        "upper_bound"
+
+        With reference, the subgrid shares the arrays of self, so that writes
+        to either are seen by both
+        """
+
+        lower_bound, upper_bound = subgrid_bounds(self, lower_bound, upper_bound)
+        rows = slice(max(lower_bound.y-self.offset.y, 0), max(upper_bound.y-self.offset.y, 0))
+        cols = slice(max(lower_bound.x-self.offset.x, 0), max(upper_bound.x-self.offset.x, 0))
+        chars, walls = self.chars[rows, cols], self.walls[rows, cols]
+        if not reference:
+            chars, walls = chars.copy(), walls.copy()
+        return type(self)(chars, walls, lower_bound)
+
+    def flood_fill(self, start: LatticePoint,
+                   predicate_function: Optional[Callable[[Location], bool]] = None
+                   ) -> Set[Location]:
+        """
+        This methods performs a flood fill from the start location, walled off
+        by predicate_function, or by the walls of the grid if it is not given
+        """
+
+        width = self.width
+        if predicate_function is None:
+            keys = np.flatnonzero(self.flood_fill_mask(start)).tolist()
+        else:
+            keys = flood_fill_keys(self.key(start), width, self.height,
+                                   lambda key: predicate_function(
+                                       self._location(key % width, key // width)))
+        return {self._location(key % width, key // width) for key in keys}
+
+    def flood_fill_mask(self, start: LatticePoint) -> np.ndarray:
+        """
+        Returns a boolean array, shaped as the grid, of the cells reached by a
+        flood fill from start which is walled off by the walls of the grid
+
+        The fill runs along horizontal spans of open cells, finding the ends of
+        each span and the spans adjacent to it with byte searches, so no
+        Locations are built and open areas are filled a row at a time
+        """
+
+        width = self.width
+        first = self.key(start)
+        is_open = ~self.walls.ravel()
+        # One byte per cell which is set while the cell is open and unfilled
+        cells = bytearray(is_open.view(np.uint8).tobytes())
+        stack = [first]
+        while stack:
+            key = stack.pop()
+            if not cells[key]:
+                continue
+            row = key - key % width
+            left = cells.rfind(0, row, key) + 1 or row
+            right = cells.find(0, key, row + width)
+            right = row + width if right < 0 else right
+            cells[left:right] = bytes(right - left)
+
+            for offset in (-width, width):
+                if not 0 <= row + offset < len(cells):
+                    continue
+                pos, end = left + offset, right + offset
+                while pos < end:
+                    pos = cells.find(1, pos, end)
+                    if pos < 0:
+                        break
+                    stack.append(pos)
+                    pos = cells.find(0, pos, end)
+                    if pos < 0:
+                        break
+        filled = is_open & (np.frombuffer(bytes(cells), dtype=np.uint8) == 0)
+        return filled.reshape(self.chars.shape)
@@ -35,6 +35,7 @@ class ExpandableGrid(Grid):
                 row.append(Location(self.offset.x+x, y,
                            Location.OPEN, fill_char))
             self.grid = [row] + self.grid
+        self._refresh_char_index()
         return self
 
     def expand_down(self, steps: int, fill_char: str = '.'):
@@ -54,6 +55,7 @@ class ExpandableGrid(Grid):
                 row.append(Location(self.offset.x+x, y,
                            Location.OPEN, fill_char))
             self.grid.append(row)
+        self._refresh_char_index()
         return self
 
     def expand_left(self, steps: int, fill_char: str = '.'):
@@ -66,11 +68,13 @@ class ExpandableGrid(Grid):
             return self
 
         ExpandableGrid._assert_positive_integer(steps)
+        self._own_rows()
         self.offset.x -= steps
         for y in range(self.height):
             for x in range(self.offset.x, self.offset.x+steps):
                 self.grid[y] = [
                     Location(x, self.offset.y+y, Location.OPEN, fill_char)] + self.grid[y]
+        self._refresh_char_index()
         return self
 
     def expand_right(self, steps: int, fill_char: str = '.'):
@@ -83,11 +87,13 @@ class ExpandableGrid(Grid):
             return self
 
         ExpandableGrid._assert_positive_integer(steps)
+        self._own_rows()
         low_x = self.offset.x + self.width
         for y in range(self.height):
             for x in range(low_x, low_x+steps):
                 self.grid[y] = self.grid[y] + \
                     [Location(x, self.offset.y+y, Location.OPEN, fill_char)]
+        self._refresh_char_index()
         return self
 
     def expand_all(self, steps: int, fill_char: str = '.'):
@@ -125,6 +131,7 @@ class ExpandableGrid(Grid):
                 new_grid[new_pos] = loc
         self.offset = newoffset
         self.grid = new_grid.grid
+        self._refresh_char_index()
         return self
 
     def mirror_y(self, y_value: Optional[int] = None):
@@ -151,15 +158,22 @@ class ExpandableGrid(Grid):
                 new_grid[new_pos] = loc
         self.offset = newoffset
         self.grid = new_grid.grid
+        self._refresh_char_index()
         return self
 
-    def overlay(self, other: 'ExpandableGrid', empty_char: str = '.'):
-        """Overlay one grid over top of another"""
+    def overlay(self, other: 'ExpandableGrid', empty_char: str = '.',
+                copy_on_write: bool = False):
+        """
+        Overlay one grid over top of another
+
+        With copy_on_write, the new grid shares the rows left unchanged with
+        self, as in copy
+        """
         # pylint: disable=E1101
 
         self_bounds, other_bounds = self.bounds, other.bounds
 
-        new_grid: ExpandableGrid = self.copy()
+        new_grid: ExpandableGrid = self.copy(copy_on_write)
         new_grid = new_grid.expand_left(
             max(0, self_bounds[0].x-other_bounds[0].x))
         new_grid = new_grid.expand_down(
@@ -4,17 +4,96 @@ pathfinding which follows a lattice grid
 """
 
 
-from queue import Queue
+import os
+import re
+from collections import deque
+from mmap import ACCESS_READ, mmap
 from typing import (Any, Callable, Dict, Iterable, List, Optional, Set, Tuple,
                     Union)
 
 from fishpy.geometry import LatticePoint, Vector2D
 
-from ...geometry import LatticePoint
+from ...geometry import FrozenLatticePoint, LatticePoint, LineSegment
 from ..location import Location
+from .gridview import GridView, view_slice
 
 
-class Grid:
+def flood_fill_keys(start: int, width: int, height: int,
+                    blocked: Callable[[int], bool]) -> List[int]:
+    """
+    Performs a breadth first flood fill over the packed integer keys of a
+    grid of the given size, returning the keys reached which are not blocked
+    """
+
+    visited = {start}
+    queue = deque(visited)
+
+    filled = []
+    while queue:
+        key = queue.popleft()
+        if blocked(key):
+            continue
+        filled.append(key)
+
+        y, x = divmod(key, width)
+        for adj, valid in ((key+width, y < height-1), (key-width, y > 0),
+                           (key+1, x < width-1), (key-1, x > 0)):
+            if valid and adj not in visited:
+                visited.add(adj)
+                queue.append(adj)
+    return filled
+
+
+_LINE_END = re.compile(rb'\r\n|[\r\n]')
+
+
+def line_spans(data: Union[bytes, bytearray, memoryview, mmap]) -> List[Tuple[int, int]]:
+    """
+    Returns the start and end offsets of each line of the text of a map,
+    splitting on the same line endings as bytes.splitlines
+
+    The text is searched in place, so a memory-mapped file is not copied
+    """
+
+    spans = []
+    start = 0
+    for match in _LINE_END.finditer(data):
+        spans.append((start, match.start()))
+        start = match.end()
+    if start < len(data):
+        spans.append((start, len(data)))
+    return spans
+
+
+def subgrid_bounds(grid: Any, lower_bound: Optional[LatticePoint],
+                   upper_bound: Optional[LatticePoint]) -> Tuple[LatticePoint, LatticePoint]:
+    """
+    Returns the bounds of a subgrid of grid, defaulting to the bounds of the
+    grid and checking that they are ordered LatticePoints
+    """
+
+    if lower_bound is None:
+        lower_bound = grid.offset
+    if upper_bound is None:
+        upper_bound = grid.bounds[1]
+
+    if not isinstance(lower_bound, LatticePoint):
+        raise TypeError(f'{grid.__class__.__name__}.subgrid lower_bound '
+                        f'should be of type LatticePoint, '
+                        f'{type(lower_bound)=} provided')
+
+    if not isinstance(upper_bound, LatticePoint):
+        raise TypeError(f'{grid.__class__.__name__}.subgrid upper_bound '
+                        f'should be of type LatticePoint, '
+                        f'{type(upper_bound)=} provided')
+
+    if lower_bound.is_above(upper_bound) or lower_bound.is_right_of(upper_bound):
+        raise ValueError('Lower bound should be less than or equal to'
+                         'upper bound')
+    return lower_bound, upper_bound
+
+
+class Grid:  # pylint: disable=too-many-public-methods
     """
     A class which can be used in displaying 2D pathfinding which follows a
     lattice grid
@@ -24,19 +103,18 @@ class Grid:
         self.grid = grid
         self.offset = offset
         self._iter = LatticePoint(0, 0)
+        self._char_index: Optional[Dict[str, Set[Tuple[int, int]]]] = None
+        self._shared_rows: Set[int] = set()
+        self._exposed_rows: Set[int] = set()
 
     def __getitem__(self, key: Union[LatticePoint, slice]
-                    ) -> Union[Location, 'Grid']:
+                    ) -> Union[Location, GridView]:
         if isinstance(key, LatticePoint):
             if key not in self:
                 raise KeyError('Point not located on the grid')
-            return self.grid[key.y-self.offset.y][key.x-self.offset.x]
+            return self._own_row(key.y-self.offset.y)[key.x-self.offset.x]
         if isinstance(key, slice):
-            if key.step is not None:
-                raise NotImplementedError(f'{self.__class__.__name__}.__getitem__ '
-                                          'cannot accept slices with a step value')
-            start, stop = key.start, key.stop
-            return self.subgrid(start, stop)
+            return view_slice(self, key)
         raise TypeError(f'{self.__class__.__name__}.__getitem__ cannot '
                         f'accept accessors of type {type(key)}')
 
@@ -46,7 +124,11 @@ class Grid:
                 f'Grid accessor must be of type Point, type {type(pt)} provided')
         if pt not in self:
             raise KeyError('Point not located on the grid')
-        self.grid[pt.y-self.offset.y][pt.x-self.offset.x] = value
+        row = self._own_row(pt.y-self.offset.y)
+        if self._char_index is not None:
+            self._reindex_char((pt.x, pt.y), row[pt.x-self.offset.x].rep,
+                               getattr(value, 'rep', None))
+        row[pt.x-self.offset.x] = value
 
     def __contains__(self, pt: LatticePoint) -> bool:
         if not isinstance(pt, LatticePoint):
@@ -62,10 +144,31 @@ class Grid:
     def __eq__(self, other: 'Grid') -> bool:
         if self.size != other.size or self.offset != other.offset:
             return False
-        for pt in self:
-            if self[pt] != other[pt]:
-                return False
-        return True
+        return all(loc == other_loc for loc, other_loc in zip(self, other))
+
+    def _own_row(self, y: int) -> List[Location]:
+        """
+        Returns the row at index y of the grid, for Locations on it to be
+        handed out or changed, first replacing it with a copy if it is shared
+        with a copy-on-write copy of the grid
+
+        The row is remembered as exposed, so that later copy-on-write copies
+        do not share Locations which callers may still hold
+        """
+
+        row = self.grid[y]
+        if self._shared_rows and id(row) in self._shared_rows:
+            self._shared_rows.discard(id(row))
+            row = [loc.copy() for loc in row]
+            self.grid[y] = row
+        self._exposed_rows.add(id(row))
+        return row
+
+    def _own_rows(self) -> None:
+        """Copy every row which is shared with a copy-on-write copy, before they are all changed"""
+        if self._shared_rows:
+            for y in range(self.height):
+                self._own_row(y)
 
     def char_positions(self, chars: Iterable[str]) -> Dict[str, List[LatticePoint]]:
         """
@@ -74,27 +177,102 @@ class Grid:
         found on the grid
         """
 
+        if self._char_index is not None:
+            return {char: [LatticePoint(x, y) for x, y in sorted(self._char_index.get(char, ()))]
+                    for char in chars}
+
         mapping: Dict[str, List[LatticePoint]] = {char: [] for char in chars}
-        for x in range(self.offset.x, self.offset.x+self.width):
-            for y in range(self.offset.y, self.offset.y+self.height):
-                pt = LatticePoint(x, y)
-                if self[pt].rep in mapping:
-                    mapping[self[pt].rep].append(pt)
+        grid, offset_x, offset_y = self.grid, self.offset.x, self.offset.y
+        for x in range(self.width):
+            for y in range(self.height):
+                positions = mapping.get(grid[y][x].rep)
+                if positions is not None:
+                    positions.append(LatticePoint(x+offset_x, y+offset_y))
         return mapping
 
+    @property
+    def char_indexed(self) -> bool:
+        """This property represents whether the positions of characters are indexed"""
+        return self._char_index is not None
+
+    def build_char_index(self) -> None:
+        """
+        Index the position of every character on the grid, so that
+        char_positions takes time proportional to the number of matches
+
+        The index is kept up to date by the methods of the grid, but not when
+        the rep of a Location on the grid is changed directly
+        """
+
+        index: Dict[str, Set[Tuple[int, int]]] = {}
+        for y, row in enumerate(self.grid, self.offset.y):
+            for x, loc in enumerate(row, self.offset.x):
+                index.setdefault(loc.rep, set()).add((x, y))
+        self._char_index = index
+
+    def drop_char_index(self) -> None:
+        """Stop indexing the positions of characters on the grid"""
+        self._char_index = None
+
+    def _refresh_char_index(self) -> None:
+        """Rebuild the character index, if there is one, after the grid is reshaped"""
+        if self._char_index is not None:
+            self.build_char_index()
+
+    def _reindex_char(self, pos: Tuple[int, int], old: Optional[str], new: Optional[str]) -> None:
+        index = self._char_index
+        if old == new:
+            return
+        positions = index.get(old)
+        if positions is not None:
+            positions.discard(pos)
+            if not positions:
+                del index[old]
+        if new is not None:
+            index.setdefault(new, set()).add(pos)
+
+    def _draw_char(self, pt: LatticePoint, character: str) -> None:
+        """Write a character to the location at pt, keeping the character index up to date"""
+        loc = self[pt]
+        if self._char_index is not None:
+            self._reindex_char((pt.x, pt.y), loc.rep, character)
+        loc.rep = character
+
     @classmethod
     def from_list_of_strings(cls, rows: List[str], wall_char: str = '#',
                              offset: LatticePoint = LatticePoint(0, 0)):
-        """Build a grid from a list of strings of equal length"""
-
-        bounds = LatticePoint(len(rows[0]), len(rows))
-        grid = cls.blank(bounds, offset)
-        for x in range(bounds.x):
-            for y in range(bounds.y):
-                is_wall = Location.IMPASSABLE if rows[y][x] == wall_char else Location.OPEN
-                loc = Location(x+offset.x, y+offset.y, is_wall, rows[y][x])
-                grid[LatticePoint(x+offset.x, y+offset.y)] = loc
-        return grid
+        """
+        Build a grid from a list of strings of equal length, creating each
+        location directly in a single pass over the rows
+        """
+
+        width = len(rows[0]) if rows else 0
+        if any(len(row) != width for row in rows):
+            raise ValueError('Rows of a grid must all have the same length')
+        return cls([Location.from_row(row, y, offset.x, wall_char)
+                    for y, row in enumerate(rows, offset.y)], offset=offset)
+
+    @classmethod
+    def from_bytes(cls, data: Union[bytes, bytearray, memoryview, mmap], wall_char: str = '#',
+                   offset: LatticePoint = LatticePoint(0, 0), encoding: str = 'utf-8'):
+        """
+        Build a grid from the text of a map, with one row per line, decoding
+        one row at a time rather than copying the whole text
+        """
+        return cls.from_list_of_strings([bytes(data[start:end]).decode(encoding)
+                                         for start, end in line_spans(data)],
+                                        wall_char, offset)
+
+    @classmethod
+    def from_file(cls, path: str, wall_char: str = '#',
+                  offset: LatticePoint = LatticePoint(0, 0), encoding: str = 'utf-8'):
+        """Build a grid from a text file of a map, which is memory-mapped while it is read"""
+
+        with open(path, 'rb') as file:
+            if not os.fstat(file.fileno()).st_size:
+                return cls.from_bytes(b'', wall_char, offset, encoding)
+            with mmap(file.fileno(), 0, access=ACCESS_READ) as data:
+                return cls.from_bytes(data, wall_char, offset, encoding)
 
     @classmethod
     def from_list_of_locations(cls, locations: List[Location]):
@@ -161,29 +339,73 @@ class Grid:
         """This property represents the lower and upper bounds of the grid"""
         return self.offset, self.offset+self.size
 
-    def copy(self):
-        """This method returns a deep copy of self"""
+    def key(self, pt: LatticePoint) -> int:
+        """
+        Returns the packed integer key of a point on the grid, which is
+        cheaper to hash and compare than the point itself
+        """
 
-        grid = []
-        for y in range(self.offset.y, self.offset.y+self.height):
-            row = []
-            for x in range(self.offset.x, self.offset.x+self.width):
-                row += [self[LatticePoint(x, y)].copy()]
-            grid += [row]
+        x, y = pt.x-self.offset.x, pt.y-self.offset.y
+        width = self.width
+        if not (0 <= x < width and 0 <= y < self.height):
+            raise KeyError('Point not located on the grid')
+        return x + y*width
+
+    def point(self, key: int) -> FrozenLatticePoint:
+        """Returns the point represented by a packed integer key"""
+
+        if not 0 <= key < self.width*self.height:
+            raise KeyError('Key not located on the grid')
+        y, x = divmod(key, self.width)
+        return FrozenLatticePoint.interned(x+self.offset.x, y+self.offset.y)
+
+    def copy(self, copy_on_write: bool = False):
+        """
+        This method returns a deep copy of self
+
+        With copy_on_write, the copy shares the rows of self instead, and
+        whichever grid first writes to a shared row, or hands out a Location
+        from it with __getitem__ or flood_fill, copies that row, so the copy
+        costs time in proportion to the rows changed. Rows from which
+        Locations were already handed out are copied straight away. Locations
+        reached by iterating over either grid are shared until their row is
+        copied, and should be treated as read-only
+        """
+        # pylint: disable=protected-access
+
+        if copy_on_write:
+            exposed = self._exposed_rows
+            shared = {id(row) for row in self.grid if id(row) not in exposed}
+            self._shared_rows |= shared
+            rows = [row if id(row) in shared else [loc.copy() for loc in row]
+                    for row in self.grid]
+            new_grid = type(self)(rows, self.offset.copy())
+            new_grid._shared_rows = shared
+            if self._char_index is not None:
+                new_grid._char_index = {char: set(positions)
+                                        for char, positions in self._char_index.items()}
+            return new_grid
+
+        grid = [[loc.copy() for loc in row] for row in self.grid]
 
         new_grid = type(self)(grid)
-        new_grid.offset = self.offset
+        new_grid.offset = self.offset.copy()
+        if self._char_index is not None:
+            new_grid.build_char_index()
         return new_grid
 
     def conditional_walls(self, predicate_function: Callable[[LatticePoint], bool],
-                          char: str) -> 'Grid':
+                          char: str, copy_on_write: bool = False) -> 'Grid':
         """
         This method can be used to add walls based on the results of a
         function which takes in a Point and returns a boolean for whether
         there should be a wall at that point
+
+        With copy_on_write, the new grid shares the rows without walls added
+        with self, as in copy
         """
 
-        new = self.copy()
+        new = self.copy(copy_on_write)
         for y in range(self.offset.y, self.offset.y+new.height):
             for x in range(self.offset.x, self.offset.x+new.width):
                 pt = LatticePoint(x, y)
@@ -202,20 +424,25 @@ class Grid:
         if explored is not None and explored_char is not None:
             for pt in explored:
                 if pt in self:
-                    self[pt].rep = explored_char
+                    self._draw_char(pt, explored_char)
         for pt in path:
             if pt in self:
-                self[pt].rep = path_char
+                self._draw_char(pt, path_char)
+
+    def overlay(self, other: 'Grid', empty_char: str = '.', copy_on_write: bool = False):
+        """
+        Overlay the self grid over top of another grid
 
-    def overlay(self, other: 'Grid', empty_char: str = '.'):
-        """Overlay the self grid over top of another grid"""
+        With copy_on_write, the new grid shares the rows left unchanged with
+        self, as in copy
+        """
 
         if other.bounds[0] not in self or other.bounds[1]-LatticePoint(1, 1) not in self:
             raise ValueError('Other grid not fully within bounds')
         # if self.size != other.size or self.offset != other.offset:
         #     raise ValueError('Other grid not fully within bounds')
 
-        new = self.copy()
+        new = self.copy(copy_on_write)
         for loc in other:
             loc: Location
             if loc.rep != empty_char:
@@ -241,79 +468,81 @@ class Grid:
         "upper_bound"
         """
 
-        if lower_bound is None:
-            lower_bound = self.offset
-        if upper_bound is None:
-            upper_bound = self.bounds[1]
-
-        if not isinstance(lower_bound, LatticePoint):
-            raise TypeError(f'{self.__class__.__name__}.subgrid lower_bound '
-                            f'should be of type LatticePoint, '
-                            f'{type(lower_bound)=} provided')
-
-        if not isinstance(upper_bound, LatticePoint):
-            raise TypeError(f'{self.__class__.__name__}.subgrid upper_bound '
-                            f'should be of type LatticePoint, '
-                            f'{type(upper_bound)=} provided')
-
-        if lower_bound.is_above(upper_bound) or lower_bound.is_right_of(upper_bound):
-            raise ValueError('Lower bound should be less than or equal to'
-                             'upper bound')
+        lower_bound, upper_bound = subgrid_bounds(self, lower_bound, upper_bound)
+        lower = (max(lower_bound.x-self.offset.x, 0), max(lower_bound.y-self.offset.y, 0))
+        upper = (max(upper_bound.x-self.offset.x, 0), max(upper_bound.y-self.offset.y, 0))
 
         grid = []
-        for row in self.grid[lower_bound.y:upper_bound.y]:
+        for row in self.grid[lower[1]:upper[1]]:
             row: list[Location]
             if reference:
-                grid.append(row[lower_bound.x:upper_bound.x])
+                grid.append(row[lower[0]:upper[0]])
             else:
                 grid.append([col.copy()
-                            for col in row[lower_bound.x:upper_bound.x]])
+                            for col in row[lower[0]:upper[0]]])
 
         g = type(self)(grid)
         g.offset = lower_bound
         return g
 
+    def view(self, lower_bound: Optional[LatticePoint] = None,
+             upper_bound: Optional[LatticePoint] = None) -> GridView:
+        """
+        Returns a view of the part of the grid between "lower_bound" and
+        "upper_bound", clipped to the grid, which shares the locations of the
+        grid instead of copying them
+        """
+
+        lower_bound, upper_bound = subgrid_bounds(self, lower_bound, upper_bound)
+        lower, upper = self.bounds
+        return GridView(self,
+                        LatticePoint(max(lower_bound.x, lower.x), max(lower_bound.y, lower.y)),
+                        LatticePoint(min(upper_bound.x, upper.x), min(upper_bound.y, upper.y)))
+
     def shift(self, step: Vector2D):
         """Translate the entire grid in the direction of the step vector"""
 
         if not isinstance(step.x, int) or not isinstance(step.y, int):
             raise TypeError('Cannot shift grid by non-integer amount')
 
+        self._own_rows()
         for pt in self:
             pt: Location
             pt.x += step.x
             pt.y += step.y
         self.offset += step
+        self._refresh_char_index()
 
         return self
 
     def flood_fill(self, start: Location,
-                   predicate_function: Callable[[Location], bool]) -> List[Location]:
+                   predicate_function: Callable[[Location], bool]) -> Set[Location]:
         """
         This methods performs a flood fill from the start location, walled off
         by predicate_function
         """
 
-        seen = set()
-        q = Queue()
-        q.put(start)
-
-        size = 0
-        while not q.empty():
-            loc: Location = q.get()
-            if loc in seen or predicate_function(loc):
-                continue
-            seen.add(loc)
-            size += 1
-
-            for adj in loc.get_adjacent_points(lower_bound=self.offset,
-                                               upper_bound=self.offset+self.size):
-                q.put(self[adj])
-        return seen
+        grid, width = self.grid, self.width
+        keys = flood_fill_keys(self.key(start), width, self.height,
+                               lambda key: predicate_function(grid[key // width][key % width]))
+        for y in {key // width for key in keys}:
+            self._own_row(y)
+        return {grid[key // width][key % width] for key in keys}
 
     def draw(self, character: str, start: LatticePoint, step: Vector2D, count: int):
         """Write a number of characters to a grid in a single line"""
         for i in range(count+1):
             pos = start + step*i
             if pos in self:
-                self[pos].rep = character
+                self._draw_char(pos, character)
+
+    def draw_line(self, character: str, start: LatticePoint, end: LatticePoint,
+                  supercover: bool = False):
+        """
+        Write characters to a grid along the rasterized line between two
+        points, inclusive, skipping any points which lie off the grid
+        """
+        points = [start] if start == end else LineSegment(start, end).rasterize(supercover)
+        for pos in points:
+            if pos in self:
+                self._draw_char(pos, character)
@@ -3,9 +3,9 @@ This module provides a grid class which can be used in displaying 3D
 pathfinding which follows a lattice grid
 """
 
-from typing import Any, Dict, Iterable, List
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
-from ...geometry import Point3D
+from ...geometry import LatticePoint, Point3D
 from ..location3d import Location3D
 from .grid import Grid
 
@@ -20,20 +20,32 @@ class Grid3D:
         self.grid = [Grid(sub, offset.copy()) for sub in grid]
         self._iter = Point3D(0, 0, 0)
         self.offset = offset
+        self._char_index: Optional[Dict[str, Set[Tuple[int, int, int]]]] = None
 
     def __getitem__(self, pt: Point3D) -> Location3D:
         if not isinstance(pt, Point3D):
             raise TypeError('Grid accessor must be of type Point3D')
         if pt not in self:
             raise KeyError('Point not located on the grid')
-        return self.grid[pt.z-self.offset.z][pt]
+        return self.grid[pt.z-self.offset.z][LatticePoint(pt.x, pt.y)]
 
     def __setitem__(self, pt: Point3D, value: Any) -> None:
         if not isinstance(pt, Point3D):
             raise TypeError('Grid accessor must be of type Point3D')
         if pt not in self:
             raise KeyError('Point not located on the grid')
-        self.grid[pt.z-self.offset.z][pt] = value
+        layer, pos = self.grid[pt.z-self.offset.z], LatticePoint(pt.x, pt.y)
+        if self._char_index is not None:
+            old, new = layer[pos].rep, getattr(value, 'rep', None)
+            key = (pt.x, pt.y, pt.z)
+            positions = self._char_index.get(old)
+            if positions is not None and old != new:
+                positions.discard(key)
+                if not positions:
+                    del self._char_index[old]
+            if new is not None:
+                self._char_index.setdefault(new, set()).add(key)
+        layer[pos] = value
 
     def __contains__(self, pt: Point3D) -> bool:
         if not isinstance(pt, Point3D):
@@ -111,7 +123,39 @@ class Grid3D:
 
     def copy(self) -> 'Grid3D':
         """This method returns a deep copy of self"""
-        return Grid3D([subgrid.copy().grid for subgrid in self.grid], offset=self.offset.copy())
+        new = Grid3D([subgrid.copy().grid for subgrid in self.grid], offset=self.offset.copy())
+        if self.char_indexed:
+            new.build_char_index()
+        return new
+
+    @property
+    def char_indexed(self) -> bool:
+        """This property represents whether the positions of characters are indexed"""
+        return self._char_index is not None
+
+    def build_char_index(self) -> None:
+        """
+        Index the position of every character on the grid, so that
+        char_positions takes time proportional to the number of matches
+
+        The index is kept up to date by __setitem__ and the expand methods,
+        but not when the rep of a location on the grid is changed directly
+        """
+
+        index: Dict[str, Set[Tuple[int, int, int]]] = {}
+        for z, layer in enumerate(self.grid, self.offset.z):
+            for y, row in enumerate(layer.grid, self.offset.y):
+                for x, loc in enumerate(row, self.offset.x):
+                    index.setdefault(loc.rep, set()).add((x, y, z))
+        self._char_index = index
+
+    def drop_char_index(self) -> None:
+        """Stop indexing the positions of characters on the grid"""
+        self._char_index = None
+
+    def _refresh_char_index(self) -> None:
+        if self._char_index is not None:
+            self.build_char_index()
 
     @staticmethod
     def _assert_positive_integer(n: int) -> bool:
@@ -135,6 +179,7 @@ class Grid3D:
                     row.append(Location3D(self.offset.x+x, y, self.offset.z+z,
                                           Location3D.OPEN, fill_char))
                 self.grid[z].grid = [row] + self.grid[z].grid
+        self._refresh_char_index()
 
     def expand_down(self, steps: int, fill_char: str = '.') -> None:
         """
@@ -151,6 +196,7 @@ class Grid3D:
                     row.append(Location3D(self.offset.x+x, y, self.offset.z+z,
                                           Location3D.OPEN, fill_char))
                 self.grid[z].grid.append(row)
+        self._refresh_char_index()
 
     def expand_left(self, steps: int, fill_char: str = '.') -> None:
         """
@@ -167,6 +213,7 @@ class Grid3D:
                     self.grid[z].grid[y] = [Location3D(x, self.offset.y+y, self.offset.z+z,
                                                        Location3D.OPEN, fill_char)
                                             ] + self.grid[z].grid[y]
+        self._refresh_char_index()
 
     def expand_right(self, steps: int, fill_char: str = '.') -> None:
         """
@@ -182,6 +229,7 @@ class Grid3D:
                     self.grid[z].grid[y] = [Location3D(x, self.offset.y+y, self.offset.z+z,
                                                        Location3D.OPEN, fill_char)
                                             ] + self.grid[z].grid[y]
+        self._refresh_char_index()
 
     def expand_in(self, steps: int, fill_char: str = '.') -> None:
         """
@@ -200,6 +248,7 @@ class Grid3D:
                                               Location3D.OPEN, fill_char))
                 new_subgrid.append(new_row)
             self.grid = [Grid(new_subgrid, self.offset.copy())] + self.grid
+        self._refresh_char_index()
 
     def expand_out(self, steps: int, fill_char: str = '.') -> None:
         """
@@ -218,6 +267,7 @@ class Grid3D:
                                               Location3D.OPEN, fill_char))
                 new_subgrid.append(new_row)
             self.grid.append(Grid(new_subgrid, self.offset.copy()))
+        self._refresh_char_index()
 
     def char_positions(self, chars: List[str]) -> Dict[str, List[Point3D]]:
         """
@@ -226,6 +276,10 @@ class Grid3D:
         found on the grid
         """
 
+        if self._char_index is not None:
+            return {char: [Point3D(x, y, z) for z, x, y in sorted(
+                (z, x, y) for x, y, z in self._char_index.get(char, ()))] for char in chars}
+
         positions = {}
         for char in chars:
             positions[char] = []
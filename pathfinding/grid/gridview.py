@@ -0,0 +1,164 @@
+"""
+This module provides a window onto part of a grid which shares the grid's
+locations rather than copying them
+"""
+
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from ...geometry import LatticePoint
+from ..location import Location
+
+
+def view_slice(grid: Any, key: slice) -> 'GridView':
+    """Returns the view of grid selected by a slice of points, which cannot have a step"""
+
+    if key.step is not None:
+        raise NotImplementedError(f'{grid.__class__.__name__}.__getitem__ '
+                                  'cannot accept slices with a step value')
+    return grid.view(key.start, key.stop)
+
+
+class GridView:
+    """
+    A rectangular window onto a Grid, given by its lower and upper bounds in
+    the coordinates of the grid, which reads and writes the grid's own
+    locations
+
+    Creating a view copies nothing, and views of views window the original
+    grid directly. Points are addressed in the coordinates of the grid, so a
+    view keeps selecting the same cells when the grid is expanded. Use
+    materialize for an independent copy
+    """
+
+    __slots__ = ('_parent', '_lower', '_upper')
+
+    def __init__(self, parent: Any, lower_bound: LatticePoint, upper_bound: LatticePoint):
+        self._parent = parent
+        self._lower = LatticePoint(lower_bound.x, lower_bound.y)
+        self._upper = LatticePoint(max(upper_bound.x, lower_bound.x),
+                                   max(upper_bound.y, lower_bound.y))
+
+    @property
+    def parent(self) -> Any:
+        """This property represents the grid which the view windows"""
+        return self._parent
+
+    @property
+    def offset(self) -> LatticePoint:
+        """This property represents the lower bound of the view"""
+        return self._lower
+
+    @property
+    def width(self) -> int:
+        """This property represents the width of the view"""
+        return self._upper.x - self._lower.x
+
+    @property
+    def height(self) -> int:
+        """This property represents the height of the view"""
+        return self._upper.y - self._lower.y
+
+    @property
+    def size(self) -> LatticePoint:
+        """This property represents the width and height of the view"""
+        return LatticePoint(self.width, self.height)
+
+    @property
+    def bounds(self) -> Tuple[LatticePoint, LatticePoint]:
+        """This property represents the lower and upper bounds of the view"""
+        return self._lower, self._upper
+
+    def __getitem__(self, key: Union[LatticePoint, slice]) -> Union[Location, 'GridView']:
+        if isinstance(key, LatticePoint):
+            if key not in self:
+                raise KeyError('Point not located on the grid')
+            return self._parent[key]
+        if isinstance(key, slice):
+            return view_slice(self, key)
+        raise TypeError(f'{self.__class__.__name__}.__getitem__ cannot '
+                        f'accept accessors of type {type(key)}')
+
+    def __setitem__(self, pt: LatticePoint, value: Any) -> None:
+        """Writes through to the grid, which keeps its character index up to date"""
+
+        if pt not in self:
+            raise KeyError('Point not located on the grid')
+        self._parent[pt] = value
+
+    def __contains__(self, pt: LatticePoint) -> bool:
+        if not isinstance(pt, LatticePoint):
+            raise TypeError(
+                f'Grid accessor must be of type Point, type {type(pt)} provided')
+        return self._lower.x <= pt.x < self._upper.x and self._lower.y <= pt.y < self._upper.y
+
+    def _rows(self) -> Iterable[Iterable[Location]]:
+        """Yield an iterator over each row of the view, without slicing the grid's lists"""
+
+        parent_offset = self._parent.offset
+        x, y = self._lower.x-parent_offset.x, self._lower.y-parent_offset.y
+        for row in islice(self._parent.grid, y, y+self.height):
+            yield islice(row, x, x+self.width)
+
+    def __iter__(self) -> Iterable[Location]:
+        for row in self._rows():
+            yield from row
+
+    def __len__(self) -> int:
+        return self.width * self.height
+
+    def __eq__(self, other: Any) -> bool:
+        if self.size != other.size or self.offset != other.offset:
+            return False
+        return all(loc == other[loc] for loc in self)
+
+    def __str__(self) -> str:
+        return self.to_string()
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(offset={self.offset},size={self.size})'
+
+    def view(self, lower_bound: Optional[LatticePoint] = None,
+             upper_bound: Optional[LatticePoint] = None) -> 'GridView':
+        """
+        Returns a view of the part of self between "lower_bound" and
+        "upper_bound", which windows the grid directly
+        """
+
+        if lower_bound is None:
+            lower_bound = self._lower
+        if upper_bound is None:
+            upper_bound = self._upper
+        inner = self._parent.view(lower_bound, upper_bound)
+        lower, upper = inner.bounds
+        return GridView(self._parent,
+                        LatticePoint(max(lower.x, self._lower.x), max(lower.y, self._lower.y)),
+                        LatticePoint(min(upper.x, self._upper.x), min(upper.y, self._upper.y)))
+
+    def materialize(self) -> Any:
+        """Returns a grid of the same type as the parent holding copies of the viewed locations"""
+        return self._parent.subgrid(self._lower, self._upper)
+
+    def char_positions(self, chars: Iterable[str]) -> Dict[str, List[LatticePoint]]:
+        """
+        Return a list of points for each character passed in the "chars" list
+        which represents the list of positions in which that character can be
+        found within the view, using the character index of the grid if it has one
+        """
+
+        if self._parent.char_indexed:
+            return {char: [pt for pt in positions if pt in self]
+                    for char, positions in self._parent.char_positions(chars).items()}
+
+        mapping: Dict[str, List[LatticePoint]] = {char: [] for char in chars}
+        grid, parent_offset = self._parent.grid, self._parent.offset
+        for x in range(self._lower.x, self._upper.x):
+            for y in range(self._lower.y, self._upper.y):
+                positions = mapping.get(grid[y-parent_offset.y][x-parent_offset.x].rep)
+                if positions is not None:
+                    positions.append(LatticePoint(x, y))
+        return mapping
+
+    def to_string(self, separator: str = ' ') -> str:
+        """Returns a string representation with an arbitrary separator"""
+        return '\n'.join(separator.join(str(col) for col in row) for row in self._rows())
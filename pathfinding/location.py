@@ -3,6 +3,7 @@
 
 from copy import copy
 from enum import Enum
+from typing import List
 
 from ..geometry import LatticePoint
 
@@ -18,6 +19,15 @@ class Location(LatticePoint):
         self.type = loc_type
         self.rep = rep
 
+    @classmethod
+    def from_row(cls, row: str, y: int, x_offset: int = 0,
+                 wall_char: str = '#') -> List['Location']:
+        """Build the locations along a row of characters, starting at x_offset"""
+
+        open_, impassable = cls.OPEN, cls.IMPASSABLE
+        return [cls(x, y, impassable if char == wall_char else open_, char)
+                for x, char in enumerate(row, x_offset)]
+
     def copy(self) -> 'Location':
         return Location(self.x, self.y, self.type, copy(self.rep))
 
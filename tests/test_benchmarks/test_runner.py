@@ -0,0 +1,29 @@
+import unittest
+
+from fishpy.benchmarks import Benchmark, compare, run
+from fishpy.benchmarks.geometry import BENCHMARKS
+
+
+class TestRunner(unittest.TestCase):
+    def test_run(self):
+        results = run(BENCHMARKS, (5,), repeat=1)
+        self.assertEqual(len(results), len(BENCHMARKS))
+        for result in results.values():
+            self.assertLessEqual(result['best'], result['mean'])
+
+        results = run([Benchmark('noop', lambda size: lambda: size)], (1, 2), repeat=2,
+                      pattern='hash')
+        self.assertDictEqual(results, {})
+
+    def test_compare(self):
+        baseline = {'a[1]': {'best': 1.0, 'mean': 1.0}, 'b[1]': {'best': 1.0, 'mean': 1.0}}
+        results = {'a[1]': {'best': 1.05, 'mean': 1.1}, 'b[1]': {'best': 1.5, 'mean': 1.5},
+                   'c[1]': {'best': 9.0, 'mean': 9.0}}
+        regressions = compare(results, baseline, tolerance=0.1)
+        self.assertEqual(len(regressions), 1)
+        self.assertTrue(regressions[0].startswith('b[1]'))
+        self.assertListEqual(compare(results, baseline, tolerance=1), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
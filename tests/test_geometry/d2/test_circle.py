@@ -1,5 +1,7 @@
 import unittest
 
+import numpy as np
+
 from fishpy.geometry import Circle, Point2D
 
 
@@ -80,3 +82,9 @@ class TestCircleMethods(unittest.TestCase):
         self.assertIsNone(self.circle1.intersecting_points(self.circle5))
         self.assertTupleEqual(self.circle2.intersecting_points(self.circle3),
                               (Point2D(2.5, -4.33012702), Point2D(2.5, 4.33012702)))
+
+    def test_contains_many(self):
+        points = np.array([[0, 0], [10, 0], [7, 7.2], [-3, 4], [20, 1]])
+        np.testing.assert_array_equal(self.circle1.contains_many(points),
+                                      [True, True, False, True, False])
+        np.testing.assert_array_equal(self.circle5.contains_many([Point2D(16, 3)]), [True])
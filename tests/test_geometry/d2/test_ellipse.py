@@ -1,6 +1,9 @@
+import random
 import unittest
 
-from fishpy.geometry import Ellipse, Point2D
+import numpy as np
+
+from fishpy.geometry import Ellipse, Point2D, PointArray
 
 
 class TestEllipseProperties(unittest.TestCase):
@@ -53,7 +56,38 @@ class TestEllipseDunderMethods(unittest.TestCase):
         self.ellipse4 = Ellipse(p2,p4,Point2D(0,11))
 
     def test_contains(self):
-        pass
+        self.assertIn(Point2D(0, 0), self.ellipse1)
+        self.assertIn(Point2D(15, 0), self.ellipse1)
+        self.assertNotIn(Point2D(15.1, 0), self.ellipse1)
+        self.assertIn(Point2D(0, 500**0.5/2 - 1e-9), self.ellipse1)
+        self.assertNotIn(Point2D(0, 12), self.ellipse1)
+        self.assertIn(Point2D(0, 14.9), self.ellipse3)
+        self.assertIn(Point2D(8.6, 5), self.ellipse3)
+        self.assertNotIn(Point2D(8.7, 5), self.ellipse3)
+        self.assertIn(Point2D(0, 11), self.ellipse4)
+        self.assertIn(Point2D(11, 0), self.ellipse4)
+        self.assertNotIn(Point2D(0, 0), self.ellipse4)
+
+    def test_contains_many(self):
+        rng = random.Random(15)
+        points = [Point2D(rng.uniform(-20, 20), rng.uniform(-20, 20)) for _ in range(500)]
+        for ellipse in (self.ellipse1, self.ellipse2, self.ellipse3, self.ellipse4):
+            expected = [pt in ellipse for pt in points]
+            np.testing.assert_array_equal(ellipse.contains_many(points), expected)
+            np.testing.assert_array_equal(
+                ellipse.contains_many(PointArray.from_points(points)), expected)
 
 class TestEllipseMethods(unittest.TestCase):
-    pass
+    def test_invalidation(self):
+        ellipse = Ellipse(Point2D(-10, 0), Point2D(10, 0), Point2D(15, 0))
+        self.assertEqual(ellipse.center, Point2D(0, 0))
+        self.assertNotIn(Point2D(0, 12), ellipse)
+        ellipse.focus1 = Point2D(10, -10)
+        ellipse.focus2 = Point2D(10, 10)
+        self.assertEqual(ellipse.center, Point2D(10, 0))
+        self.assertEqual(ellipse.angle, 90)
+        self.assertAlmostEqual(ellipse.minor_axis, 500**0.5)
+        self.assertIn(Point2D(10, 14.9), ellipse)
+        ellipse.major_axis = 40
+        self.assertAlmostEqual(ellipse.minor_axis, 1200**0.5)
+        self.assertIn(Point2D(10, 19.9), ellipse)
@@ -0,0 +1,202 @@
+import random
+import unittest
+from fractions import Fraction
+from itertools import combinations
+
+import numpy as np
+
+from fishpy.geometry import Circle, LineSegment, Point2D
+from fishpy.geometry.d2 import intersections
+from fishpy.geometry.d2 import (circle_intersections, segment_intersections,
+                                segment_pair_intersections)
+
+
+def _first_shared_point(a, b):
+    """Brute force the lowest (x, y) point shared by two segments"""
+    a1, a2 = sorted([(Fraction(a.p1.x), Fraction(a.p1.y)), (Fraction(a.p2.x), Fraction(a.p2.y))])
+    b1, b2 = sorted([(Fraction(b.p1.x), Fraction(b.p1.y)), (Fraction(b.p2.x), Fraction(b.p2.y))])
+    r = (a2[0]-a1[0], a2[1]-a1[1])
+    s = (b2[0]-b1[0], b2[1]-b1[1])
+    qp = (b1[0]-a1[0], b1[1]-a1[1])
+    denominator = r[0]*s[1] - r[1]*s[0]
+    if denominator == 0:
+        if qp[0]*r[1] - qp[1]*r[0] != 0:
+            return None
+        start, end = max(a1, b1), min(a2, b2)
+        return start if start <= end else None
+    t = (qp[0]*s[1] - qp[1]*s[0]) / denominator
+    u = (qp[0]*r[1] - qp[1]*r[0]) / denominator
+    if 0 <= t <= 1 and 0 <= u <= 1:
+        return a1[0] + t*r[0], a1[1] + t*r[1]
+    return None
+
+
+class TestSegmentIntersections(unittest.TestCase):
+    def assert_matches_brute_force(self, segments):
+        expected = set()
+        for (i, a), (j, b) in combinations(enumerate(segments), 2):
+            point = _first_shared_point(a, b)
+            if point is not None:
+                expected.add((i, j, Point2D(float(point[0]), float(point[1]))))
+
+        index = {id(seg): i for i, seg in enumerate(segments)}
+        found = segment_intersections(segments)
+        actual = {(index[id(a)], index[id(b)], point) for a, b, point in found}
+        self.assertEqual(len(found), len(actual))
+        self.assertSetEqual(actual, expected)
+
+    def test_crossing(self):
+        a = LineSegment(Point2D(0, 0), Point2D(4, 4))
+        b = LineSegment(Point2D(0, 4), Point2D(4, 0))
+        c = LineSegment(Point2D(5, 0), Point2D(6, 6))
+        self.assertListEqual(segment_intersections([a, b, c]), [(a, b, Point2D(2, 2))])
+        self.assertListEqual(segment_intersections([]), [])
+
+    def test_degenerate(self):
+        segments = [
+            LineSegment(Point2D(0, 0), Point2D(4, 4)),
+            LineSegment(Point2D(2, 2), Point2D(6, 6)),
+            LineSegment(Point2D(2, 0), Point2D(2, 5)),
+            LineSegment(Point2D(2, 5), Point2D(2, 8)),
+            LineSegment(Point2D(0, 4), Point2D(4, 0)),
+            LineSegment(Point2D(4, 0), Point2D(0, 2)),
+            LineSegment(Point2D(2, 3), Point2D(7, 3)),
+        ]
+        self.assert_matches_brute_force(segments)
+
+    def test_random(self):
+        rng = random.Random(11)
+        for _ in range(8):
+            segments = []
+            while len(segments) < 40:
+                p1 = Point2D(rng.randint(0, 12), rng.randint(0, 12))
+                p2 = Point2D(rng.randint(0, 12), rng.randint(0, 12))
+                if p1 != p2:
+                    segments.append(LineSegment(p1, p2))
+            self.assert_matches_brute_force(segments)
+
+    def test_floats(self):
+        rng = random.Random(12)
+        segments = [LineSegment(Point2D(rng.random(), rng.random()),
+                                Point2D(rng.random(), rng.random())) for _ in range(60)]
+        self.assert_matches_brute_force(segments)
+
+
+class TestLineSegmentIntersection(unittest.TestCase):
+    def setUp(self):
+        self.a = LineSegment(Point2D(4, 4), Point2D(0, 1))
+        self.b = LineSegment(Point2D(0, 4), Point2D(4, 0))
+        self.c = LineSegment(Point2D(0, 0), Point2D(4, 4))
+
+    def test_intersection(self):
+        self.assertEqual(self.b.intersection(self.c), Point2D(2, 2))
+        self.assertEqual(self.c.intersection(self.b), Point2D(2, 2))
+        self.assertEqual(self.a.intersection(self.b), Point2D(1.7142857143, 2.2857142857))
+        self.assertEqual(self.b.intersection(self.a), Point2D(1.7142857143, 2.2857142857))
+        self.assertIsNone(self.a.intersection(LineSegment(Point2D(5, 0), Point2D(6, 6))))
+
+    def test_exact(self):
+        self.assertEqual(self.a.intersection(self.b, exact=True),
+                         Point2D(Fraction(12, 7), Fraction(16, 7)))
+        point = self.c.intersection(self.b, exact=True)
+        self.assertIsInstance(point.x, int)
+
+    def test_exact_mixed_types(self):
+        floats = LineSegment(Point2D(0.5, 4.0), Point2D(4.5, 0.0))
+        expected = Point2D(Fraction(9, 4), Fraction(9, 4))
+        self.assertEqual(self.c.intersection(floats, exact=True), expected)
+        self.assertEqual(floats.intersection(self.c, exact=True), expected)
+
+    def test_is_parallel_to(self):
+        self.assertTrue(self.c.is_parallel_to(LineSegment(Point2D(3, 1), Point2D(1, -1))))
+        self.assertFalse(self.a.is_parallel_to(self.b))
+
+
+class TestSegmentPairIntersections(unittest.TestCase):
+    def test_pairs(self):
+        rng = random.Random(13)
+        first, second = [], []
+        for _ in range(200):
+            first.append(LineSegment(Point2D(rng.random(), rng.random()),
+                                     Point2D(rng.random(), rng.random())))
+            second.append(LineSegment(Point2D(rng.random(), rng.random()),
+                                      Point2D(rng.random(), rng.random())))
+        mask, points = segment_pair_intersections(first, second)
+        for a, b, hit, point in zip(first, second, mask, points):
+            expected = a.intersection(b)
+            self.assertEqual(hit, expected is not None)
+            if hit:
+                np.testing.assert_allclose(point, expected.as_tuple(), atol=1e-9)
+            else:
+                self.assertTrue(np.isnan(point).all())
+
+    def test_arrays(self):
+        first = np.array([[[0, 0], [4, 4]], [[0, 0], [1, 1]], [[0, 0], [2, 0]]])
+        second = np.array([[[0, 4], [4, 0]], [[2, 2], [3, 3]], [[2, 0], [2, 5]]])
+        mask, points = segment_pair_intersections(first, second)
+        np.testing.assert_array_equal(mask, [True, False, True])
+        np.testing.assert_array_equal(points[[0, 2]], [[2, 2], [2, 0]])
+        self.assertRaises(ValueError, segment_pair_intersections, first, second[:2])
+
+    def test_touching(self):
+        first = [LineSegment(Point2D(2, 0), Point2D(0, 0)),
+                 LineSegment(Point2D(0, 0), Point2D(2, 0)),
+                 LineSegment(Point2D(0, 0), Point2D(2, 2)),
+                 LineSegment(Point2D(0, 0), Point2D(4, 0))]
+        second = [LineSegment(Point2D(2, 5), Point2D(2, 0)),
+                  LineSegment(Point2D(2, 0), Point2D(2, 5)),
+                  LineSegment(Point2D(2, 2), Point2D(5, 0)),
+                  LineSegment(Point2D(2, 0), Point2D(2, 3))]
+        mask, _ = segment_pair_intersections(first, second)
+        np.testing.assert_array_equal(
+            mask, [a.intersection(b) is not None for a, b in zip(first, second)])
+        self.assertFalse(mask[0])
+
+        mask, points = segment_pair_intersections(first, second, include_endpoints=True)
+        np.testing.assert_array_equal(mask, [True, True, True, True])
+        np.testing.assert_array_equal(points, [[2, 0], [2, 0], [2, 2], [2, 0]])
+
+
+class TestCircleIntersections(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(19)
+        self.circles = [Circle(Point2D(rng.uniform(0, 100), rng.uniform(0, 100)),
+                               rng.uniform(0.5, 8)) for _ in range(300)]
+
+    def test_against_pairs(self):
+        pairs, points = circle_intersections(self.circles)
+        expected = [(i, j) for (i, a), (j, b) in combinations(enumerate(self.circles), 2)
+                    if a.intersects(b)]
+        self.assertListEqual([tuple(pair) for pair in pairs], expected)
+        for (i, j), found in zip(pairs, points):
+            scalar = self.circles[i].intersecting_points(self.circles[j])
+            for pt in found:
+                self.assertTrue(any(abs(pt[0]-p.x) < 1e-6 and abs(pt[1]-p.y) < 1e-6
+                                    for p in scalar))
+
+    def test_arrays_and_chunks(self):
+        centers = np.array([(c.center.x, c.center.y) for c in self.circles])
+        radii = np.array([c.radius for c in self.circles])
+        pairs, points = circle_intersections(self.circles)
+        chunk_size = intersections.CHUNK_SIZE
+        intersections.CHUNK_SIZE = 7
+        try:
+            chunked_pairs, chunked_points = circle_intersections(centers, radii)
+        finally:
+            intersections.CHUNK_SIZE = chunk_size
+        np.testing.assert_array_equal(chunked_pairs, pairs)
+        np.testing.assert_allclose(chunked_points, points)
+
+    def test_special_cases(self):
+        circles = [Circle(Point2D(0, 0), 2), Circle(Point2D(4, 0), 2), Circle(Point2D(0, 0), 2),
+                   Circle(Point2D(0, 0), 1)]
+        pairs, points = circle_intersections(circles)
+        np.testing.assert_array_equal(pairs, [[0, 1], [1, 2]])
+        np.testing.assert_allclose(points[0], [[2, 0], [2, 0]])
+        pairs, points = circle_intersections([])
+        self.assertTupleEqual(pairs.shape, (0, 2))
+        self.assertTupleEqual(points.shape, (0, 2, 2))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,6 @@
 import unittest
 
-from fishpy.geometry import LatticePoint
+from fishpy.geometry import FrozenLatticePoint, LatticePoint, Point2D
 
 
 class TestLatticePointProperties(unittest.TestCase):
@@ -37,6 +37,13 @@ class TestLatticePointStaticMethods(unittest.TestCase):
                                             upper_bound=LatticePoint(5, 5)
                                             ).in_bounds(self.p1, LatticePoint(6, 6)))
 
+    def test_random_many(self):
+        points = LatticePoint.random_many(200, self.p1, LatticePoint(3, 4), seed=8)
+        self.assertTrue(all(p.in_bounds(self.p1, LatticePoint(3, 4)) for p in points))
+        self.assertEqual(len(set(points)), 6)
+        self.assertListEqual(points, LatticePoint.random_many(200, self.p1, LatticePoint(3, 4),
+                                                              seed=8))
+
 
 class TestLatticePointDunderMethods(unittest.TestCase):
     def setUp(self):
@@ -123,6 +130,12 @@ class TestLatticePointMethods(unittest.TestCase):
                                                             upper_bound=LatticePoint(1, -5))),
                             {LatticePoint(0, -6)})
 
+    def test_iter_adjacent_points(self):
+        adjacent = self.p4.iter_adjacent_points(diagonals=True, lower_bound=LatticePoint(-3, 5))
+        self.assertNotIsInstance(adjacent, list)
+        self.assertListEqual(list(adjacent), self.p4.get_adjacent_points(
+            diagonals=True, lower_bound=LatticePoint(-3, 5)))
+
     def test_lattice_midpoint(self):
         self.assertEqual(self.p1.lattice_midpoint(
             self.p2), LatticePoint(1, -2))
@@ -162,3 +175,48 @@ class TestLatticePointMethods(unittest.TestCase):
         self.assertEqual(self.p2.right(), LatticePoint(2, -5))
         self.assertEqual(self.p3.right(), LatticePoint(1, 2))
         self.assertEqual(self.p4.right(), LatticePoint(-2, 5))
+
+
+class TestFrozenLatticePoint(unittest.TestCase):
+    def setUp(self):
+        self.p1 = FrozenLatticePoint(1, 1)
+        self.p2 = FrozenLatticePoint(1, -5)
+
+    def test_init(self):
+        self.assertRaises(TypeError, FrozenLatticePoint, 5, 2.5)
+
+    def test_immutable(self):
+        with self.assertRaises(TypeError):
+            self.p1.x = 4
+        self.assertFalse(hasattr(self.p1, '__dict__'))
+
+    def test_arithmetic(self):
+        self.assertEqual(self.p1+self.p2, LatticePoint(2, -4))
+        self.assertEqual(self.p1-self.p2, LatticePoint(0, 6))
+        self.assertIsInstance(self.p1-self.p2, FrozenLatticePoint)
+        self.assertEqual(self.p2//2, LatticePoint(0, -3))
+        self.assertEqual(self.p2//LatticePoint(1, 5), LatticePoint(1, -1))
+        self.assertEqual(self.p2/2, Point2D(0.5, -2.5))
+        self.assertRaises(TypeError, FrozenLatticePoint.__mul__, self.p1, 0.5)
+
+    def test_hash(self):
+        self.assertEqual(hash(self.p1), hash(LatticePoint(1, 1)))
+        self.assertIn(LatticePoint(1, 1), {self.p1})
+        self.assertIn(self.p1, {LatticePoint(1, 1)})
+
+    def test_interned(self):
+        pt = FrozenLatticePoint.interned(3, -4)
+        self.assertEqual(pt, LatticePoint(3, -4))
+        self.assertIs(pt, FrozenLatticePoint.interned(3, -4))
+        self.assertIs(pt, LatticePoint(3, -4).intern())
+        self.assertIs(pt, FrozenLatticePoint(3, -4).intern())
+        self.assertIsNot(FrozenLatticePoint.interned(10**6, 0),
+                         FrozenLatticePoint.interned(10**6, 0))
+
+    def test_get_adjacent_points(self):
+        adjacent = self.p1.get_adjacent_points()
+        self.assertSetEqual(set(adjacent),
+                            {LatticePoint(0, 1), LatticePoint(1, 0), LatticePoint(2, 1),
+                             LatticePoint(1, 2)})
+        for pt in adjacent:
+            self.assertIsInstance(pt, FrozenLatticePoint)
@@ -0,0 +1,91 @@
+import random
+import unittest
+from fractions import Fraction
+
+from fishpy.geometry import LatticePoint, Line, LineSegment, Point2D
+
+
+def _brute_force(segment):
+    x1, y1 = Fraction(segment.p1.x), Fraction(segment.p1.y)
+    x2, y2 = Fraction(segment.p2.x), Fraction(segment.p2.y)
+    points = set()
+    for x in range(int(min(x1, x2)) - 1, int(max(x1, x2)) + 2):
+        for y in range(int(min(y1, y2)) - 1, int(max(y1, y2)) + 2):
+            cross = (x2-x1)*(y-y1) - (y2-y1)*(x-x1)
+            if cross == 0 and min(x1, x2) <= x <= max(x1, x2) and min(y1, y2) <= y <= max(y1, y2):
+                points.add(LatticePoint(x, y))
+    return points
+
+
+class TestLineSegmentLatticePoints(unittest.TestCase):
+    def test_lattice_points_along(self):
+        segment = LineSegment(Point2D(6, 4), Point2D(0, 0))
+        self.assertListEqual(list(segment.iter_lattice_points()),
+                             [LatticePoint(0, 0), LatticePoint(3, 2), LatticePoint(6, 4)])
+        self.assertEqual(segment.count_lattice_points(), 3)
+        self.assertSetEqual(LineSegment(Point2D(0.5, 0), Point2D(0.5, 4)).lattice_points_along(),
+                            set())
+        self.assertEqual(LineSegment(Point2D(2, -1.5), Point2D(2, 4)).count_lattice_points(), 6)
+        self.assertEqual(LineSegment(Point2D(0.5, 0.5), Point2D(2.5, 2.5)).count_lattice_points(),
+                         2)
+
+    def test_random(self):
+        rng = random.Random(14)
+        for _ in range(200):
+            p1 = Point2D(rng.randint(-8, 8) / rng.choice((1, 2)), rng.randint(-8, 8))
+            p2 = Point2D(rng.randint(-8, 8), rng.randint(-8, 8) / rng.choice((1, 3)))
+            if p1 == p2:
+                continue
+            segment = LineSegment(p1, p2)
+            self.assertSetEqual(segment.lattice_points_along(), _brute_force(segment))
+            self.assertEqual(segment.count_lattice_points(), len(_brute_force(segment)))
+
+    def test_long_segment(self):
+        segment = LineSegment(Point2D(0, 0), Point2D(3*10**12, 2*10**12))
+        self.assertEqual(segment.count_lattice_points(), 10**12 + 1)
+        points = segment.iter_lattice_points()
+        self.assertEqual(next(points), LatticePoint(0, 0))
+        self.assertEqual(next(points), LatticePoint(3, 2))
+
+    def test_rasterize(self):
+        segment = LineSegment(Point2D(0, 0), Point2D(5, 3))
+        line = list(segment.rasterize())
+        self.assertEqual(len(line), 6)
+        self.assertEqual(line[-1], LatticePoint(5, 3))
+        for a, b in zip(line, line[1:]):
+            self.assertTrue(a.is_adjacent(b, diagonals=True))
+
+        # Passing exactly through the corner of a cell steps diagonally
+        cover = list(segment.rasterize(supercover=True))
+        self.assertEqual(len(cover), 8)
+        self.assertTrue(set(line) <= set(cover))
+        self.assertIn((LatticePoint(2, 1), LatticePoint(3, 2)), list(zip(cover, cover[1:])))
+
+        cover = list(LineSegment(Point2D(0, 0), Point2D(4, 3)).rasterize(supercover=True))
+        self.assertEqual(len(cover), 8)
+        for a, b in zip(cover, cover[1:]):
+            self.assertTrue(a.is_adjacent(b))
+
+        reverse = list(LineSegment(Point2D(2, 4), Point2D(-2, -4)).rasterize(True))
+        self.assertEqual(len(reverse), 13)
+        self.assertEqual(reverse[0], LatticePoint(2, 4))
+        self.assertEqual(reverse[-1], LatticePoint(-2, -4))
+        self.assertTrue(all(a.is_adjacent(b) for a, b in zip(reverse, reverse[1:])))
+
+
+class TestLineLatticePoints(unittest.TestCase):
+    def test_lattice_points_along(self):
+        lower, upper = LatticePoint(-5, -5), LatticePoint(5, 5)
+        self.assertSetEqual(Line(0.5, 1.5).lattice_points_along(lower, upper),
+                            {LatticePoint(-3, -4), LatticePoint(-1, -1), LatticePoint(1, 2),
+                             LatticePoint(3, 5)})
+        self.assertListEqual(list(Line(1/3, 1/3).iter_lattice_points(lower, upper)),
+                             [LatticePoint(-4, -1), LatticePoint(-1, 0), LatticePoint(2, 1),
+                              LatticePoint(5, 2)])
+        self.assertEqual(Line(2, 0).count_lattice_points(lower, upper), 11)
+        self.assertEqual(Line.new_vertical(2).count_lattice_points(lower, upper), 11)
+        self.assertEqual(Line.new_vertical(7).count_lattice_points(lower, upper), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
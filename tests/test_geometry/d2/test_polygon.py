@@ -0,0 +1,119 @@
+import random
+import unittest
+from itertools import combinations
+
+from fishpy.geometry import LatticePoint, Point2D, Polygon
+from fishpy.geometry.d2 import Triangle
+
+
+class TestConvexHull(unittest.TestCase):
+    def test_square(self):
+        points = [LatticePoint(x, y) for x in range(5) for y in range(5)]
+        hull = Polygon.convex_hull(points)
+        self.assertTupleEqual(hull.vertices, (LatticePoint(0, 0), LatticePoint(4, 0),
+                                              LatticePoint(4, 4), LatticePoint(0, 4)))
+        self.assertIsInstance(hull.vertices[0], LatticePoint)
+        self.assertEqual(hull.signed_area(), 16)
+        self.assertEqual(hull.perimeter(), 16)
+
+    def test_degenerate(self):
+        self.assertEqual(len(Polygon.convex_hull([Point2D(1, 1)] * 3)), 1)
+        line = Polygon.convex_hull([Point2D(i, 2*i) for i in range(5)])
+        self.assertTupleEqual(line.vertices, (Point2D(0, 0), Point2D(4, 8)))
+        self.assertIn(Point2D(2, 4), line)
+        self.assertNotIn(Point2D(2, 5), line)
+        self.assertRaises(ValueError, Polygon, [])
+
+    def test_duplicate_points(self):
+        point = Point2D(3, -2)
+        hull = Polygon.convex_hull([point, point])
+        self.assertTupleEqual(hull.vertices, (point,))
+        self.assertTrue(hull.is_convex())
+        self.assertIn(point, hull)
+        self.assertNotIn(Point2D(3, -1), hull)
+        self.assertEqual(hull.area(), 0)
+        pair = Polygon([Point2D(0, 0), Point2D(2, 2)])
+        self.assertTrue(pair.is_convex())
+        self.assertIn(Point2D(1, 1), pair)
+        self.assertNotIn(Point2D(1, 0), pair)
+
+    def test_against_triangles(self):
+        rng = random.Random(18)
+        points = [Point2D(rng.randint(-20, 20), rng.randint(-20, 20)) for _ in range(40)]
+        hull = Polygon.convex_hull(points)
+        self.assertTrue(hull.is_convex())
+        self.assertGreater(hull.signed_area(), 0)
+        # Every vertex of the hull is outside every triangle of the other points
+        for vertex in hull:
+            others = [pt for pt in points if pt != vertex]
+            self.assertFalse(any(Triangle(*tri).contains(vertex)
+                                 for tri in combinations(others[:12], 3)
+                                 if Triangle(*tri).signed_area()))
+        self.assertTrue(all(pt in hull for pt in points))
+
+
+class TestPolygon(unittest.TestCase):
+    def setUp(self):
+        self.convex = Polygon([Point2D(0, 0), Point2D(6, 0), Point2D(8, 4), Point2D(4, 8),
+                               Point2D(0, 6)])
+        self.concave = Polygon([Point2D(0, 0), Point2D(8, 0), Point2D(8, 8), Point2D(4, 2),
+                                Point2D(0, 8)])
+
+    def test_area(self):
+        self.assertEqual(self.convex.area(), 48)
+        self.assertEqual(Polygon(reversed(self.convex.vertices)).signed_area(), -48)
+        self.assertEqual(self.concave.area(), 40)
+        self.assertTrue(self.convex.is_convex())
+        self.assertFalse(self.concave.is_convex())
+        self.assertEqual(len(self.concave.edges()), 5)
+
+    def test_contains(self):
+        rng = random.Random(4)
+        clockwise = Polygon(reversed(self.convex.vertices))
+        for _ in range(300):
+            pt = Point2D(rng.randint(-1, 9), rng.randint(-1, 9))
+            self.assertEqual(pt in self.convex, pt in clockwise)
+            # A brute force check against a fan of triangles, boundary included
+            inside = any(Triangle(self.convex.vertices[0], a, b).contains(pt)
+                         for a, b in zip(self.convex.vertices[1:], self.convex.vertices[2:]))
+            if inside:
+                self.assertIn(pt, self.convex)
+        self.assertIn(Point2D(0, 0), self.convex)
+        self.assertIn(Point2D(7, 2), self.convex)
+        self.assertIn(Point2D(3, 3), self.convex)
+        self.assertNotIn(Point2D(8, 8), self.convex)
+        self.assertNotIn(Point2D(-1, 3), self.convex)
+        self.assertIn(Point2D(1, 6), self.concave)
+        self.assertIn(Point2D(6, 5), self.concave)
+        self.assertIn(Point2D(2, 5), self.concave)
+        self.assertNotIn(Point2D(4, 5), self.concave)
+        self.assertIn(Point2D(4, 2), self.concave)
+
+    def test_contains_collinear_vertices(self):
+        square = Polygon([Point2D(0, 0), Point2D(2, 0), Point2D(2, 2),
+                          Point2D(0, 2), Point2D(0, 1)])
+        self.assertTrue(square.is_convex())
+        for pt in (Point2D(0, 3), Point2D(0, 100), Point2D(0, -1), Point2D(3, 0),
+                   Point2D(-1, 0), Point2D(0, 1.5), Point2D(0, 1), Point2D(1, 0)):
+            self.assertEqual(pt in square, square._contains_crossing(pt), pt)
+        self.assertNotIn(Point2D(0, 3), square)
+        self.assertNotIn(Point2D(0, 100), square)
+        self.assertIn(Point2D(0, 1.5), square)
+        for start in range(5):
+            rotated = Polygon(square.vertices[start:] + square.vertices[:start])
+            for x in range(-2, 5):
+                for y in range(-2, 5):
+                    pt = Point2D(x, y)
+                    self.assertEqual(pt in rotated, rotated._contains_crossing(pt), pt)
+
+    def test_picks_theorem(self):
+        for polygon in (self.convex, self.concave):
+            counted = sum(Point2D(x, y) in polygon for x in range(-1, 10) for y in range(-1, 10))
+            self.assertEqual(polygon.lattice_points(), counted)
+        self.assertEqual(self.convex.boundary_lattice_points(), 6+2+4+2+6)
+        self.assertRaises(ValueError, Polygon([Point2D(0.5, 0), Point2D(1, 1),
+                                               Point2D(0, 1)]).interior_lattice_points)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,25 @@
+import unittest
+
+import numpy as np
+
+from fishpy.geometry import Point2D, Rectangle, Square
+
+
+class TestRectangleContains(unittest.TestCase):
+    def setUp(self):
+        self.rectangle = Rectangle(Point2D(4, -1), Point2D(0, 3))
+
+    def test_contains(self):
+        self.assertIn(Point2D(2, 1), self.rectangle)
+        self.assertIn(Point2D(4, 3), self.rectangle)
+        self.assertNotIn(Point2D(4.5, 0), self.rectangle)
+        self.assertIn(Point2D(1, 1), Square(Point2D(0, 0), 2))
+
+    def test_contains_many(self):
+        points = np.array([[2, 1], [4, 3], [0, -1], [4.5, 0], [2, -2]])
+        np.testing.assert_array_equal(self.rectangle.contains_many(points),
+                                      [True, True, True, False, False])
+
+
+if __name__ == '__main__':
+    unittest.main()
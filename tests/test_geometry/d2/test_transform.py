@@ -0,0 +1,65 @@
+import unittest
+
+import numpy as np
+
+from fishpy.geometry import LatticePoint, Point2D, PointArray, Vector2D
+from fishpy.geometry.d2 import Transform2D
+
+
+class TestTransform2D(unittest.TestCase):
+    def assertPointAlmostEqual(self, found, expected):
+        self.assertIsInstance(found, type(expected))
+        self.assertAlmostEqual(found.x, expected.x)
+        self.assertAlmostEqual(found.y, expected.y)
+
+    def test_rotation(self):
+        rotation = Transform2D.rotation(90)
+        self.assertPointAlmostEqual(rotation(Point2D(1, 0)), Point2D(0, 1))
+        self.assertPointAlmostEqual(Transform2D.rotation(90, Point2D(1, 1))(Point2D(2, 1)),
+                                    Point2D(1, 2))
+        self.assertPointAlmostEqual(rotation(Vector2D(3, 4)), Vector2D(-4, 3))
+
+    def test_composition(self):
+        pipeline = Transform2D.identity().rotate(90).translate(1, 2).scale(2)
+        step = Transform2D.scaling(2) @ Transform2D.translation(1, 2) @ Transform2D.rotation(90)
+        self.assertPointAlmostEqual(pipeline(Point2D(1, 0)), Point2D(2, 6))
+        self.assertPointAlmostEqual(step(Point2D(1, 0)), Point2D(2, 6))
+        self.assertEqual(Transform2D.rotation(90).then(Transform2D.translation(1, 2)),
+                         Transform2D.translation(1, 2) @ Transform2D.rotation(90))
+        np.testing.assert_allclose(pipeline.matrix, step.matrix, atol=1e-12)
+        self.assertEqual(Transform2D.from_matrix(step.matrix), step)
+
+    def test_vectors_ignore_translation(self):
+        self.assertEqual(Transform2D.translation(5, 5)(Vector2D(1, 2)), Vector2D(1, 2))
+        self.assertEqual(Transform2D.translation(5, 5)(LatticePoint(1, 2)), Point2D(6, 7))
+
+    def test_inverse(self):
+        transform = Transform2D.rotation(30).translate(3, -1).scale(2, 0.5)
+        self.assertPointAlmostEqual(transform.inverse()(transform(Point2D(4, 7))),
+                                    Point2D(4, 7))
+        self.assertRaises(ValueError, Transform2D.scaling(0, 1).inverse)
+
+    def test_point_array(self):
+        transform = Transform2D.rotation(45, Point2D(2, 3)).scale(3)
+        points = [Point2D(x, -x*x) for x in range(10)]
+        array = transform(PointArray.from_points(points))
+        self.assertIs(array.point_type, Point2D)
+        np.testing.assert_allclose(array.coords, [transform(pt).as_tuple() for pt in points])
+        vectors = PointArray.from_points([Vector2D(1, 0), Vector2D(0, 1)])
+        moved = Transform2D.translation(1, 1).rotate(90)(vectors)
+        np.testing.assert_allclose(moved.coords, [[0, 1], [-1, 0]], atol=1e-12)
+        np.testing.assert_allclose(transform(array.coords), transform(array).coords)
+
+
+class TestVector2D(unittest.TestCase):
+    def test_fast_methods(self):
+        self.assertEqual(Vector2D(3, 4).magnitude(), 5)
+        self.assertEqual(Vector2D(3, 4).normalize(), Vector2D(0.6, 0.8))
+        rotated = Vector2D(3, 4).rotate(90)
+        self.assertAlmostEqual(rotated.x, -0.8)
+        self.assertAlmostEqual(rotated.y, 0.6)
+        self.assertRaises(ValueError, Vector2D(0, 0).rotate, 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
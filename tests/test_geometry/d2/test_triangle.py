@@ -0,0 +1,55 @@
+import random
+import unittest
+
+import numpy as np
+
+from fishpy.geometry import Point2D, PointArray
+from fishpy.geometry.d2 import Triangle
+
+
+class TestTriangleContains(unittest.TestCase):
+    def setUp(self):
+        self.triangle = Triangle(Point2D(0, 0), Point2D(10, 2), Point2D(3, 9))
+
+    def test_contains(self):
+        self.assertTrue(self.triangle.contains(Point2D(4, 4)))
+        self.assertFalse(self.triangle.contains(Point2D(0, 0)))
+        self.assertFalse(self.triangle.contains(Point2D(9, 9)))
+        self.assertAlmostEqual(sum(self.triangle.barycentric_coordinates(Point2D(2, 7))), 1)
+
+    def test_contains_many(self):
+        rng = random.Random(16)
+        points = [Point2D(rng.uniform(-1, 11), rng.uniform(-1, 11)) for _ in range(500)]
+        expected = [self.triangle.contains(pt) for pt in points]
+        np.testing.assert_array_equal(self.triangle.contains_many(points), expected)
+        reverse = Triangle(Point2D(3, 9), Point2D(10, 2), Point2D(0, 0))
+        np.testing.assert_array_equal(reverse.contains_many(PointArray.from_points(points)),
+                                      expected)
+
+    def test_vertex_update(self):
+        triangle = Triangle(Point2D(0, 0), Point2D(10, 2), Point2D(3, 9))
+        self.assertTrue(triangle.contains_many([Point2D(4, 4)])[0])
+        triangle.p2 = Point2D(-10, 2)
+        self.assertFalse(triangle.contains_many([Point2D(4, 4)])[0])
+        self.assertEqual(triangle.contains(Point2D(-1, 3)), triangle.contains_many(
+            [Point2D(-1, 3)])[0])
+        self.assertTrue(triangle.contains(Point2D(-1, 3)))
+
+
+class TestTriangleCaches(unittest.TestCase):
+    def test_invalidation(self):
+        triangle = Triangle(Point2D(0, 0), Point2D(4, 0), Point2D(0, 4))
+        self.assertEqual(triangle.area(), 8)
+        self.assertTrue(triangle.contains(Point2D(1, 1)))
+        triangle.p2 = Point2D(8, 0)
+        self.assertEqual(triangle.signed_area(), 16)
+        self.assertTrue(triangle.contains(Point2D(5, 1)))
+        triangle.p3 = Point2D(0, -4)
+        self.assertEqual(triangle.signed_area(), -16)
+        self.assertFalse(triangle.contains(Point2D(5, 1)))
+        triangle.p1 = Point2D(-1, 0)
+        self.assertEqual(triangle.area(), 18)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,38 @@
+import random
+import unittest
+
+from fishpy.geometry import Point2D
+from fishpy.geometry.d2 import Rectangle, Square, union_area
+
+
+class TestUnionArea(unittest.TestCase):
+    def test_simple(self):
+        self.assertEqual(union_area([]), 0)
+        a = Rectangle(Point2D(0, 0), Point2D(4, 4))
+        self.assertEqual(union_area([a]), 16)
+        self.assertEqual(union_area([a, a]), 16)
+        self.assertEqual(union_area([a, Rectangle(Point2D(2, 2), Point2D(6, 6))]), 28)
+        self.assertEqual(union_area([a, Rectangle(Point2D(4, 0), Point2D(8, 4))]), 32)
+        self.assertEqual(union_area([a, Rectangle(Point2D(1, 1), Point2D(1, 9))]), 16)
+        self.assertEqual(union_area([a, Square(Point2D(2, 2), 2)]), 16)
+
+    def test_big_integers(self):
+        big = 10**30
+        rects = [Rectangle(Point2D(0, 0), Point2D(2*big, big)),
+                 Rectangle(Point2D(big, 0), Point2D(3*big, 2*big))]
+        self.assertEqual(union_area(rects), 5*big*big)
+
+    def test_against_cells(self):
+        rng = random.Random(17)
+        rects = []
+        for _ in range(60):
+            x, y = rng.randint(0, 30), rng.randint(0, 30)
+            rects.append(Rectangle(Point2D(x, y),
+                                   Point2D(x+rng.randint(0, 10), y+rng.randint(0, 10))))
+        cells = {(cx, cy) for r in rects
+                 for cx in range(r.low.x, r.high.x) for cy in range(r.low.y, r.high.y)}
+        self.assertEqual(union_area(rects), len(cells))
+
+
+if __name__ == '__main__':
+    unittest.main()
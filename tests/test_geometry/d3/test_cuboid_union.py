@@ -0,0 +1,79 @@
+import random
+import unittest
+
+from fishpy.geometry import Cuboid, Point3D
+from fishpy.geometry.d3 import CuboidUnion, union_volume
+
+
+def random_cuboids(seed, n):
+    rng = random.Random(seed)
+    cuboids = []
+    for _ in range(n):
+        low = Point3D(rng.randint(0, 12), rng.randint(0, 12), rng.randint(0, 12))
+        cuboids.append(Cuboid(low, low + Point3D(rng.randint(0, 6), rng.randint(0, 6),
+                                                 rng.randint(0, 6))))
+    return cuboids
+
+
+def cells(cuboid):
+    return {(x, y, z) for x in range(cuboid.lower.x, cuboid.upper.x)
+            for y in range(cuboid.lower.y, cuboid.upper.y)
+            for z in range(cuboid.lower.z, cuboid.upper.z)}
+
+
+class TestUnionVolume(unittest.TestCase):
+    def test_simple(self):
+        self.assertEqual(union_volume([]), 0)
+        a = Cuboid(Point3D(0, 0, 0), Point3D(2, 2, 2))
+        b = Cuboid(Point3D(1, 1, 1), Point3D(3, 3, 3))
+        self.assertEqual(union_volume([a]), 8)
+        self.assertEqual(union_volume([a, b]), 15)
+        self.assertEqual(union_volume([a, Cuboid(Point3D(2, 0, 0), Point3D(4, 2, 2))]), 16)
+
+    def test_big_integers(self):
+        big = 10**20
+        a = Cuboid(Point3D(-big, -big, -big), Point3D(big, big, big))
+        b = Cuboid(Point3D(0, 0, 0), Point3D(2*big, 2*big, 2*big))
+        self.assertEqual(union_volume([a, b]), 15*big**3)
+
+    def test_against_cells(self):
+        cuboids = random_cuboids(5, 40)
+        covered = set().union(*map(cells, cuboids))
+        self.assertEqual(union_volume(cuboids), len(covered))
+
+
+class TestCuboidUnion(unittest.TestCase):
+    def test_add(self):
+        cuboids = random_cuboids(8, 40)
+        union = CuboidUnion(cuboids)
+        self.assertEqual(union.volume, union_volume(cuboids))
+
+    def test_toggling(self):
+        rng = random.Random(9)
+        union = CuboidUnion()
+        on = set()
+        for cuboid in random_cuboids(10, 40):
+            if rng.random() < 0.6:
+                union.add(cuboid)
+                on |= cells(cuboid)
+            else:
+                union.subtract(cuboid)
+                on -= cells(cuboid)
+            self.assertEqual(union.volume, len(on))
+        self.assertEqual(sum(weight * cuboid.volume for cuboid, weight in union), len(on))
+
+    def test_merging(self):
+        union = CuboidUnion()
+        a = Cuboid(Point3D(0, 0, 0), Point3D(2, 2, 2))
+        union.add(a)
+        union.add(a)
+        self.assertEqual(len(union), 1)
+        union.subtract(a)
+        self.assertEqual(len(union), 0)
+        self.assertEqual(union.volume, 0)
+        union.add(Cuboid(Point3D(2, 2, 2), Point3D(0, 0, 0)))
+        self.assertEqual(union.volume, 8)
+
+
+if __name__ == '__main__':
+    unittest.main()
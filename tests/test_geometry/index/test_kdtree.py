@@ -0,0 +1,66 @@
+import random
+import unittest
+
+from fishpy.geometry import LatticePoint, Point, Point3D
+from fishpy.geometry.index import KDTree
+
+
+class TestKDTree(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(5)
+        self.points = [Point3D(rng.randint(-30, 30), rng.randint(-30, 30),
+                               rng.randint(-30, 30)) for _ in range(300)]
+        self.tree = KDTree(self.points, leaf_size=8)
+        self.queries = [Point3D(rng.randint(-40, 40), rng.randint(-40, 40),
+                                rng.randint(-40, 40)) for _ in range(20)]
+
+    def test_len(self):
+        self.assertEqual(len(self.tree), 300)
+        self.assertListEqual(list(self.tree), self.points)
+        self.assertEqual(len(KDTree([])), 0)
+        self.assertListEqual(KDTree([]).nearest(Point(0, 0)), [])
+
+    def test_nearest(self):
+        for query in self.queries:
+            expected = sorted(p.euclidean_distance(query) for p in self.points)[:5]
+            found = self.tree.nearest(query, k=5)
+            self.assertListEqual([d for d, _ in found], expected)
+            for d, p in found:
+                self.assertEqual(p.euclidean_distance(query), d)
+
+    def test_nearest_manhattan(self):
+        for query in self.queries:
+            expected = min(p.manhattan_distance(query) for p in self.points)
+            distance, point = self.tree.nearest(query, metric='manhattan')[0]
+            self.assertEqual(distance, expected)
+            self.assertEqual(point.manhattan_distance(query), expected)
+
+    def test_within_radius(self):
+        for query in self.queries:
+            expected = [p for p in self.points if p.euclidean_distance(query) <= 12]
+            self.assertListEqual(self.tree.within_radius(query, 12), expected)
+            expected = [p for p in self.points if p.manhattan_distance(query) <= 12]
+            self.assertListEqual(self.tree.within_radius(query, 12, 'manhattan'), expected)
+
+    def test_in_bounds(self):
+        lower, upper = Point3D(-10, -5, 0), Point3D(10, 20, 15)
+        expected = [p for p in self.points if p.in_bounds(lower, upper)]
+        self.assertListEqual(self.tree.in_bounds(lower, upper), expected)
+
+    def test_lattice(self):
+        points = [LatticePoint(x, y) for x in range(10) for y in range(10)]
+        tree = KDTree(points, leaf_size=4)
+        distance, point = tree.nearest(LatticePoint(3, 4))[0]
+        self.assertEqual(distance, 0)
+        self.assertEqual(point, LatticePoint(3, 4))
+        self.assertEqual(len(tree.within_radius(LatticePoint(5, 5), 1)), 5)
+
+    def test_invalid(self):
+        self.assertRaises(ValueError, KDTree, self.points, 0)
+        self.assertRaises(ValueError, self.tree.nearest, self.queries[0], 0)
+        self.assertRaises(ValueError, self.tree.nearest, self.queries[0], 1, 'chebyshev')
+        self.assertRaises(ValueError, self.tree.nearest, Point(1, 2, 3, 4))
+
+
+if __name__ == '__main__':
+    unittest.main()
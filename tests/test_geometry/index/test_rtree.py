@@ -0,0 +1,120 @@
+import random
+import unittest
+
+from fishpy.geometry import Point2D, Point3D
+from fishpy.geometry.d2 import Rectangle, Square
+from fishpy.geometry.d3 import Cuboid
+from fishpy.geometry.index import RTree
+from fishpy.geometry.index.rtree import bounds
+
+
+def overlaps(a, b):
+    (al, au), (bl, bu) = bounds(a), bounds(b)
+    return all(x <= w and z <= y for x, y, z, w in zip(al, au, bl, bu))
+
+
+def encloses(a, b):
+    (al, au), (bl, bu) = bounds(a), bounds(b)
+    return all(x <= z and w <= y for x, y, z, w in zip(al, au, bl, bu))
+
+
+class TestRTree(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(16)
+        self.rectangles = []
+        for _ in range(300):
+            x, y = rng.uniform(-50, 50), rng.uniform(-50, 50)
+            w, h = rng.uniform(0, 8), rng.uniform(0, 8)
+            self.rectangles.append(Rectangle(Point2D(x, y), Point2D(x+w, y+h)))
+        self.rectangles.append(Square(Point2D(0, 0), 4))
+        self.tree = RTree(self.rectangles, max_entries=8)
+        self.queries = [Rectangle(Point2D(rng.uniform(-50, 50), rng.uniform(-50, 50)),
+                                  Point2D(rng.uniform(-50, 50), rng.uniform(-50, 50)))
+                        for _ in range(20)]
+
+    def test_bulk_load(self):
+        self.assertEqual(len(self.tree), 301)
+        self.assertListEqual(list(self.tree), self.rectangles)
+        self.assertGreater(self.tree.height(), 2)
+        self.assertEqual(len(RTree()), 0)
+        self.assertListEqual(RTree().overlapping(self.queries[0]), [])
+        self.assertRaises(ValueError, RTree, max_entries=3)
+
+    def test_overlapping(self):
+        for query in self.queries:
+            expected = [r for r in self.rectangles if overlaps(r, query)]
+            self.assertListEqual(self.tree.overlapping(query), expected)
+        touching = Rectangle(Point2D(2, -10), Point2D(5, 10))
+        self.assertIn(self.rectangles[-1], self.tree.overlapping(touching))
+
+    def test_within_enclosing(self):
+        for query in self.queries:
+            expected = [r for r in self.rectangles if encloses(query, r)]
+            self.assertListEqual(self.tree.within(query), expected)
+            expected = [r for r in self.rectangles if encloses(r, query)]
+            self.assertListEqual(self.tree.enclosing(query), expected)
+
+    def test_containing(self):
+        for pt in (Point2D(0, 0), Point2D(2, 2), Point2D(-30.5, 12.25)):
+            expected = [r for r in self.rectangles if pt in r]
+            self.assertListEqual(self.tree.containing(pt), expected)
+        self.assertRaises(ValueError, self.tree.containing, Point3D(0, 0, 0))
+
+    def test_insert_remove(self):
+        tree = RTree(max_entries=4)
+        for r in self.rectangles:
+            tree.insert(r)
+        self.assertEqual(len(tree), 301)
+        for query in self.queries:
+            self.assertListEqual(tree.overlapping(query), self.tree.overlapping(query))
+
+        removed = self.rectangles[::2]
+        for r in removed:
+            tree.remove(r)
+        self.assertRaises(KeyError, tree.remove, removed[0])
+        tree.discard(removed[0])
+        self.assertNotIn(removed[0], tree)
+        remaining = self.rectangles[1::2]
+        self.assertEqual(len(tree), len(remaining))
+        self.assertListEqual(list(tree), remaining)
+        for query in self.queries:
+            expected = [r for r in remaining if overlaps(r, query)]
+            self.assertListEqual(tree.overlapping(query), expected)
+
+        for r in remaining:
+            tree.remove(r)
+        self.assertEqual(len(tree), 0)
+        self.assertEqual(tree.height(), 1)
+        tree.insert(self.rectangles[0])
+        self.assertListEqual(tree.containing(self.rectangles[0].low), [self.rectangles[0]])
+
+    def test_overlapping_pairs(self):
+        expected = [(a, b) for i, a in enumerate(self.rectangles)
+                    for b in self.rectangles[i+1:] if overlaps(a, b)]
+        found = list(self.tree.overlapping_pairs())
+        self.assertEqual(len(found), len(expected))
+        self.assertSetEqual({(id(a), id(b)) for a, b in found},
+                            {(id(a), id(b)) for a, b in expected})
+
+    def test_cuboids(self):
+        rng = random.Random(3)
+        cuboids = []
+        for _ in range(200):
+            low = Point3D(rng.randint(-20, 20), rng.randint(-20, 20), rng.randint(-20, 20))
+            cuboids.append(Cuboid(low, low + Point3D(rng.randint(0, 5), rng.randint(0, 5),
+                                                     rng.randint(0, 5))))
+        tree = RTree(cuboids[:100])
+        for c in cuboids[100:]:
+            tree.insert(c)
+        query = Cuboid(Point3D(-5, -5, -5), Point3D(5, 5, 5))
+        self.assertListEqual(tree.overlapping(query),
+                             [c for c in cuboids if overlaps(c, query)])
+        self.assertListEqual(tree.within(query), [c for c in cuboids if encloses(query, c)])
+        self.assertListEqual(tree.overlapping(query),
+                             [c for c in cuboids if c.overlap(query) is not None])
+        self.assertRaises(ValueError, tree.insert, self.rectangles[0])
+        self.assertRaises(TypeError, tree.insert, Point3D(0, 0, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
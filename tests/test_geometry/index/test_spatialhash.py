@@ -0,0 +1,65 @@
+import random
+import unittest
+from itertools import combinations
+
+from fishpy.geometry import FrozenLatticePoint, Point2D, Vector2D
+from fishpy.geometry.index import SpatialHash
+from fishpy.physics import MovingObject
+
+
+class TestSpatialHash(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(6)
+        self.points = [Point2D(rng.uniform(-20, 20), rng.uniform(-20, 20)) for _ in range(200)]
+        self.grid = SpatialHash(2.5)
+        for p in self.points:
+            self.grid.insert(p)
+
+    def test_cell(self):
+        self.assertEqual(self.grid.cell(Point2D(0, 0)), FrozenLatticePoint(0, 0))
+        self.assertEqual(self.grid.cell(Point2D(-0.1, 2.5)), FrozenLatticePoint(-1, 1))
+        self.assertRaises(ValueError, SpatialHash, 0)
+
+    def test_insert_remove(self):
+        self.assertEqual(len(self.grid), 200)
+        self.assertIn(self.points[0], self.grid)
+        self.grid.remove(self.points[0])
+        self.assertNotIn(self.points[0], self.grid)
+        self.assertEqual(len(self.grid), 199)
+        self.assertRaises(KeyError, self.grid.remove, self.points[0])
+        self.grid.discard(self.points[0])
+        self.grid.clear()
+        self.assertEqual(len(self.grid), 0)
+
+    def test_query_radius(self):
+        for query in self.points[:20]:
+            expected = {id(p) for p in self.points if p.euclidean_distance(query) <= 3}
+            found = {id(p) for p in self.grid.query_radius(query, 3)}
+            self.assertSetEqual(found, expected)
+            self.assertNotIn(query, self.grid.neighbours(query, 3))
+
+    def test_candidate_pairs(self):
+        pairs = {frozenset((id(a), id(b))) for a, b in self.grid.candidate_pairs()}
+        self.assertEqual(len(pairs), len(list(self.grid.candidate_pairs())))
+        for a, b in combinations(self.points, 2):
+            if a.euclidean_distance(b) <= 2.5:
+                self.assertIn(frozenset((id(a), id(b))), pairs)
+
+    def test_moving_objects(self):
+        grid = SpatialHash(1)
+        a = MovingObject(Point2D(0.5, 0.5), Vector2D(1, 0))
+        b = MovingObject(Point2D(3.5, 0.5), Vector2D(-1, 0))
+        grid.insert(a)
+        grid.insert(b)
+        self.assertListEqual(grid.neighbours(a, 1), [])
+        self.assertListEqual(list(grid.candidate_pairs()), [])
+        a.step()
+        b.step()
+        self.assertEqual(grid.update(), 2)
+        self.assertListEqual(grid.neighbours(a, 1), [b])
+        self.assertEqual(len(list(grid.candidate_pairs())), 1)
+        self.assertFalse(grid.move(a))
+
+
+if __name__ == '__main__':
+    unittest.main()
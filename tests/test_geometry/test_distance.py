@@ -0,0 +1,66 @@
+import random
+import unittest
+from itertools import combinations
+
+import numpy as np
+
+from fishpy.geometry import LatticePoint, Point, Point3D, PointArray
+from fishpy.geometry.distance import (closest_pair, iter_pairwise_distances,
+                                      pairwise_distances)
+
+
+class TestPairwiseDistances(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(4)
+        self.points = [Point3D(rng.randint(-50, 50), rng.randint(-50, 50),
+                               rng.randint(-50, 50)) for _ in range(40)]
+
+    def test_euclidean(self):
+        matrix = pairwise_distances(self.points, block_size=7)
+        expected = [[p.euclidean_distance(q) for q in self.points] for p in self.points]
+        np.testing.assert_allclose(matrix, expected)
+
+    def test_manhattan(self):
+        others = self.points[:5]
+        matrix = pairwise_distances(PointArray.from_points(self.points), others,
+                                    metric='manhattan')
+        expected = [[p.manhattan_distance(q) for q in others] for p in self.points]
+        np.testing.assert_allclose(matrix, expected)
+
+    def test_blocks(self):
+        blocks = list(iter_pairwise_distances(self.points, block_size=16))
+        self.assertListEqual([start for start, _ in blocks], [0, 16, 32])
+        self.assertTupleEqual(blocks[-1][1].shape, (8, 40))
+
+    def test_invalid(self):
+        self.assertRaises(ValueError, pairwise_distances, self.points, metric='chebyshev')
+        self.assertRaises(ValueError, pairwise_distances, self.points, [Point(1, 2)])
+
+
+class TestClosestPair(unittest.TestCase):
+    def test_random(self):
+        rng = random.Random(7)
+        for metric in ('euclidean', 'manhattan'):
+            for size in (2, 3, 10, 200):
+                points = [LatticePoint(rng.randint(-1000, 1000), rng.randint(-1000, 1000))
+                          for _ in range(size)]
+                measure = Point.euclidean_distance if metric == 'euclidean' \
+                    else Point.manhattan_distance
+                expected = min(measure(p, q) for p, q in combinations(points, 2))
+                distance, p, q = closest_pair(points, metric)
+                self.assertAlmostEqual(distance, expected)
+                self.assertAlmostEqual(measure(p, q), expected)
+
+    def test_duplicates(self):
+        points = [Point(1, 1), Point(5, 5), Point(1, 1)]
+        self.assertEqual(closest_pair(points)[0], 0)
+
+    def test_one_dimension(self):
+        self.assertEqual(closest_pair([Point(9), Point(1), Point(4), Point(6)])[0], 2)
+
+    def test_too_few(self):
+        self.assertRaises(ValueError, closest_pair, [Point(1, 1)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,6 @@
 import unittest
 
-from fishpy.geometry import Point
+from fishpy.geometry import FrozenPoint, FrozenPoint3D, Point, Point3D
 
 
 class TestPointStaticMethods(unittest.TestCase):
@@ -22,6 +22,14 @@ class TestPointStaticMethods(unittest.TestCase):
                                      upper_bound=Point(5, 5)
                                      ).in_bounds(self.p1, Point(5, 5)))
 
+    def test_random_many(self):
+        points = Point.random_many(100, self.p1, Point(5, 5, 2), seed=3)
+        self.assertEqual(len(points), 100)
+        self.assertTrue(all(p.in_bounds(Point(1, 1, 0), Point(5, 5, 2)) for p in points))
+        self.assertListEqual(points, Point.random_many(100, self.p1, Point(5, 5, 2), seed=3))
+        self.assertIsInstance(Point3D.random_many(1, Point3D(0, 0, 0), Point3D(1, 1, 1))[0],
+                              Point3D)
+
 
 class TestPointDunderMethods(unittest.TestCase):
     def setUp(self):
@@ -146,7 +154,14 @@ class TestPointMethods(unittest.TestCase):
         self.assertEqual(self.p4.midpoint(self.p1), Point(-1, 3))
 
     def test_bounded_filter(self):
-        pass
+        points = [self.p1, self.p2, self.p3, self.p4]
+        self.assertListEqual(Point.bounded_filter(points, Point(0, 0)),
+                             [self.p1, self.p3])
+        self.assertListEqual(Point.bounded_filter(points, upper_bound=Point(1, 3)),
+                             [self.p3])
+        self.assertListEqual(Point.bounded_filter(points, Point(-5, -5), Point(5, 5)),
+                             [self.p1, self.p2, self.p3])
+        self.assertListEqual(Point.bounded_filter([FrozenPoint(1, 1)], Point(0, 5)), [])
 
     def test_in_bounds(self):
         self.assertTrue(self.p1.in_bounds(
@@ -165,5 +180,68 @@ class TestPointMethods(unittest.TestCase):
         self.assertSequenceEqual(self.p4.as_tuple(), (-3, 5))
 
 
+class TestAdjacentPoints(unittest.TestCase):
+    def test_point(self):
+        p = Point(1, 2, 3, 4)
+        adjacent = p.get_adjacent_points()
+        self.assertEqual(len(adjacent), 8)
+        self.assertIn(Point(1, 2, 3, 5), adjacent)
+        self.assertEqual(len(p.get_adjacent_points(diagonals=True)), 80)
+        bounded = p.get_adjacent_points(lower_bound=Point(1, 2, 3, 4),
+                                        upper_bound=Point(3, 3, 5, 5))
+        self.assertListEqual(bounded, [Point(2, 2, 3, 4), Point(1, 2, 4, 4)])
+        self.assertIsInstance(next(FrozenPoint(0, 0).iter_adjacent_points()), FrozenPoint)
+
+    def test_point3d(self):
+        p = Point3D(0, 0, 0)
+        for neighbours in (6, 18, 26):
+            adjacent = p.get_adjacent_points(neighbours=neighbours)
+            self.assertEqual(len(set(adjacent)), neighbours)
+            self.assertTrue(all(a.manhattan_distance(p) <= 3 for a in adjacent))
+        self.assertEqual(len(p.get_adjacent_points(diagonals=True)), 26)
+        self.assertEqual(len(p.get_adjacent_points(True, Point3D(0, 0, 0))), 7)
+        self.assertEqual(len(p.get_adjacent_points(True, Point3D(-1, -1, -1),
+                                                   Point3D(1, 1, 1))), 7)
+        self.assertRaises(ValueError, p.get_adjacent_points, neighbours=8)
+        for adj in FrozenPoint3D(0, 0, 0).iter_adjacent_points():
+            self.assertIsInstance(adj, FrozenPoint3D)
+
+
+class TestFrozenPoint(unittest.TestCase):
+    def setUp(self):
+        self.p1 = FrozenPoint(1, 1)
+        self.p2 = FrozenPoint(1, -5)
+
+    def test_slots(self):
+        self.assertFalse(hasattr(self.p1, '__dict__'))
+        self.assertFalse(hasattr(Point(1, 1), '__dict__'))
+
+    def test_immutable(self):
+        self.assertRaises(TypeError, FrozenPoint.__setitem__, self.p1, 0, 5)
+        self.assertIs(self.p1.copy(), self.p1)
+        self.assertIs(self.p1.freeze(), self.p1)
+
+    def test_arithmetic(self):
+        self.assertEqual(self.p1+self.p2, FrozenPoint(2, -4))
+        self.assertEqual(self.p1-self.p2, FrozenPoint(0, 6))
+        self.assertEqual(-self.p2, FrozenPoint(-1, 5))
+        self.assertEqual(self.p2*2, FrozenPoint(2, -10))
+        self.assertEqual(self.p2/2, FrozenPoint(0.5, -2.5))
+        self.assertEqual(abs(self.p2), FrozenPoint(1, 5))
+        self.assertIsInstance(self.p1+self.p2, FrozenPoint)
+
+    def test_interoperability(self):
+        self.assertEqual(self.p1, Point(1, 1))
+        self.assertEqual(Point(1, 1), self.p1)
+        self.assertEqual(hash(self.p1), hash(Point(1, 1)))
+        self.assertEqual(self.p1.thaw(), Point(1, 1))
+        self.assertEqual(Point(1, 1).freeze(), self.p1)
+        self.assertEqual(self.p1+Point(0, 0, 1), Point(1, 1, 1))
+
+    def test_clamp_bounds(self):
+        self.assertEqual(self.p2.clamp_bounds(Point(0, 0), Point(3, 3)),
+                         FrozenPoint(1, 0))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,134 @@
+import unittest
+
+import numpy as np
+
+from fishpy.geometry import LatticePoint, Point, Point2D, PointArray
+from fishpy.geometry.pointarray import (bounded_filter, bounded_mask,
+                                        iter_bounded_filter)
+
+
+class TestPointArrayConstruction(unittest.TestCase):
+    def setUp(self):
+        self.points = [LatticePoint(1, 1), LatticePoint(1, -5),
+                       LatticePoint(0, 2), LatticePoint(-3, 5)]
+        self.array = PointArray.from_points(self.points)
+
+    def test_from_points(self):
+        self.assertEqual(len(self.array), 4)
+        self.assertEqual(self.array.dimensions, 2)
+        self.assertIs(self.array.point_type, LatticePoint)
+        self.assertEqual(self.array.coords.tolist(),
+                         [[1, 1], [1, -5], [0, 2], [-3, 5]])
+
+    def test_mixed_dimensions(self):
+        array = PointArray.from_points([Point(1), Point(1, 2, 3)])
+        self.assertEqual(array.coords.tolist(), [[1, 0, 0], [1, 2, 3]])
+
+    def test_to_points(self):
+        self.assertListEqual(self.array.to_points(), self.points)
+        self.assertListEqual(list(self.array), self.points)
+        self.assertEqual(self.array[2], LatticePoint(0, 2))
+        self.assertIsInstance(self.array[1:], PointArray)
+        self.assertEqual(len(self.array[1:]), 3)
+
+    def test_invalid_shape(self):
+        self.assertRaises(ValueError, PointArray, [1, 2, 3])
+
+
+class TestPointArrayRandom(unittest.TestCase):
+    def test_uniform(self):
+        points = PointArray.random(1000, Point2D(-1, 0), Point2D(1, 10), seed=2)
+        self.assertTupleEqual(points.coords.shape, (1000, 2))
+        self.assertIs(points.point_type, Point2D)
+        self.assertTrue(points.in_bounds(Point2D(-1, 0), Point2D(1, 10)).all())
+        np.testing.assert_array_equal(
+            points.coords, PointArray.random(1000, Point2D(-1, 0), Point2D(1, 10), seed=2).coords)
+
+    def test_integer(self):
+        rng = np.random.default_rng(5)
+        points = PointArray.random(500, LatticePoint(0, 0), LatticePoint(4, 2), seed=rng,
+                                   integer=True)
+        self.assertTrue(np.issubdtype(points.coords.dtype, np.integer))
+        self.assertEqual(len(set(points)), 8)
+        self.assertIsInstance(points[0], LatticePoint)
+
+
+class TestPointArrayMethods(unittest.TestCase):
+    def setUp(self):
+        self.points = [Point2D(1, 1), Point2D(1, -5), Point2D(0, 2), Point2D(-3, 5)]
+        self.array = PointArray.from_points(self.points)
+        self.other = Point2D(2, -1)
+
+    def test_arithmetic(self):
+        self.assertListEqual((self.array+self.other).to_points(),
+                             [p+self.other for p in self.points])
+        self.assertListEqual((self.array-self.array).coords.tolist(), [[0, 0]]*4)
+        self.assertListEqual((self.array*2).to_points(), [p*2 for p in self.points])
+        self.assertListEqual((-self.array).to_points(), [-p for p in self.points])
+
+    def test_distances(self):
+        np.testing.assert_allclose(self.array.manhattan_distance(self.other),
+                                   [p.manhattan_distance(self.other) for p in self.points])
+        np.testing.assert_allclose(self.array.euclidean_distance(self.other),
+                                   [p.euclidean_distance(self.other) for p in self.points])
+        np.testing.assert_allclose(self.array.magnitude(),
+                                   [p.magnitude() for p in self.points])
+
+    def test_midpoint(self):
+        self.assertListEqual(self.array.midpoint(self.other).to_points(),
+                             [p.midpoint(self.other) for p in self.points])
+
+    def test_bounds(self):
+        lower, upper = Point2D(0, -5), Point2D(2, 5)
+        self.assertListEqual(self.array.in_bounds(lower, upper).tolist(),
+                             [p.in_bounds(lower, upper) for p in self.points])
+        self.assertListEqual(self.array.clamp_bounds(lower, upper).to_points(),
+                             [p.clamp_bounds(lower, upper) for p in self.points])
+
+
+class TestBoundedFilter(unittest.TestCase):
+    def setUp(self):
+        self.points = [LatticePoint(x, y) for x in range(-3, 4) for y in range(-3, 4)]
+        self.lower, self.upper = LatticePoint(-1, 0), LatticePoint(2, 3)
+        self.expected = Point.bounded_filter(self.points, self.lower, self.upper)
+
+    def test_bounded_mask(self):
+        mask = bounded_mask(self.points, self.lower, self.upper)
+        self.assertEqual(mask.tolist(),
+                         [p.in_bounds(self.lower, self.upper) for p in self.points])
+        self.assertTrue(bounded_mask(self.points).all())
+
+    def test_bounded_filter(self):
+        self.assertListEqual(bounded_filter(self.points, self.lower, self.upper),
+                             self.expected)
+        self.assertListEqual(bounded_filter(self.points, upper_bound=self.upper),
+                             Point.bounded_filter(self.points, upper_bound=self.upper))
+        array = bounded_filter(PointArray.from_points(self.points), self.lower, self.upper)
+        self.assertIsInstance(array, PointArray)
+        self.assertListEqual(array.to_points(), self.expected)
+
+    def test_empty(self):
+        self.assertListEqual(bounded_filter([], Point2D(0, 0), Point2D(3, 3)), [])
+        self.assertEqual(bounded_mask([], Point2D(0, 0), Point2D(3, 3)).shape, (0,))
+        self.assertListEqual(list(iter_bounded_filter([], Point2D(0, 0), Point2D(3, 3))), [])
+
+    def test_lower_dimension_points(self):
+        points = [Point(1), Point(-1), Point(2, 1), Point(2, 5)]
+        for lower, upper in ((Point(0, 0, 0), Point(3, 3, 3)), (Point(0, 0, 1), Point(3, 3, 3)),
+                             (Point(0, 0), None), (None, Point(3, 3, 1))):
+            expected = Point.bounded_filter(points, lower, upper)
+            self.assertListEqual(bounded_filter(points, lower, upper), expected)
+            self.assertListEqual(
+                PointArray.from_points(points).bounded_filter(lower, upper).to_points(),
+                [Point(*pt.as_tuple(), *(0,)*(2-pt.dimensions)) for pt in expected])
+
+    def test_iter_bounded_filter(self):
+        filtered = iter_bounded_filter(iter(self.points), self.lower, self.upper,
+                                       chunk_size=5)
+        self.assertListEqual(list(filtered), self.expected)
+        self.assertRaises(ValueError, list,
+                          iter_bounded_filter(self.points, chunk_size=0))
+
+
+if __name__ == '__main__':
+    unittest.main()
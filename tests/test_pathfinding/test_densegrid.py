@@ -0,0 +1,103 @@
+import unittest
+
+import numpy as np
+
+from fishpy.geometry import LatticePoint
+from fishpy.pathfinding import Location
+from fishpy.pathfinding.grid import DenseGrid, Grid
+
+ROWS = [
+    '#########',
+    '#..a#...#',
+    '#.#.#.#b#',
+    '#.#..a#.#',
+    '#########',
+]
+
+
+class TestDenseGrid(unittest.TestCase):
+    def setUp(self):
+        self.grid = Grid.from_list_of_strings(ROWS)
+        self.dense = DenseGrid.from_list_of_strings(ROWS)
+
+    def test_storage(self):
+        self.assertEqual(self.dense.chars.dtype, np.uint8)
+        self.assertEqual(self.dense.walls.dtype, bool)
+        self.assertEqual(self.dense.size, LatticePoint(9, 5))
+        self.assertEqual(DenseGrid.from_grid(self.grid), self.dense)
+        self.assertEqual(self.dense.to_grid(), self.grid)
+        self.assertRaises(ValueError, DenseGrid.from_list_of_strings, ['...', '..'])
+
+    def test_getitem(self):
+        for loc in self.grid:
+            self.assertEqual(self.dense[loc], loc)
+            self.assertEqual(self.dense.is_passible(loc), loc.is_passible())
+        self.assertIsInstance(self.dense[LatticePoint(1, 1)], Location)
+        self.assertRaises(KeyError, self.dense.__getitem__, LatticePoint(9, 0))
+        self.assertListEqual(list(self.dense), list(self.grid))
+
+    def test_setitem(self):
+        self.dense[LatticePoint(1, 1)] = Location(1, 1, Location.IMPASSABLE, '#')
+        self.assertFalse(self.dense.is_passible(LatticePoint(1, 1)))
+        self.dense[LatticePoint(1, 1)] = 'x'
+        self.assertEqual(self.dense[LatticePoint(1, 1)].rep, 'x')
+        self.assertFalse(self.dense[LatticePoint(1, 1)].is_passible())
+
+    def test_contains(self):
+        self.assertIn(LatticePoint(8, 4), self.dense)
+        self.assertNotIn(LatticePoint(9, 4), self.dense)
+        self.assertNotIn(LatticePoint(-1, 0), self.dense)
+
+    def test_char_positions(self):
+        self.assertDictEqual(self.dense.char_positions('ab'), self.grid.char_positions('ab'))
+
+    def test_to_string(self):
+        self.assertEqual(self.dense.to_string(), self.grid.to_string())
+        self.assertEqual(self.dense.to_string(''), '\n'.join(ROWS))
+
+    def test_subgrid(self):
+        lower, upper = LatticePoint(1, 1), LatticePoint(5, 4)
+        sub = self.dense.subgrid(lower, upper)
+        self.assertEqual(sub.to_string(), self.grid.subgrid(lower, upper).to_string())
+        self.assertEqual(sub.offset, lower)
+        self.assertEqual(sub[LatticePoint(3, 1)].rep, 'a')
+        sub[LatticePoint(3, 1)] = 'z'
+        self.assertEqual(self.dense[LatticePoint(3, 1)].rep, 'a')
+        self.assertEqual(self.dense[lower:upper].offset, lower)
+        view = self.dense.subgrid(lower, upper, reference=True)
+        view[LatticePoint(3, 1)] = 'z'
+        self.assertEqual(self.dense[LatticePoint(3, 1)].rep, 'z')
+
+    def test_flood_fill(self):
+        start = LatticePoint(1, 1)
+        expected = self.grid.flood_fill(self.grid[start], lambda loc: not loc.is_passible())
+        self.assertSetEqual(self.dense.flood_fill(start), expected)
+        self.assertSetEqual(self.dense.flood_fill(start, lambda loc: loc.rep != '.'),
+                            self.grid.flood_fill(self.grid[start], lambda loc: loc.rep != '.'))
+        mask = self.dense.flood_fill_mask(start)
+        self.assertEqual(mask.sum(), len(expected))
+        self.assertTrue(all(mask[loc.y, loc.x] for loc in expected))
+        self.assertFalse(self.dense.flood_fill_mask(LatticePoint(0, 0)).any())
+
+    def test_flood_fill_open_areas(self):
+        rows = ['.....#....', '.###.#.##.', '.#...#..#.', '.#.####.#.', '...#......']
+        dense, grid = DenseGrid.from_list_of_strings(rows), Grid.from_list_of_strings(rows)
+        for start in (LatticePoint(0, 0), LatticePoint(2, 2), LatticePoint(9, 0)):
+            self.assertSetEqual(dense.flood_fill(start),
+                                grid.flood_fill(grid[start], lambda loc: not loc.is_passible()))
+
+    def test_offset(self):
+        dense = DenseGrid.from_list_of_strings(ROWS, offset=LatticePoint(-3, 2))
+        grid = Grid.from_list_of_strings(ROWS, offset=LatticePoint(-3, 2))
+        for loc in grid:
+            self.assertEqual(dense[loc], loc)
+            self.assertEqual(dense.key(loc), grid.key(loc))
+        self.assertEqual(dense.point(11), grid.point(11))
+        self.assertDictEqual(dense.char_positions('b'), grid.char_positions('b'))
+        start = LatticePoint(-2, 3)
+        self.assertSetEqual(dense.flood_fill(start),
+                            grid.flood_fill(grid[start], lambda loc: not loc.is_passible()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,248 @@
+import os
+import tempfile
+import unittest
+
+from fishpy.geometry import FrozenLatticePoint, LatticePoint, Point3D, Vector2D
+from fishpy.pathfinding import Location, Location3D, dijkstra
+from fishpy.pathfinding.grid import DenseGrid, ExpandableGrid, Grid, Grid3D
+
+ROWS = [
+    '#########',
+    '#...#...#',
+    '#.#.#.#.#',
+    '#.#...#.#',
+    '#########',
+]
+
+
+class TestGridKeys(unittest.TestCase):
+    def setUp(self):
+        self.grid = Grid.from_list_of_strings(ROWS, offset=LatticePoint(-3, 2))
+
+    def test_key(self):
+        self.assertEqual(self.grid.key(LatticePoint(-3, 2)), 0)
+        self.assertEqual(self.grid.key(LatticePoint(-1, 3)), 11)
+        self.assertRaises(KeyError, self.grid.key, LatticePoint(6, 2))
+        self.assertRaises(KeyError, self.grid.key, LatticePoint(-4, 2))
+
+    def test_point(self):
+        for loc in self.grid:
+            pt = self.grid.point(self.grid.key(loc))
+            self.assertIsInstance(pt, FrozenLatticePoint)
+            self.assertEqual(pt, LatticePoint(loc.x, loc.y))
+        self.assertIs(self.grid.point(4), self.grid.point(4))
+        self.assertRaises(KeyError, self.grid.point, 45)
+
+    def test_flood_fill(self):
+        filled = self.grid.flood_fill(self.grid[LatticePoint(-2, 3)],
+                                      lambda loc: not loc.is_passible())
+        self.assertEqual(len(filled), 15)
+        self.assertTrue(all(loc.rep == '.' for loc in filled))
+
+    def test_dijkstra_key_function(self):
+        def adjacent(pt):
+            return [adj for adj in pt.get_adjacent_points(lower_bound=self.grid.bounds[0],
+                                                          upper_bound=self.grid.bounds[1])
+                    if self.grid[adj].is_passible()]
+
+        start, target = LatticePoint(-2, 3), LatticePoint(4, 5)
+        expected = dijkstra(start, target, adjacent)
+        actual = dijkstra(start, target, adjacent, key_function=self.grid.key)
+        self.assertEqual(actual[0], 12)
+        self.assertEqual(actual, expected)
+
+
+class TestGridDraw(unittest.TestCase):
+    def test_draw_line(self):
+        grid = Grid.blank(LatticePoint(5, 4))
+        grid.draw_line('#', LatticePoint(0, 0), LatticePoint(6, 3))
+        self.assertEqual(grid.to_string(''), '##...\n..##.\n....#\n.....')
+        grid.draw_line('*', LatticePoint(2, 3), LatticePoint(2, 3))
+        self.assertEqual(grid[LatticePoint(2, 3)].rep, '*')
+
+
+class TestGridLoading(unittest.TestCase):
+    def test_from_list_of_strings(self):
+        grid = Grid.from_list_of_strings(ROWS, offset=LatticePoint(-3, 2))
+        self.assertEqual(grid.size, LatticePoint(9, 5))
+        for y, row in enumerate(ROWS):
+            for x, char in enumerate(row):
+                loc = grid[LatticePoint(x-3, y+2)]
+                self.assertIsInstance(loc, Location)
+                self.assertEqual(loc, Location(x-3, y+2, Location.IMPASSABLE if char == '#'
+                                               else Location.OPEN, char))
+        self.assertEqual(grid.to_string(''), '\n'.join(ROWS))
+        self.assertIsInstance(ExpandableGrid.from_list_of_strings(ROWS), ExpandableGrid)
+        self.assertRaises(ValueError, Grid.from_list_of_strings, ['...', '..'])
+
+    def test_from_bytes(self):
+        data = '\r\n'.join(ROWS).encode() + b'\n'
+        self.assertEqual(Grid.from_bytes(data), Grid.from_list_of_strings(ROWS))
+        self.assertEqual(DenseGrid.from_bytes(data), DenseGrid.from_list_of_strings(ROWS))
+        view = memoryview(b'xx' + '\r'.join(ROWS).encode())[2:]
+        self.assertEqual(Grid.from_bytes(view), Grid.from_list_of_strings(ROWS))
+        self.assertEqual(DenseGrid.from_bytes(view), DenseGrid.from_list_of_strings(ROWS))
+        self.assertEqual(Grid.from_bytes(b'\n\n').size, LatticePoint(0, 2))
+        self.assertEqual(DenseGrid.from_bytes(b'\n\n').size, LatticePoint(0, 2))
+        self.assertRaises(ValueError, Grid.from_bytes, b'...\n..')
+        self.assertRaises(ValueError, DenseGrid.from_bytes, b'...\n..')
+
+    def test_from_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'map.txt')
+            with open(path, 'w', encoding='utf-8') as file:
+                file.write('\n'.join(ROWS) + '\n')
+            self.assertEqual(Grid.from_file(path), Grid.from_list_of_strings(ROWS))
+            self.assertEqual(DenseGrid.from_file(path, offset=LatticePoint(1, 1)),
+                             DenseGrid.from_list_of_strings(ROWS, offset=LatticePoint(1, 1)))
+            empty = os.path.join(directory, 'empty.txt')
+            open(empty, 'w', encoding='utf-8').close()
+            self.assertEqual(Grid.from_file(empty).size, LatticePoint(0, 0))
+            self.assertEqual(DenseGrid.from_file(empty).size, LatticePoint(0, 0))
+
+
+class TestCopyOnWrite(unittest.TestCase):
+    def setUp(self):
+        self.base = ExpandableGrid.from_list_of_strings(ROWS, offset=LatticePoint(2, 1))
+        self.text = self.base.to_string('')
+
+    def test_copy_shares_rows(self):
+        copy = self.base.copy(copy_on_write=True)
+        self.assertEqual(copy, self.base)
+        self.assertIsNot(copy.offset, self.base.offset)
+        self.assertTrue(all(a is b for a, b in zip(copy.grid, self.base.grid)))
+
+        copy[LatticePoint(3, 2)] = Location(3, 2, Location.IMPASSABLE, 'x')
+        copy.draw('y', LatticePoint(2, 4), Vector2D(1, 0), 2)
+        self.assertEqual(self.base.to_string(''), self.text)
+        self.assertIsNot(copy.grid[1], self.base.grid[1])
+        self.assertIs(copy.grid[2], self.base.grid[2])
+        self.assertEqual(copy.to_string('').splitlines()[1], '#x..#...#')
+        self.assertEqual(copy.to_string('').splitlines()[3], 'yyy...#.#')
+
+    def test_source_writes(self):
+        copy = self.base.copy(copy_on_write=True)
+        self.base[LatticePoint(3, 2)].rep = 'z'
+        self.base.shift(Vector2D(1, 1))
+        self.assertEqual(copy.to_string(''), self.text)
+        self.assertEqual(copy.offset, LatticePoint(2, 1))
+        self.assertEqual(copy[LatticePoint(3, 2)].rep, '.')
+
+    def test_flood_fill_isolated(self):
+        copy = self.base.copy(copy_on_write=True)
+        filled = copy.flood_fill(copy.grid[1][1], lambda loc: not loc.is_passible())
+        for loc in filled:
+            loc.rep = 'x'
+        self.assertEqual(self.base.to_string(''), self.text)
+        self.assertEqual(copy.to_string(''), self.text.replace('.', 'x'))
+
+    def test_locations_fetched_before_copy(self):
+        pt = LatticePoint(3, 2)
+        held = self.base[pt]
+        filled = self.base.flood_fill(self.base[LatticePoint(7, 2)],
+                                      lambda loc: not loc.is_passible())
+        copy = self.base.copy(copy_on_write=True)
+        held.rep = 'Z'
+        for loc in filled:
+            loc.rep = 'x'
+        self.assertEqual(copy[pt].rep, '.')
+        self.assertEqual(copy.to_string(''), self.text)
+        self.assertIs(copy.grid[0], self.base.grid[0])
+        self.assertIsNot(copy.grid[1], self.base.grid[1])
+
+    def test_expand(self):
+        copy = self.base.copy(copy_on_write=True)
+        copy.expand_left(1, 'x')
+        copy.expand_up(1, 'x')
+        copy[LatticePoint(3, 2)].rep = 'z'
+        self.assertEqual(self.base.to_string(''), self.text)
+        self.assertEqual(self.base.offset, LatticePoint(2, 1))
+        self.assertEqual(copy.size, LatticePoint(10, 6))
+
+    def test_conditional_walls(self):
+        def predicate(pt):
+            return pt.y == 3 and pt.x == 4
+
+        expected = self.base.conditional_walls(predicate, '@')
+        walled = self.base.conditional_walls(predicate, '@', copy_on_write=True)
+        self.assertEqual(walled.to_string(), expected.to_string())
+        self.assertFalse(walled[LatticePoint(4, 3)].is_passible())
+        self.assertEqual(self.base.to_string(''), self.text)
+        shared = sum(a is b for a, b in zip(walled.grid, self.base.grid))
+        self.assertEqual(shared, 4)
+
+    def test_overlay_and_index(self):
+        self.base.build_char_index()
+        other = Grid.blank(LatticePoint(2, 1), LatticePoint(3, 2))
+        other.draw('o', LatticePoint(3, 2), Vector2D(1, 0), 1)
+        overlaid = self.base.overlay(other, copy_on_write=True)
+        self.assertEqual(overlaid.to_string(''), self.base.overlay(other).to_string(''))
+        self.assertEqual(self.base.to_string(''), self.text)
+        self.assertListEqual(overlaid.char_positions('o')['o'],
+                             [LatticePoint(3, 2), LatticePoint(4, 2)])
+        self.assertListEqual(self.base.char_positions('o')['o'], [])
+
+
+class TestCharIndex(unittest.TestCase):
+    def setUp(self):
+        self.rows = ['#a..#', '.b#a.', 'a...b']
+        self.grid = ExpandableGrid.from_list_of_strings(self.rows, offset=LatticePoint(1, -1))
+        self.indexed = self.grid.copy()
+        self.indexed.build_char_index()
+
+    def assertIndexMatches(self, grid):
+        chars = '#.abxyz*'
+        unindexed = grid.copy()
+        unindexed.drop_char_index()
+        self.assertDictEqual(grid.char_positions(chars), unindexed.char_positions(chars))
+
+    def test_lookup(self):
+        self.assertTrue(self.indexed.char_indexed)
+        self.assertFalse(self.grid.char_indexed)
+        self.assertDictEqual(self.indexed.char_positions('ab#'), self.grid.char_positions('ab#'))
+        self.assertListEqual(self.indexed.char_positions('b')['b'],
+                             [LatticePoint(2, 0), LatticePoint(5, 1)])
+        self.assertListEqual(self.indexed.char_positions('q')['q'], [])
+
+    def test_maintenance(self):
+        grid = self.indexed
+        grid[LatticePoint(2, -1)] = Location(2, -1, Location.OPEN, 'x')
+        grid.draw('y', LatticePoint(1, 0), Vector2D(1, 0), 2)
+        grid.draw_line('z', LatticePoint(1, -1), LatticePoint(5, 1))
+        grid.draw_search([LatticePoint(3, 1)], explored={LatticePoint(4, 1)}, explored_char='x')
+        self.assertIndexMatches(grid)
+        self.assertListEqual(grid.char_positions('x')['x'], [LatticePoint(4, 1)])
+        walled = grid.conditional_walls(lambda pt: pt.x == 1, '#')
+        self.assertTrue(walled.char_indexed)
+        self.assertIndexMatches(walled)
+        self.assertIndexMatches(grid.overlay(self.grid))
+
+    def test_reshaping(self):
+        grid = self.indexed
+        grid.shift(Vector2D(2, 3))
+        self.assertIndexMatches(grid)
+        grid.expand_all(1, 'x')
+        self.assertIndexMatches(grid)
+        grid.mirror_x()
+        self.assertIndexMatches(grid)
+
+    def test_grid3d(self):
+        layers = [['#a.', '.b.'], ['a..', '..a']]
+        grid = Grid3D.from_list_of_list_of_strings(layers)
+        expected = grid.char_positions('ab')
+        self.assertListEqual(expected['a'], [Point3D(1, 0, 0), Point3D(0, 0, 1), Point3D(2, 1, 1)])
+        grid.build_char_index()
+        self.assertDictEqual(grid.char_positions('ab'), expected)
+        grid[Point3D(1, 1, 0)] = Location3D(1, 1, 0, Location3D.OPEN, 'a')
+        self.assertEqual(grid[Point3D(1, 1, 0)].rep, 'a')
+        self.assertListEqual(grid.char_positions('ab')['b'], [])
+        self.assertListEqual(grid.char_positions('a')['a'], [Point3D(1, 0, 0), Point3D(1, 1, 0),
+                                                             Point3D(0, 0, 1), Point3D(2, 1, 1)])
+        copied = grid.copy()
+        self.assertTrue(copied.char_indexed)
+        copied.drop_char_index()
+        self.assertDictEqual(copied.char_positions('ab'), grid.char_positions('ab'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+import unittest
+
+from fishpy.geometry import LatticePoint
+from fishpy.pathfinding import Location
+from fishpy.pathfinding.grid import ExpandableGrid, Grid, GridView
+
+ROWS = [
+    '#########',
+    '#...#.a.#',
+    '#.#.#.#.#',
+    '#a#...#.#',
+    '#########',
+]
+
+
+class TestGridView(unittest.TestCase):
+    def setUp(self):
+        self.grid = Grid.from_list_of_strings(ROWS, offset=LatticePoint(-3, 2))
+        self.view = self.grid[LatticePoint(-2, 3):LatticePoint(3, 6)]
+
+    def test_bounds(self):
+        self.assertIsInstance(self.view, GridView)
+        self.assertIs(self.view.parent, self.grid)
+        self.assertEqual(self.view.offset, LatticePoint(-2, 3))
+        self.assertEqual(self.view.size, LatticePoint(5, 3))
+        self.assertEqual(len(self.view), 15)
+        self.assertIn(LatticePoint(2, 5), self.view)
+        self.assertNotIn(LatticePoint(3, 5), self.view)
+        self.assertNotIn(LatticePoint(-3, 3), self.view)
+
+        clipped = self.grid[LatticePoint(3, 0):LatticePoint(20, 4)]
+        self.assertEqual(clipped.bounds, (LatticePoint(3, 2), LatticePoint(6, 4)))
+        self.assertEqual(self.grid[:].size, self.grid.size)
+
+    def test_reads_share_locations(self):
+        pt = LatticePoint(-1, 3)
+        self.assertIs(self.view[pt], self.grid[pt])
+        self.assertListEqual([loc for loc in self.view],
+                             [self.grid[LatticePoint(x, y)]
+                              for y in range(3, 6) for x in range(-2, 3)])
+        self.assertEqual(self.view.to_string(''), '...#.\n.#.#.\na#...')
+        self.assertRaises(KeyError, self.view.__getitem__, LatticePoint(-3, 3))
+        self.assertRaises(TypeError, self.view.__getitem__, 4)
+        self.assertRaises(NotImplementedError, self.view.__getitem__,
+                          slice(LatticePoint(-2, 3), LatticePoint(3, 6), 2))
+
+    def test_writes_through(self):
+        pt = LatticePoint(0, 4)
+        self.view[pt] = Location(0, 4, Location.IMPASSABLE, 'x')
+        self.assertEqual(self.grid[pt].rep, 'x')
+        self.view[pt].rep = 'y'
+        self.assertEqual(self.grid[pt].rep, 'y')
+        self.assertRaises(KeyError, self.view.__setitem__, LatticePoint(-3, 2),
+                          Location(-3, 2, Location.OPEN, '.'))
+
+    def test_nested(self):
+        inner = self.view[LatticePoint(0, 4):LatticePoint(10, 10)]
+        self.assertIs(inner.parent, self.grid)
+        self.assertEqual(inner.bounds, (LatticePoint(0, 4), LatticePoint(3, 6)))
+        self.assertEqual(inner.to_string(''), '.#.\n...')
+        self.assertEqual(self.view[:LatticePoint(0, 4)].size, LatticePoint(2, 1))
+        self.assertRaises(ValueError, self.view.view, LatticePoint(1, 4), LatticePoint(0, 5))
+
+    def test_materialize(self):
+        copy = self.view.materialize()
+        self.assertIsInstance(copy, Grid)
+        self.assertEqual(copy.offset, self.view.offset)
+        self.assertEqual(copy.to_string(), self.view.to_string())
+        self.assertEqual(self.view, copy)
+        self.assertEqual(copy, self.view)
+        copy[LatticePoint(-2, 3)].rep = 'z'
+        self.assertEqual(self.grid[LatticePoint(-2, 3)].rep, '.')
+
+    def test_char_positions(self):
+        expected = {'a': [LatticePoint(-2, 5), LatticePoint(2, 3)], 'q': []}
+        self.view[LatticePoint(2, 3)] = Location(2, 3, Location.OPEN, 'a')
+        self.assertDictEqual(self.view.char_positions('aq'), expected)
+        self.grid.build_char_index()
+        self.assertDictEqual(self.view.char_positions('aq'), expected)
+
+    def test_parent_expanded(self):
+        grid = ExpandableGrid.from_list_of_strings(ROWS)
+        view = grid[LatticePoint(1, 1):LatticePoint(4, 3)]
+        before = view.to_string()
+        grid.expand_left(2)
+        grid.expand_up(1)
+        self.assertEqual(view.to_string(), before)
+        self.assertEqual(view.offset, LatticePoint(1, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()